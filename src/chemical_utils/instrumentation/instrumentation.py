@@ -0,0 +1,230 @@
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar, cast
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from math import inf
+
+# Upper bounds (in seconds) of the histogram buckets of instrumented calls. The last
+# bucket of each histogram counts the calls that took longer than the last bound.
+HISTOGRAM_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass
+class Metric:
+    """
+    Aggregated counters and latency histogram of an instrumented call or event.
+
+    Events that are only counted (e.g. registry misses) have zero timings.
+    """
+
+    name: str
+    count: int = 0
+    total_time: float = 0.0
+    min_time: float = inf
+    max_time: float = 0.0
+    histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    )
+
+    @property
+    def mean_time(self) -> float:
+        """
+        Mean duration of the recorded calls in seconds.
+        """
+        return self.total_time / self.count if self.count > 0 else 0.0
+
+    def copy(self) -> "Metric":
+        """
+        Create an independent copy of this metric.
+        """
+        return replace(self, histogram=list(self.histogram))
+
+    def _add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        self.min_time = min(self.min_time, elapsed)
+        self.max_time = max(self.max_time, elapsed)
+        for index, bound in enumerate(HISTOGRAM_BUCKETS):
+            if elapsed <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+
+class MetricsRecorder:
+    """
+    Collects the metrics of instrumented calls.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    @property
+    def metrics(self) -> Dict[str, Metric]:
+        """
+        Snapshot of the metrics recorded so far, keyed by name.
+        """
+        with _lock:
+            return {name: metric.copy() for name, metric in self._metrics.items()}
+
+    def reset(self) -> None:
+        """
+        Discard all recorded metrics.
+        """
+        with _lock:
+            self._metrics.clear()
+
+    def _record(self, name: str, elapsed: Optional[float]) -> None:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Metric(name)
+
+        if elapsed is None:
+            metric.count += 1
+        else:
+            metric._add(elapsed)  # pylint: disable=protected-access
+
+
+def instrumented(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorate a function so that its' calls are counted and timed while
+    instrumentation is enabled. The metric name defaults to the function's qualified
+    name.
+
+    When instrumentation is disabled the only overhead is a flag check.
+    """
+
+    def decorator(func: F) -> F:
+        metric_name = func.__qualname__ if name is None else name
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(metric_name, perf_counter() - start)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def count_event(name: str) -> None:
+    """
+    Count an occurence of an event, e.g. a registry miss, if instrumentation is
+    enabled.
+    """
+    if _enabled:
+        _record(name, None)
+
+
+def enable_instrumentation() -> None:
+    """
+    Start recording the metrics of instrumented calls.
+    """
+    global _explicitly_enabled  # pylint: disable=global-statement
+    with _lock:
+        _explicitly_enabled = True
+        _update_enabled()
+
+
+def disable_instrumentation() -> None:
+    """
+    Stop recording the metrics of instrumented calls. Calls inside `instrumentation`
+    blocks are still recorded until the blocks exit.
+    """
+    global _explicitly_enabled  # pylint: disable=global-statement
+    with _lock:
+        _explicitly_enabled = False
+        _update_enabled()
+
+
+def is_instrumentation_enabled() -> bool:
+    """
+    Returns True if the metrics of instrumented calls are being recorded; i.e. if
+    instrumentation was enabled or an `instrumentation` block is active in any
+    thread.
+    """
+    return _enabled
+
+
+def get_metrics() -> Dict[str, Metric]:
+    """
+    Get a snapshot of all metrics recorded since the last reset, keyed by name.
+    """
+    return _global_recorder.metrics
+
+
+def reset_metrics() -> None:
+    """
+    Discard all metrics recorded so far.
+    """
+    _global_recorder.reset()
+
+
+@contextmanager
+def instrumentation() -> Iterator[MetricsRecorder]:
+    """
+    Enable instrumentation inside a with-block. The yielded recorder collects only
+    the metrics of calls made (in any thread) while the block is active; they are
+    also added to the global metrics.
+
+    Blocks may be nested or active in many threads at once; instrumentation stays
+    enabled until the last of them exits, unless it was enabled explicitly (see
+    `enable_instrumentation`).
+
+    Examples:
+        >>> from chemical_utils.substances import METHANE
+        >>> with instrumentation() as recorder:
+        ...     _ = METHANE.standard_formation_properties
+        >>> recorder.metrics["registry.get_standard_formation_properties"].count
+        1
+    """
+    recorder = MetricsRecorder()
+
+    with _lock:
+        _recorders.append(recorder)
+        _update_enabled()
+
+    try:
+        yield recorder
+    finally:
+        with _lock:
+            _recorders.remove(recorder)
+            _update_enabled()
+
+
+def _update_enabled() -> None:
+    """
+    Derive the enabled flag, which instrumented calls check without locking, from
+    the explicit state and the recorders of active blocks; call with the lock held.
+    """
+    global _enabled  # pylint: disable=global-statement
+    _enabled = _explicitly_enabled or len(_recorders) > 1
+
+
+def _record(name: str, elapsed: Optional[float]) -> None:
+    with _lock:
+        for recorder in _recorders:
+            recorder._record(name, elapsed)  # pylint: disable=protected-access
+
+
+_enabled = False  # pylint: disable=invalid-name
+
+_explicitly_enabled = False  # pylint: disable=invalid-name
+
+_lock = Lock()
+
+_global_recorder = MetricsRecorder()
+
+# the global recorder followed by the recorders of active instrumentation blocks.
+_recorders: List[MetricsRecorder] = [_global_recorder]
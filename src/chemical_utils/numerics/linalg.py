@@ -0,0 +1,433 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Mapping, Sequence, Tuple
+from fractions import Fraction
+from heapq import heapify, heappop, heappush
+from math import sqrt
+
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+# pivots of sparse LU decompositions must be larger than this fraction of the
+# largest entry of their row.
+_PIVOT_TOLERANCE = 1e-10
+
+
+@dataclass(frozen=True)
+class CSRMatrix:
+    """
+    Sparse matrix in compressed sparse row format.
+
+    The non-zero values of row `i` are `data[indptr[i]:indptr[i + 1]]` and their
+    column indices `indices[indptr[i]:indptr[i + 1]]`.
+    """
+
+    shape: Tuple[int, int]
+    indptr: Tuple[int, ...]
+    indices: Tuple[int, ...]
+    data: Tuple[float, ...]
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Mapping[int, float]], n_columns: int
+    ) -> "CSRMatrix":
+        """
+        Create a matrix from rows given as mappings of column index to value.
+
+        Raises `ChemicalUtilsValueError` if a column index is out of range.
+
+        Examples:
+            >>> CSRMatrix.from_rows([{0: 1.0}, {1: 2.0, 0: 3.0}], 2).to_dense()
+            [[1.0, 0.0], [3.0, 2.0]]
+        """
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+
+        for row in rows:
+            for column in sorted(row):
+                if not 0 <= column < n_columns:
+                    raise ChemicalUtilsValueError(
+                        f"invalid column index: {column}; expected an index in "
+                        f"[0, {n_columns}). "
+                    )
+                value = float(row[column])
+                if value:
+                    indices.append(column)
+                    data.append(value)
+            indptr.append(len(indices))
+
+        return cls(
+            (len(indptr) - 1, n_columns), tuple(indptr), tuple(indices), tuple(data)
+        )
+
+    def row(self, i: int) -> Mapping[int, float]:
+        """
+        Get the non-zero values of a row keyed by column index.
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return dict(zip(self.indices[start:end], self.data[start:end]))
+
+    def matvec(self, x: Sequence[float]) -> List[float]:
+        """
+        Multiply the matrix with a vector.
+        """
+        indices, data = self.indices, self.data
+        return [
+            sum(data[k] * x[indices[k]] for k in range(start, end))
+            for start, end in zip(self.indptr, self.indptr[1:])
+        ]
+
+    def rmatvec(self, y: Sequence[float]) -> List[float]:
+        """
+        Multiply the transpose of the matrix with a vector.
+        """
+        result = [0.0] * self.shape[1]
+        indices, data = self.indices, self.data
+        for i, (start, end) in enumerate(zip(self.indptr, self.indptr[1:])):
+            y_i = y[i]
+            if y_i:
+                for k in range(start, end):
+                    result[indices[k]] += data[k] * y_i
+        return result
+
+    def to_dense(self) -> List[List[float]]:
+        """
+        Create a dense list-of-rows copy of the matrix.
+        """
+        dense = [[0.0] * self.shape[1] for _ in range(self.shape[0])]
+        for i, (start, end) in enumerate(zip(self.indptr, self.indptr[1:])):
+            for k in range(start, end):
+                dense[i][self.indices[k]] = self.data[k]
+        return dense
+
+
+def sparse_least_squares(  # pylint: disable=too-many-locals
+    matrix: CSRMatrix,
+    rhs: Sequence[float],
+    tolerance: float = 1e-12,
+    max_iterations: int = 0,
+) -> List[float]:
+    """
+    Solve the linear least squares problem min ||A x - b|| with the conjugate gradient
+    method on the normal equations (CGLS). Only matrix-vector products with A and its'
+    transpose are used, so the cost per iteration is proportional to the number of
+    non-zero values.
+
+    For rank deficient systems the minimum norm solution is approached. The iteration
+    stops when the norm of the normal equations residual falls below `tolerance`
+    relative to its' initial value, or after `max_iterations` (defaults to ten times
+    the number of columns).
+
+    Raises `ChemicalUtilsValueError` if the length of `rhs` does not match the number
+    of rows.
+
+    Examples:
+        >>> A = CSRMatrix.from_rows([{0: 1.0}, {1: 1.0}, {0: 1.0, 1: 1.0}], 2)
+        >>> [round(v, 6) for v in sparse_least_squares(A, [1.0, 2.0, 3.0])]
+        [1.0, 2.0]
+    """
+    n_rows, n_columns = matrix.shape
+    if len(rhs) != n_rows:
+        raise ChemicalUtilsValueError(
+            f"cannot solve least squares problem; expected {n_rows} right hand side "
+            f"values, got {len(rhs)}. "
+        )
+    if max_iterations <= 0:
+        max_iterations = 10 * max(n_columns, 1)
+
+    x = [0.0] * n_columns
+    r = [float(v) for v in rhs]
+    s = matrix.rmatvec(r)
+    p = list(s)
+    gamma = _dot(s, s)
+    threshold = tolerance * sqrt(gamma)
+
+    for _ in range(max_iterations):
+        if sqrt(gamma) <= threshold or gamma == 0:
+            break
+
+        q = matrix.matvec(p)
+        delta = _dot(q, q)
+        if delta == 0:
+            break
+
+        alpha = gamma / delta
+        x = [x_j + alpha * p_j for x_j, p_j in zip(x, p)]
+        r = [r_i - alpha * q_i for r_i, q_i in zip(r, q)]
+
+        s = matrix.rmatvec(r)
+        gamma_next = _dot(s, s)
+        beta = gamma_next / gamma
+        p = [s_j + beta * p_j for s_j, p_j in zip(s, p)]
+        gamma = gamma_next
+
+    return x
+
+
+@dataclass(frozen=True)
+class LUDecomposition:
+    """
+    LU decomposition with partial pivoting of a square matrix, P A = L U.
+
+    `lu` holds the factors in place; the strict lower triangle is L (with a unit
+    diagonal) and the upper triangle U. Row `i` of P A is row `permutation[i]` of A.
+    """
+
+    lu: Tuple[Tuple[float, ...], ...]
+    permutation: Tuple[int, ...]
+
+    @classmethod
+    def factorize(cls, matrix: Sequence[Sequence[float]]) -> "LUDecomposition":
+        """
+        Factorize a dense square matrix given as a sequence of rows.
+
+        Raises `ChemicalUtilsValueError` if the matrix is not square or is singular.
+
+        Examples:
+            >>> LUDecomposition.factorize([[2.0, 1.0], [4.0, 3.0]]).solve([3.0, 7.0])
+            [1.0, 1.0]
+        """
+        n = len(matrix)
+        rows = [[float(v) for v in row] for row in matrix]
+        if any(len(row) != n for row in rows):
+            raise ChemicalUtilsValueError(
+                "cannot factorize matrix; expected a square matrix. "
+            )
+        permutation = list(range(n))
+
+        for k in range(n):
+            column = [abs(row[k]) for row in rows[k:]]
+            pivot = k + column.index(max(column))
+            if rows[pivot][k] == 0:
+                raise ChemicalUtilsValueError(
+                    "cannot factorize matrix; the matrix is singular. "
+                )
+            if pivot != k:
+                rows[k], rows[pivot] = rows[pivot], rows[k]
+                permutation[k], permutation[pivot] = permutation[pivot], permutation[k]
+
+            row_k, pivot_value = rows[k], rows[k][k]
+            for i in range(k + 1, n):
+                row_i = rows[i]
+                if row_i[k]:
+                    factor = row_i[k] / pivot_value
+                    row_i[k] = factor
+                    for j in range(k + 1, n):
+                        row_i[j] -= factor * row_k[j]
+
+        return cls(tuple(tuple(row) for row in rows), tuple(permutation))
+
+    def solve(self, rhs: Sequence[float]) -> List[float]:
+        """
+        Solve A x = b with forward and back substitution.
+        """
+        lu = self.lu
+        n = len(lu)
+        x = [float(rhs[i]) for i in self.permutation]
+        for i in range(1, n):
+            row = lu[i]
+            x[i] -= sum(row[j] * x[j] for j in range(i))
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            x[i] = (x[i] - sum(row[j] * x[j] for j in range(i + 1, n))) / row[i]
+        return x
+
+
+@dataclass(frozen=True)
+class SparseLUPattern:
+    """
+    Symbolic LU decomposition without pivoting of the sparsity pattern of a square
+    CSR matrix (with its diagonal); the pattern of the factors, including fill-in,
+    and the position of each matrix entry in it.
+
+    The pattern is analyzed once and reused to factorize any number of matrices
+    that share the sparsity pattern (see `factorize`).
+
+    Examples:
+        >>> matrix = CSRMatrix.from_rows([{0: 4.0, 1: 1.0}, {0: 2.0, 1: 3.0}], 2)
+        >>> SparseLUPattern.analyze(matrix).factorize(matrix).solve([6.0, 8.0])
+        [1.0, 2.0]
+    """
+
+    matrix_indptr: Tuple[int, ...]
+    matrix_indices: Tuple[int, ...]
+    # positions of the matrix entries and of the diagonal in the factors.
+    positions: Tuple[int, ...]
+    diagonal: Tuple[int, ...]
+    indptr: Tuple[int, ...]
+    indices: Tuple[int, ...]
+
+    @classmethod
+    def analyze(  # pylint: disable=too-many-locals
+        cls, matrix: CSRMatrix
+    ) -> "SparseLUPattern":
+        """
+        Analyze the sparsity pattern of a square matrix.
+
+        Raises `ChemicalUtilsValueError` if the matrix is not square.
+        """
+        n = matrix.shape[0]
+        if matrix.shape[1] != n:
+            raise ChemicalUtilsValueError(
+                "cannot factorize matrix; expected a square matrix. "
+            )
+
+        indptr = [0]
+        indices: List[int] = []
+        # per row; the columns of U right of the diagonal.
+        upper: List[List[int]] = []
+        for i in range(n):
+            start, end = matrix.indptr[i], matrix.indptr[i + 1]
+            row = set(matrix.indices[start:end])
+            row.add(i)
+            lower = [column for column in row if column < i]
+            heapify(lower)
+            while lower:
+                for column in upper[heappop(lower)]:
+                    if column not in row:
+                        row.add(column)
+                        if column < i:
+                            heappush(lower, column)
+            columns = sorted(row)
+            upper.append([column for column in columns if column > i])
+            indices.extend(columns)
+            indptr.append(len(indices))
+
+        diagonal: List[int] = []
+        positions: List[int] = []
+        for i in range(n):
+            row_positions = {indices[k]: k for k in range(indptr[i], indptr[i + 1])}
+            diagonal.append(row_positions[i])
+            positions.extend(
+                row_positions[matrix.indices[k]]
+                for k in range(matrix.indptr[i], matrix.indptr[i + 1])
+            )
+
+        return cls(
+            matrix.indptr,
+            matrix.indices,
+            tuple(positions),
+            tuple(diagonal),
+            tuple(indptr),
+            tuple(indices),
+        )
+
+    def matches(self, matrix: CSRMatrix) -> bool:
+        """
+        Whether the matrix has the analyzed sparsity pattern.
+        """
+        return (
+            matrix.indptr is self.matrix_indptr or matrix.indptr == self.matrix_indptr
+        ) and (
+            matrix.indices is self.matrix_indices
+            or matrix.indices == self.matrix_indices
+        )
+
+    def factorize(  # pylint: disable=too-many-locals
+        self, matrix: CSRMatrix, *, scale: float = 1.0, shift: float = 0.0
+    ) -> "SparseLUDecomposition":
+        """
+        Factorize `shift * I + scale * matrix`, where the matrix has the analyzed
+        sparsity pattern (see `matches`), without pivoting.
+
+        Raises `ChemicalUtilsValueError` if a pivot is zero or too small to
+        factorize the matrix stably without pivoting.
+        """
+        indptr, indices, diagonal = self.indptr, self.indices, self.diagonal
+        data = [0.0] * len(indices)
+        for position, value in zip(self.positions, matrix.data):
+            data[position] = scale * value
+        for position in diagonal:
+            data[position] += shift
+
+        row_positions = [-1] * len(diagonal)
+        for i, (start, end) in enumerate(zip(indptr, indptr[1:])):
+            for k in range(start, end):
+                row_positions[indices[k]] = k
+            for k in range(start, diagonal[i]):
+                j = indices[k]
+                factor = data[k] / data[diagonal[j]]
+                data[k] = factor
+                if factor:
+                    for m in range(diagonal[j] + 1, indptr[j + 1]):
+                        data[row_positions[indices[m]]] -= factor * data[m]
+            for k in range(start, end):
+                row_positions[indices[k]] = -1
+
+            pivot = abs(data[diagonal[i]])
+            if pivot <= _PIVOT_TOLERANCE * max(abs(v) for v in data[start:end]):
+                raise ChemicalUtilsValueError(
+                    "cannot factorize matrix without pivoting; a pivot is zero or "
+                    "too small. "
+                )
+
+        return SparseLUDecomposition(self, tuple(data))
+
+
+@dataclass(frozen=True)
+class SparseLUDecomposition:
+    """
+    LU decomposition without pivoting of a sparse square matrix, A = L U, stored in
+    the pattern of its' `SparseLUPattern`; entries left of the diagonal are L (with
+    a unit diagonal) and the others U.
+    """
+
+    pattern: SparseLUPattern
+    data: Tuple[float, ...]
+
+    def solve(self, rhs: Sequence[float]) -> List[float]:
+        """
+        Solve A x = b with sparse forward and back substitution.
+        """
+        indptr, indices = self.pattern.indptr, self.pattern.indices
+        diagonal, data = self.pattern.diagonal, self.data
+        x = [float(v) for v in rhs]
+        for i, start in enumerate(indptr[:-1]):
+            x[i] -= sum(data[k] * x[indices[k]] for k in range(start, diagonal[i]))
+        for i in range(len(x) - 1, -1, -1):
+            position = diagonal[i]
+            x[i] = (
+                x[i]
+                - sum(
+                    data[k] * x[indices[k]] for k in range(position + 1, indptr[i + 1])
+                )
+            ) / data[position]
+        return x
+
+
+def reduced_row_echelon(
+    matrix: Sequence[Sequence[Fraction]],
+) -> Tuple[List[List[Fraction]], List[int]]:
+    """
+    Bring a matrix of exact fractions to reduced row echelon form. Returns the
+    non-zero rows, one per pivot, and the pivot column of each row; the rank of the
+    matrix is the number of pivots.
+
+    Examples:
+        >>> rows, pivots = reduced_row_echelon([[Fraction(2), Fraction(4)], [Fraction(1), Fraction(2)]])
+        >>> rows, pivots
+        ([[Fraction(1, 1), Fraction(2, 1)]], [0])
+    """
+    rows = [list(row) for row in matrix]
+    n_columns = len(rows[0]) if rows else 0
+    pivots: List[int] = []
+
+    rank = 0
+    for column in range(n_columns):
+        pivot = next((i for i in range(rank, len(rows)) if rows[i][column]), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        value = rows[rank][column]
+        rows[rank] = [v / value for v in rows[rank]]
+        for i, row in enumerate(rows):
+            if i != rank and row[column]:
+                factor = row[column]
+                rows[i] = [v - factor * p for v, p in zip(row, rows[rank])]
+        pivots.append(column)
+        rank += 1
+
+    return rows[:rank], pivots
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(a_i * b_i for a_i, b_i in zip(a, b))
@@ -0,0 +1,297 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+from math import sqrt
+
+from chemical_utils.numerics.linalg import (
+    CSRMatrix,
+    LUDecomposition,
+    SparseLUDecomposition,
+    SparseLUPattern,
+)
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+Vector = List[float]
+Decomposition = Union[SparseLUDecomposition, LUDecomposition]
+
+# Newton iterations per step before the step is retried.
+_MAX_NEWTON_ITERATIONS = 4
+# Newton iterations converge when the scaled correction falls below this tolerance.
+_NEWTON_TOLERANCE = 0.03
+# local error estimate factors of BDF1 (against explicit Euler) and BDF2 (against
+# quadratic extrapolation) with constant steps.
+_ERROR_CONSTANTS = (0.5, 2 / 11)
+# the step size is kept, so that the iteration matrix is reused, if the suggested
+# change is within these factors.
+_KEEP_STEP = (1.0, 1.2)
+# iteration matrices that cannot be factorized sparsely without pivoting are
+# factorized densely up to this size.
+MAX_DENSE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class ODESolution:
+    """
+    Solution of an initial value problem at the requested times, along with the
+    number of steps, Jacobian evaluations and iteration matrix factorizations used.
+    """
+
+    t: List[float]
+    y: List[Vector]
+    n_steps: int
+    n_jacobians: int
+    n_factorizations: int
+
+
+def solve_bdf(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
+    fun: Callable[[float, Vector], Vector],
+    jacobian: Callable[[float, Vector], CSRMatrix],
+    y0: Sequence[float],
+    times: Sequence[float],
+    *,
+    rtol: float = 1e-6,
+    atol: float = 1e-12,
+    first_step: Optional[float] = None,
+    max_steps: int = 100_000,
+) -> ODESolution:
+    """
+    Solve the stiff initial value problem dy/dt = fun(t, y), y(times[0]) = y0 with
+    the variable step backward differentiation formulas of orders 1 and 2. Returns
+    the solution at the given, increasing, times.
+
+    The implicit equations are solved with a modified Newton method. The Jacobian
+    is evaluated only when the Newton iterations fail to converge and the iteration
+    matrix is factorized only when the step size changes, so both are reused across
+    steps while the solution is smooth. The local error of each step is kept below
+    `atol + rtol * |y|` for each component.
+
+    The iteration matrix is factorized in the sparsity pattern of the Jacobian,
+    which is analyzed again only when the pattern changes; Jacobians that keep one
+    pattern (including structural zeros) are analyzed once. Iteration matrices
+    whose diagonal pivots are unstable are factorized densely, with partial
+    pivoting, for systems of up to MAX_DENSE_SIZE equations.
+
+    Raises `ChemicalUtilsValueError` if the times are not increasing, the
+    solution cannot be advanced within `max_steps` steps or an iteration matrix
+    of a larger system cannot be factorized sparsely.
+
+    Examples:
+        >>> from math import exp
+        >>> J = CSRMatrix.from_rows([{0: -1000.0}], 1)
+        >>> solution = solve_bdf(lambda t, y: J.matvec(y), lambda t, y: J, [1.0], [0, 0.01])
+        >>> abs(solution.y[-1][0] - exp(-10)) < 1e-6
+        True
+    """
+    if any(b <= a for a, b in zip(times, times[1:])):
+        raise ChemicalUtilsValueError(
+            "cannot solve initial value problem; expected increasing times. "
+        )
+
+    t = float(times[0])
+    y = [float(v) for v in y0]
+    solution_t, solution_y = [t], [list(y)]
+
+    # accepted (t, y) points, most recent last.
+    history: List[Tuple[float, Vector]] = [(t, y)]
+    f = fun(t, y)
+    h = first_step or _initial_step(y, f, rtol, atol, times[-1] - t)
+
+    matrix: Optional[CSRMatrix] = None
+    matrix_is_current = False
+    pattern: Optional[SparseLUPattern] = None
+    lu: Optional[Decomposition] = None
+    lu_beta = 0.0
+    n_steps = n_jacobians = n_factorizations = 0
+
+    for target in times[1:]:
+        while t < target:
+            if n_steps >= max_steps:
+                raise ChemicalUtilsValueError(
+                    f"cannot solve initial value problem; the maximum number of steps "
+                    f"({max_steps}) was reached at t = {t}. "
+                )
+
+            order = 2 if len(history) >= 3 else 1
+            h_step = h
+            if order == 2:
+                # variable step BDF2 is zero-stable for step ratios below 1 + sqrt(2).
+                h_step = min(h_step, 2 * (t - history[-2][0]))
+            clamped = h_step >= target - t
+            if clamped:
+                h_step = target - t
+            if h_step <= 1e-14 * max(abs(t), 1.0):
+                raise _step_too_small_error(t)
+            t_new = t + h_step
+
+            constant, beta = _bdf_coefficients(history, h_step, order)
+            predicted = (
+                [y_i + h_step * f_i for y_i, f_i in zip(y, f)]
+                if order == 1
+                else _extrapolate(history, t_new)
+            )
+            scale = [atol + rtol * abs(y_i) for y_i in y]
+
+            while True:
+                if matrix is None:
+                    matrix, matrix_is_current = jacobian(t, y), True
+                    n_jacobians += 1
+                    lu = None
+                if lu is None or beta != lu_beta:
+                    if pattern is None or not pattern.matches(matrix):
+                        pattern = SparseLUPattern.analyze(matrix)
+                    lu, lu_beta = _factorize(matrix, pattern, beta), beta
+                    n_factorizations += 1
+
+                y_new = _newton(
+                    fun, lu, t_new, predicted, constant=constant, beta=beta, scale=scale
+                )
+                if y_new is not None:
+                    break
+                if not matrix_is_current:
+                    matrix = None
+                    continue
+
+                h_step *= 0.25
+                clamped = False
+                if h_step <= 1e-14 * max(abs(t), 1.0):
+                    raise _step_too_small_error(t)
+                t_new = t + h_step
+                constant, beta = _bdf_coefficients(history, h_step, order)
+                predicted = (
+                    [y_i + h_step * f_i for y_i, f_i in zip(y, f)]
+                    if order == 1
+                    else _extrapolate(history, t_new)
+                )
+
+            n_steps += 1
+            error = _rms(
+                [
+                    _ERROR_CONSTANTS[order - 1] * (a - b) / max(s, atol + rtol * abs(a))
+                    for a, b, s in zip(y_new, predicted, scale)
+                ]
+            )
+            factor = 5.0 if error == 0 else min(5.0, 0.9 * error ** (-1 / (order + 1)))
+
+            if error > 1:
+                h = h_step * max(0.2, factor)
+                continue
+
+            t, y = t_new, y_new
+            history = (history + [(t, y)])[-3:]
+            matrix_is_current = False
+            if len(history) < 3:
+                f = fun(t, y)
+
+            if not clamped and not _KEEP_STEP[0] <= factor <= _KEEP_STEP[1]:
+                h = h_step * max(0.2, factor)
+            elif not clamped:
+                h = h_step
+            elif factor < 1:
+                h = min(h, h_step * factor)
+
+        solution_t.append(t)
+        solution_y.append(list(y))
+
+    return ODESolution(solution_t, solution_y, n_steps, n_jacobians, n_factorizations)
+
+
+def _initial_step(y: Vector, f: Vector, rtol: float, atol: float, span: float) -> float:
+    scale = [atol + rtol * abs(y_i) for y_i in y]
+    d0 = _rms([y_i / s for y_i, s in zip(y, scale)])
+    d1 = _rms([f_i / s for f_i, s in zip(f, scale)])
+    h = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    return min(h, span)
+
+
+def _bdf_coefficients(
+    history: List[Tuple[float, Vector]], h: float, order: int
+) -> Tuple[Vector, float]:
+    """
+    The implicit equation of a step is y = constant + beta * fun(t + h, y).
+    """
+    t_n, y_n = history[-1]
+    if order == 1:
+        return list(y_n), h
+
+    t_previous, y_previous = history[-2]
+    omega = h / (t_n - t_previous)
+    denominator = 1 + 2 * omega
+    a, b = (1 + omega) ** 2 / denominator, omega**2 / denominator
+    return (
+        [a * u - b * v for u, v in zip(y_n, y_previous)],
+        h * (1 + omega) / denominator,
+    )
+
+
+def _extrapolate(history: List[Tuple[float, Vector]], t: float) -> Vector:
+    """
+    Evaluate the quadratic through the last three points at t.
+    """
+    (t0, y0), (t1, y1), (t2, y2) = history[-3:]
+    l0 = (t - t1) * (t - t2) / ((t0 - t1) * (t0 - t2))
+    l1 = (t - t0) * (t - t2) / ((t1 - t0) * (t1 - t2))
+    l2 = (t - t0) * (t - t1) / ((t2 - t0) * (t2 - t1))
+    return [l0 * a + l1 * b + l2 * c for a, b, c in zip(y0, y1, y2)]
+
+
+def _factorize(
+    matrix: CSRMatrix, pattern: SparseLUPattern, beta: float
+) -> Decomposition:
+    """
+    Factorize the iteration matrix I - beta * J; sparsely in the analyzed pattern
+    of J, or densely with partial pivoting if the diagonal pivots are unstable.
+    """
+    n = matrix.shape[0]
+    try:
+        return pattern.factorize(matrix, scale=-beta, shift=1.0)
+    except ChemicalUtilsValueError:
+        if n > MAX_DENSE_SIZE:
+            raise
+
+    dense = [[0.0] * n for _ in range(n)]
+    for i, (start, end) in enumerate(zip(matrix.indptr, matrix.indptr[1:])):
+        row = dense[i]
+        for k in range(start, end):
+            row[matrix.indices[k]] = -beta * matrix.data[k]
+        row[i] += 1.0
+    return LUDecomposition.factorize(dense)
+
+
+def _newton(  # pylint: disable=too-many-arguments
+    fun: Callable[[float, Vector], Vector],
+    lu: Decomposition,
+    t: float,
+    y: Vector,
+    *,
+    constant: Vector,
+    beta: float,
+    scale: Vector,
+) -> Optional[Vector]:
+    """
+    Solve y = constant + beta * fun(t, y); returns None if the iterations do not
+    converge.
+    """
+    previous_norm = None
+    for _ in range(_MAX_NEWTON_ITERATIONS):
+        f = fun(t, y)
+        residual = [c + beta * f_i - y_i for c, f_i, y_i in zip(constant, f, y)]
+        correction = lu.solve(residual)
+        y = [y_i + d for y_i, d in zip(y, correction)]
+
+        norm = _rms([d / s for d, s in zip(correction, scale)])
+        if norm < _NEWTON_TOLERANCE:
+            return y
+        if previous_norm is not None and norm > 0.9 * previous_norm:
+            return None
+        previous_norm = norm
+    return None
+
+
+def _step_too_small_error(t: float) -> ChemicalUtilsValueError:
+    return ChemicalUtilsValueError(
+        f"cannot solve initial value problem; the step size became too small at "
+        f"t = {t}. "
+    )
+
+
+def _rms(values: Vector) -> float:
+    return sqrt(sum(v * v for v in values) / len(values)) if values else 0.0
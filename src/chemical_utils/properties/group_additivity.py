@@ -0,0 +1,326 @@
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+from dataclasses import dataclass, field
+from math import log
+from threading import Lock
+
+from property_utils.units import (
+    KELVIN,
+    BAR,
+    CENTI_METER,
+    MOL,
+    KILO_JOULE,
+    JOULE,
+)
+
+from chemical_utils.properties.properties import (
+    Temperature,
+    Pressure,
+    MolarVolume,
+    CriticalProperties,
+    MolarEnergy,
+    FormationProperties,
+    Entropy,
+)
+from chemical_utils.substances.substance import ChemicalSubstance
+from chemical_utils.substances.species import species_composition
+from chemical_utils.numerics.linalg import CSRMatrix
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+# Universal gas constant in J/mol/K.
+_GAS_CONSTANT = 8.314462618
+
+
+@dataclass(frozen=True)
+class GroupContribution:
+    """
+    Contributions of a structural group to the properties of the molecules that
+    contain it.
+
+    Critical temperature, critical pressure, critical volume (cm^3/mol), normal
+    boiling temperature (K) and formation enthalpy and Gibbs energy (kJ/mol)
+    increments follow the Joback method. The standard entropy increment (J/mol/K)
+    follows the Benson method; groups without one (None) prevent the estimation of
+    the entropy of the molecules that contain them.
+    """
+
+    critical_temperature: float
+    critical_pressure: float
+    critical_volume: float
+    boiling_temperature: float
+    formation_enthalpy: float
+    formation_gibbs_energy: float
+    entropy: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class GroupDecomposition:
+    """
+    The number of each structural group in a molecule.
+
+    `symmetry_number` is the rotational symmetry number of the molecule, used to
+    correct the entropy estimate by -R ln(symmetry_number).
+    """
+
+    groups: Mapping[str, int]
+    symmetry_number: int = 1
+
+
+JOBACK_GROUPS: Mapping[str, GroupContribution] = {
+    "-CH3": GroupContribution(0.0141, -0.0012, 65, 23.58, -76.45, -43.96, 127.3),
+    "-CH2-": GroupContribution(0.0189, 0.0000, 56, 22.88, -20.64, 8.42, 39.4),
+    ">CH-": GroupContribution(0.0164, 0.0020, 41, 21.74, 29.89, 58.36, -50.5),
+    ">C<": GroupContribution(0.0067, 0.0043, 27, 18.25, 82.23, 116.02, -146.9),
+    "=CH2": GroupContribution(0.0113, -0.0028, 56, 18.18, -9.63, 3.77, 115.6),
+    "=CH-": GroupContribution(0.0129, -0.0006, 46, 24.96, 37.97, 48.53, 33.4),
+    "-OH": GroupContribution(0.0741, 0.0112, 28, 92.88, -208.04, -189.20, 121.7),
+    "-O-": GroupContribution(0.0168, 0.0015, 18, 22.42, -132.22, -105.00, 36.3),
+    ">C=O": GroupContribution(0.0380, 0.0031, 62, 76.75, -133.22, -120.50, 62.8),
+    "-COOH": GroupContribution(0.0791, 0.0077, 89, 169.09, -426.72, -387.87),
+    "-Cl": GroupContribution(0.0105, -0.0049, 58, 38.13, -71.55, -64.31),
+    "-NH2": GroupContribution(0.0243, 0.0109, 38, 73.23, -22.02, 14.07),
+}
+"""
+Joback contributions of common non-ring groups, with Benson entropy increments of
+the corresponding groups bonded to carbon atoms.
+"""
+
+
+@dataclass
+class GroupAdditivityEstimator:
+    """
+    Estimates properties of chemical substances from the contributions of their
+    structural groups.
+
+    Chemical substances carry no structural information, so group decompositions
+    are either registered with `register_decomposition` or computed by the optional
+    `decompose` function; computed decompositions are memoized per substance.
+
+    The estimator implements the `PropertyProvider` protocol, so it can be used as a
+    fallback for substances without registered properties with
+    `add_fallback_provider`.
+
+    Examples:
+        >>> from property_utils.units import KILO_JOULE, MOL
+        >>> from chemical_utils.substances import CARBON, HYDROGEN, OXYGEN
+        >>> from chemical_utils.substances.substance import c
+        >>> ACETONE = c(CARBON*3, HYDROGEN*6, OXYGEN)
+        >>> estimator = GroupAdditivityEstimator()
+        >>> estimator.register_decomposition(ACETONE, {"-CH3": 2, ">C=O": 1}, 18)
+        >>> formation = estimator.standard_formation_properties(ACETONE)
+        >>> round(formation.enthalpy.to_unit(KILO_JOULE / MOL).value, 2)
+        -217.83
+        >>> round(estimator.critical_properties(ACETONE).temperature.value, 1)
+        500.2
+    """
+
+    groups: Mapping[str, GroupContribution] = field(
+        default_factory=lambda: dict(JOBACK_GROUPS)
+    )
+    decompose: Optional[Callable[[ChemicalSubstance], Optional[GroupDecomposition]]] = (
+        None
+    )
+
+    def __post_init__(self) -> None:
+        self._decompositions: Dict[ChemicalSubstance, Optional[GroupDecomposition]] = {}
+        self._lock = Lock()
+
+    def register_decomposition(
+        self,
+        substance: ChemicalSubstance,
+        groups: Mapping[str, int],
+        symmetry_number: int = 1,
+    ) -> None:
+        """
+        Set the group decomposition of a chemical substance.
+
+        Raises `ChemicalUtilsValueError` if a group has no contribution or a count
+        or the symmetry number is not positive.
+        """
+        decomposition = GroupDecomposition(dict(groups), symmetry_number)
+        self._validate(substance, decomposition)
+        with self._lock:
+            self._decompositions[substance] = decomposition
+
+    def decomposition(
+        self, substance: ChemicalSubstance
+    ) -> Optional[GroupDecomposition]:
+        """
+        Get the group decomposition of a chemical substance. Returns None if the
+        substance cannot be decomposed.
+        """
+        try:
+            return self._decompositions[substance]
+        except KeyError:
+            pass
+
+        decomposition = None if self.decompose is None else self.decompose(substance)
+        if decomposition is not None:
+            self._validate(substance, decomposition)
+        with self._lock:
+            return self._decompositions.setdefault(substance, decomposition)
+
+    def critical_properties(
+        self, substance: ChemicalSubstance
+    ) -> Optional[CriticalProperties]:
+        """
+        Estimate the critical properties of a chemical substance.
+        """
+        return self.estimate_critical_properties([substance])[0]
+
+    def standard_formation_properties(
+        self, substance: ChemicalSubstance
+    ) -> Optional[FormationProperties]:
+        """
+        Estimate the standard formation properties of a chemical substance.
+        """
+        return self.estimate_standard_formation_properties([substance])[0]
+
+    def standard_entropy(self, substance: ChemicalSubstance) -> Optional[Entropy]:
+        """
+        Estimate the standard entropy of a chemical substance.
+        """
+        return self.estimate_standard_entropies([substance])[0]
+
+    def estimate_critical_properties(
+        self, substances: Iterable[ChemicalSubstance]
+    ) -> List[Optional[CriticalProperties]]:
+        """
+        Estimate the critical properties of many chemical substances at once. The
+        result holds None for the substances that cannot be decomposed.
+        """
+        table = self._table(substances)
+        temperatures = table.sums(lambda g: g.critical_temperature)
+        pressures = table.sums(lambda g: g.critical_pressure)
+        volumes = table.sums(lambda g: g.critical_volume)
+        boiling = table.sums(lambda g: g.boiling_temperature)
+
+        results: List[Optional[CriticalProperties]] = []
+        for i, substance in enumerate(table.substances):
+            if table.decompositions[i] is None:
+                results.append(None)
+                continue
+
+            atoms = sum(species_composition(substance).values())
+            boiling_temperature = 198 + boiling[i]
+            results.append(
+                CriticalProperties(
+                    Temperature(
+                        boiling_temperature
+                        / (0.584 + 0.965 * temperatures[i] - temperatures[i] ** 2),
+                        KELVIN,
+                    ),
+                    Pressure((0.113 + 0.0032 * atoms - pressures[i]) ** -2, BAR),
+                    MolarVolume(17.5 + volumes[i], CENTI_METER**3 / MOL),
+                )
+            )
+        return results
+
+    def estimate_standard_formation_properties(
+        self, substances: Iterable[ChemicalSubstance]
+    ) -> List[Optional[FormationProperties]]:
+        """
+        Estimate the standard formation properties of many chemical substances at
+        once. The result holds None for the substances that cannot be decomposed.
+        """
+        table = self._table(substances)
+        enthalpies = table.sums(lambda g: g.formation_enthalpy)
+        gibbs_energies = table.sums(lambda g: g.formation_gibbs_energy)
+
+        return [
+            (
+                None
+                if decomposition is None
+                else FormationProperties(
+                    MolarEnergy(68.29 + enthalpy, KILO_JOULE / MOL),
+                    MolarEnergy(53.88 + gibbs_energy, KILO_JOULE / MOL),
+                )
+            )
+            for decomposition, enthalpy, gibbs_energy in zip(
+                table.decompositions, enthalpies, gibbs_energies
+            )
+        ]
+
+    def estimate_standard_entropies(
+        self, substances: Iterable[ChemicalSubstance]
+    ) -> List[Optional[Entropy]]:
+        """
+        Estimate the standard entropies of many chemical substances at once. The
+        result holds None for the substances that cannot be decomposed or contain
+        groups without an entropy contribution.
+        """
+        table = self._table(substances)
+        entropies = table.sums(lambda g: g.entropy or 0.0)
+
+        results: List[Optional[Entropy]] = []
+        for decomposition, entropy in zip(table.decompositions, entropies):
+            if decomposition is None or any(
+                self.groups[group].entropy is None for group in decomposition.groups
+            ):
+                results.append(None)
+                continue
+
+            entropy -= _GAS_CONSTANT * log(decomposition.symmetry_number)
+            results.append(Entropy(entropy, JOULE / MOL / KELVIN))
+        return results
+
+    def _validate(
+        self, substance: ChemicalSubstance, decomposition: GroupDecomposition
+    ) -> None:
+        for group, number in decomposition.groups.items():
+            if group not in self.groups:
+                raise ChemicalUtilsValueError(
+                    f"cannot decompose {substance} into unknown group: {group}. "
+                )
+            if not number > 0:
+                raise ChemicalUtilsValueError(
+                    f"invalid number of groups {group} in {substance}: {number}; "
+                    "expected a positive integer. "
+                )
+        if not decomposition.symmetry_number > 0:
+            raise ChemicalUtilsValueError(
+                f"invalid symmetry number of {substance}: "
+                f"{decomposition.symmetry_number}; expected a positive integer. "
+            )
+
+    def _table(self, substances: Iterable[ChemicalSubstance]) -> "_GroupTable":
+        _substances = list(substances)
+        decompositions = [self.decomposition(s) for s in _substances]
+        return _GroupTable(self.groups, _substances, decompositions)
+
+
+class _GroupTable:  # pylint: disable=too-few-public-methods
+    """
+    Sparse matrix of the number of each group (columns) in each substance (rows).
+    Property sums are computed with one matrix-vector product per property.
+    """
+
+    def __init__(
+        self,
+        contributions: Mapping[str, GroupContribution],
+        substances: List[ChemicalSubstance],
+        decompositions: Sequence[Optional[GroupDecomposition]],
+    ) -> None:
+        self.substances = substances
+        self.decompositions = decompositions
+        self.names = list(contributions)
+        self.contributions = [contributions[name] for name in self.names]
+
+        columns = {name: column for column, name in enumerate(self.names)}
+        rows = (
+            (
+                {}
+                if decomposition is None
+                else {
+                    columns[group]: float(number)
+                    for group, number in decomposition.groups.items()
+                }
+            )
+            for decomposition in decompositions
+        )
+        self.matrix = CSRMatrix.from_rows(rows, len(self.names))
+
+    def sums(self, contribution: Callable[[GroupContribution], float]) -> List[float]:
+        """
+        Sum a contribution over the groups of each substance.
+        """
+        return self.matrix.matvec([contribution(g) for g in self.contributions])
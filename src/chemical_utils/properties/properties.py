@@ -1,11 +1,118 @@
+from typing import Iterable, List, Optional, Sequence, TypeVar
 from dataclasses import dataclass
+from functools import lru_cache
 
-from property_utils.properties import ValidatedProperty, Property, p
+from typing_extensions import Self
+from property_utils.properties import ValidatedProperty, Property
 from property_utils.exceptions import PropertyValidationError
 from property_utils.units import *  # pylint: disable=unused-wildcard-import
+from property_utils.units.descriptors import UnitDescriptor
 
+PropertyT = TypeVar("PropertyT", bound=Property)
 
-class Temperature(ValidatedProperty):
+
+@dataclass(frozen=True)
+class UnitConversion:
+    """
+    Conversion of numeric values between two units: `value * factor + offset`. The
+    offset is non zero only for conversions between absolute and relative
+    temperature scales.
+    """
+
+    factor: float
+    offset: float = 0.0
+
+    def apply(self, value: float) -> float:
+        """
+        Convert one value.
+        """
+        if self.offset:
+            return value * self.factor + self.offset
+        return value * self.factor
+
+    def apply_many(self, values: Iterable[float]) -> List[float]:
+        """
+        Convert many values.
+        """
+        factor, offset = self.factor, self.offset
+        if offset:
+            return [value * factor + offset for value in values]
+        return [value * factor for value in values]
+
+
+class CachedConversionProperty(Property):
+    """
+    Property whose unit conversions reuse the cached conversion factors of
+    `unit_conversion`, instead of deriving them on every conversion.
+    """
+
+    def to_unit(self, unit: UnitDescriptor) -> Self:
+        """
+        Create a new property with specified unit.
+
+        Raises `PropertyUnitConversionError` if the unit is not of the same type.
+        """
+        if self.unit == unit:
+            return self.__class__(unit=self.unit, value=self.value)
+        return self.__class__(
+            value=unit_conversion(self.unit, unit).apply(self.value), unit=unit
+        )
+
+
+class BulkProperty(Property):
+    """
+    Property that can be created in bulk from a column of values in the same units.
+    """
+
+    @classmethod
+    def from_values(
+        cls, values: Iterable[float], unit: Optional[UnitDescriptor] = None
+    ) -> List[Self]:
+        """
+        Create many properties with the given units (defaults to the default units).
+
+        The units are validated once and the values are validated all together with
+        `validate_values`; the properties are then created without any per-value
+        validation.
+
+        Raises `PropertyValidationError` if the units or any of the values are
+        invalid.
+
+        Examples:
+            >>> Pressure.from_values([1, 2.5])
+            [<Pressure: 1 bar>, <Pressure: 2.5 bar>]
+        """
+        _values = list(values)
+        if not _values:
+            return []
+
+        if not all(isinstance(value, (float, int)) for value in _values):
+            raise PropertyValidationError(
+                f"cannot create {cls.__name__} properties; expected numeric values. "
+            )
+
+        # the first property is created as usual to validate the units.
+        first = cls(_values[0], unit)
+        cls.validate_values(_values, first.unit)
+
+        properties = [first]
+        for value in _values[1:]:
+            prop = cls.__new__(cls)
+            prop.value = value
+            prop.unit = first.unit
+            properties.append(prop)
+        return properties
+
+    @classmethod
+    def validate_values(cls, values: Sequence[float], unit: UnitDescriptor) -> None:
+        """
+        Validate many values of this property in the given units.
+
+        The only exception this method should raise is `PropertyValidationError`.
+        """
+
+
+class Temperature(CachedConversionProperty, BulkProperty, ValidatedProperty):
     """
     Temperature property with default units of Kelvin.
     """
@@ -14,13 +121,18 @@ class Temperature(ValidatedProperty):
     default_units = KELVIN
 
     def validate_value(self, value: float) -> None:
-        if p(value, self.unit) < p(0, KELVIN):
+        self.validate_values((value,), self.unit)
+
+    @classmethod
+    def validate_values(cls, values: Sequence[float], unit: UnitDescriptor) -> None:
+        to_kelvin = unit_conversion(unit, KELVIN)
+        if any(to_kelvin.apply(value) < 0 for value in values):
             raise PropertyValidationError(
                 "cannot create a temperature with value less than absolute 0. "
             )
 
 
-class Pressure(ValidatedProperty):
+class Pressure(CachedConversionProperty, BulkProperty, ValidatedProperty):
     """
     Pressure property with default units of bar.
     """
@@ -29,13 +141,17 @@ class Pressure(ValidatedProperty):
     default_units = BAR
 
     def validate_value(self, value: float) -> None:
-        if not value >= 0:
+        self.validate_values((value,), self.unit)
+
+    @classmethod
+    def validate_values(cls, values: Sequence[float], unit: UnitDescriptor) -> None:
+        if not all(value >= 0 for value in values):
             raise PropertyValidationError(
                 "cannot create a pressure with value less than 0. "
             )
 
 
-class MolarVolume(ValidatedProperty):
+class MolarVolume(CachedConversionProperty, BulkProperty, ValidatedProperty):
     """
     Molar volume property with default units of m^3/kmol.
     """
@@ -44,7 +160,11 @@ class MolarVolume(ValidatedProperty):
     default_units = METER**3 / KILO_MOL
 
     def validate_value(self, value: float) -> None:
-        if not value >= 0:
+        self.validate_values((value,), self.unit)
+
+    @classmethod
+    def validate_values(cls, values: Sequence[float], unit: UnitDescriptor) -> None:
+        if not all(value >= 0 for value in values):
             raise PropertyValidationError(
                 "cannot create a volume with value less than 0. "
             )
@@ -61,7 +181,7 @@ class CriticalProperties:
     volume: MolarVolume
 
 
-class MolarEnergy(Property):
+class MolarEnergy(CachedConversionProperty, BulkProperty):
     """
     Molar energy property with default units of J/kmol.
     """
@@ -79,7 +199,7 @@ class FormationProperties:
     gibbs_energy: MolarEnergy
 
 
-class Entropy(ValidatedProperty):
+class Entropy(CachedConversionProperty, BulkProperty, ValidatedProperty):
     """
     Entropy property with default units of J/kmol/K.
     """
@@ -88,5 +208,116 @@ class Entropy(ValidatedProperty):
     default_units = JOULE / KILO_MOL / KELVIN
 
     def validate_value(self, value: float) -> None:
-        if not value >= 0:
+        self.validate_values((value,), self.unit)
+
+    @classmethod
+    def validate_values(cls, values: Sequence[float], unit: UnitDescriptor) -> None:
+        if not all(value >= 0 for value in values):
             raise PropertyValidationError("entropy must be bigger than 0. ")
+
+
+class EntropyChange(CachedConversionProperty, BulkProperty):
+    """
+    Change of entropy, e.g. over a chemical reaction, with default units of
+    J/kmol/K. Unlike `Entropy` it can be negative.
+    """
+
+    generic_unit_descriptor = EnergyUnit / AmountUnit / AbsoluteTemperatureUnit
+    default_units = JOULE / KILO_MOL / KELVIN
+
+
+def convert_value(
+    value: float, from_unit: UnitDescriptor, to_unit: UnitDescriptor
+) -> float:
+    """
+    Convert a plain numeric value from some units to some other units.
+
+    Examples:
+        >>> convert_value(1000, JOULE / KILO_MOL, JOULE / MOL)
+        1.0
+    """
+    if from_unit == to_unit:
+        return value
+    return unit_conversion(from_unit, to_unit).apply(value)
+
+
+def convert_values(
+    values: Iterable[float], from_unit: UnitDescriptor, to_unit: UnitDescriptor
+) -> List[float]:
+    """
+    Convert many plain numeric values from some units to some other units with one
+    conversion factor.
+
+    Examples:
+        >>> convert_values([1, 2], KILO_JOULE / MOL, JOULE / KILO_MOL)
+        [1000000.0, 2000000.0]
+    """
+    if from_unit == to_unit:
+        return list(values)
+    return unit_conversion(from_unit, to_unit).apply_many(values)
+
+
+def convert_properties(
+    properties: Iterable[PropertyT], unit: UnitDescriptor
+) -> List[PropertyT]:
+    """
+    Convert many properties to the given units. Properties in the same units share
+    one conversion factor.
+
+    Examples:
+        >>> convert_properties([Temperature(0, CELCIUS), Temperature(300)], KELVIN)
+        [<Temperature: 273.15 K>, <Temperature: 300 K>]
+    """
+    return [
+        prop.__class__(
+            value=(
+                prop.value
+                if prop.unit == unit
+                else unit_conversion(prop.unit, unit).apply(prop.value)
+            ),
+            unit=unit,
+        )
+        for prop in properties
+    ]
+
+
+@lru_cache(maxsize=1024)
+def unit_conversion(
+    from_unit: UnitDescriptor, to_unit: UnitDescriptor
+) -> UnitConversion:
+    """
+    Get the conversion of numeric values from some units to some other units. The
+    conversion is derived once per pair of units and cached.
+
+    Raises `PropertyUnitConversionError` if the units are not of the same type.
+
+    Examples:
+        >>> unit_conversion(CELCIUS, KELVIN)
+        UnitConversion(factor=1.0, offset=273.15)
+    """
+    if from_unit == to_unit:
+        return UnitConversion(1.0)
+
+    offset = Property(0, from_unit).to_unit(to_unit).value
+    if not offset:
+        return UnitConversion(Property(1, from_unit).to_unit(to_unit).value)
+
+    # derive the factor of affine (temperature) conversions away from the offset to
+    # keep it exact.
+    probe = 1e6
+    return UnitConversion(
+        (Property(probe, from_unit).to_unit(to_unit).value - offset) / probe, offset
+    )
+
+
+def default_units_value(prop: Property) -> float:
+    """
+    Get the numeric value of a property in the default units of its' class.
+
+    Examples:
+        >>> default_units_value(MolarEnergy(1, JOULE / MOL))
+        1000.0
+    """
+    if prop.default_units is None:
+        return prop.to_si().value
+    return convert_value(prop.value, prop.unit, prop.default_units)
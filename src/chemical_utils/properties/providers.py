@@ -0,0 +1,79 @@
+from typing import Any, Mapping, Optional
+
+from chemical_utils.properties.properties import (
+    CriticalProperties,
+    FormationProperties,
+    Entropy,
+)
+
+
+def substance_key(substance) -> str:
+    """
+    Key of a chemical substance in external property databases; its' formula as
+    written, including the charge of ions, e.g. "CH4". Like the property registry,
+    which keys substances by equality, the key keeps isomers apart, so formulas
+    written in a different order are different keys.
+
+    Examples:
+        >>> from chemical_utils.substances import CARBON, HYDROGEN, OXYGEN
+        >>> from chemical_utils.substances.substance import c
+        >>> ethanol = c(CARBON, HYDROGEN * 3, CARBON, HYDROGEN * 2, OXYGEN, HYDROGEN)
+        >>> dimethyl_ether = c(CARBON, HYDROGEN * 3, OXYGEN, CARBON, HYDROGEN * 3)
+        >>> substance_key(ethanol), substance_key(dimethyl_ether)
+        ('CH3CH2OH', 'CH3OCH3')
+    """
+    return str(substance)
+
+
+class MappingPropertyProvider:
+    """
+    Property provider (see `PropertyProvider`) backed by mappings from substance
+    keys (see `substance_key`) to properties.
+
+    Values are looked up one at a time, so lazily loaded mappings such as
+    `shelve.Shelf` objects can be attached to the registry without reading the
+    whole database into memory.
+
+    Examples:
+        >>> from chemical_utils.substances import METHANE
+        >>> from chemical_utils.properties.properties import Entropy
+        >>> provider = MappingPropertyProvider(standard_entropies={"XeF4": Entropy(1)})
+        >>> provider.standard_entropy(METHANE) is None
+        True
+    """
+
+    def __init__(
+        self,
+        critical_properties: Optional[Mapping[str, CriticalProperties]] = None,
+        standard_formation_properties: Optional[
+            Mapping[str, FormationProperties]
+        ] = None,
+        standard_entropies: Optional[Mapping[str, Entropy]] = None,
+    ) -> None:
+        self._critical_properties = critical_properties
+        self._standard_formation_properties = standard_formation_properties
+        self._standard_entropies = standard_entropies
+
+    def critical_properties(self, substance) -> Optional[CriticalProperties]:
+        """
+        Look up the critical properties of a chemical substance.
+        """
+        return _lookup(self._critical_properties, substance)
+
+    def standard_formation_properties(self, substance) -> Optional[FormationProperties]:
+        """
+        Look up the standard formation properties of a chemical substance.
+        """
+        return _lookup(self._standard_formation_properties, substance)
+
+    def standard_entropy(self, substance) -> Optional[Entropy]:
+        """
+        Look up the standard entropy of a chemical substance.
+        """
+        return _lookup(self._standard_entropies, substance)
+
+
+def _lookup(mapping: Optional[Mapping[str, Any]], substance) -> Any:
+    if mapping is None:
+        return None
+    return mapping.get(substance_key(substance))
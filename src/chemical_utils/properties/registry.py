@@ -1,4 +1,24 @@
-from typing import Optional, Dict, Any
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Protocol,
+    Tuple,
+    TypeVar,
+    overload,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count
+from threading import Lock
+
 from typing_extensions import TypeAlias
 
 from chemical_utils.properties.properties import (
@@ -10,28 +30,44 @@ from chemical_utils.properties.properties import (
     FormationProperties,
     Entropy,
 )
+from chemical_utils.instrumentation.instrumentation import instrumented, count_event
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+T = TypeVar("T")
+
+_CACHE_PREFIX = "_registry_cached_"
 
 
+@instrumented("registry.create_critical_properties")
 def create_critical_properties(
     substance, temperature: Temperature, pressure: Pressure, volume: MolarVolume
 ) -> CriticalProperties:
     """
     Create the critical properties of a chemical substance.
 
-    Existing critical properties can be overriden with this function.
+    Existing critical properties can be overriden with this function. Inside a
+    `registry_overlay` block the properties are only visible in the current context.
     """
-    _critical_properties[substance] = CriticalProperties(temperature, pressure, volume)
-    return _critical_properties[substance]
+    properties = CriticalProperties(temperature, pressure, volume)
+    _set(_CRITICAL_PROPERTIES, substance, properties)
+    return properties
 
 
+@instrumented("registry.get_critical_properties")
 def get_critical_properties(substance) -> Optional[CriticalProperties]:
     """
-    Get the critical properties of a chemical substance. Returns None if the properties
-    have not been created for the given substance.
+    Get the critical properties of a chemical substance. If the properties have not
+    been created for the given substance the fallback providers are asked in turn;
+    returns None if none of them has the properties.
     """
-    return _critical_properties.get(substance, None)
+    properties = _get(_CRITICAL_PROPERTIES, substance)
+    if properties is None:
+        count_event("registry.get_critical_properties.miss")
+        properties = _from_fallback_providers(_CRITICAL_PROPERTIES, substance)
+    return properties
 
 
+@instrumented("registry.create_standard_formation_properties")
 def create_standard_formation_properties(
     substance,
     formation_enthalpy: MolarEnergy,
@@ -41,38 +77,328 @@ def create_standard_formation_properties(
     Create the standard (25 Celcius, 1 bar) formation properties of a chemical
     substance.
 
-    Existing standard formation properties can be overriden with this function.
+    Existing standard formation properties can be overriden with this function. Inside
+    a `registry_overlay` block the properties are only visible in the current context.
     """
-    _standard_formation_properties[substance] = FormationProperties(
-        formation_enthalpy, formation_gibbs_energy
-    )
-    return _standard_formation_properties[substance]
+    properties = FormationProperties(formation_enthalpy, formation_gibbs_energy)
+    _set(_STANDARD_FORMATION_PROPERTIES, substance, properties)
+    return properties
 
 
+@instrumented("registry.get_standard_formation_properties")
 def get_standard_formation_properties(substance) -> Optional[FormationProperties]:
     """
     Get the standard (25 Celcius, 1 bar) formation properties of a chemical substance.
-    Returns None if the properties have not been created for the given substance.
+    If the properties have not been created for the given substance the fallback
+    providers are asked in turn; returns None if none of them has the properties.
     """
-    return _standard_formation_properties.get(substance, None)
+    properties = _get(_STANDARD_FORMATION_PROPERTIES, substance)
+    if properties is None:
+        count_event("registry.get_standard_formation_properties.miss")
+        properties = _from_fallback_providers(_STANDARD_FORMATION_PROPERTIES, substance)
+    return properties
 
 
+@instrumented("registry.create_standard_entropy")
 def create_standard_entropy(substance, entropy: Entropy) -> Entropy:
     """
     Create the standard (25 Celcius, 1 bar) entropy of a chemical substance.
 
-    Existing standard entropy can be overriden with this function.
+    Existing standard entropy can be overriden with this function. Inside a
+    `registry_overlay` block the entropy is only visible in the current context.
     """
-    _standard_entropies[substance] = entropy
-    return _standard_entropies[substance]
+    _set(_STANDARD_ENTROPIES, substance, entropy)
+    return entropy
 
 
+@instrumented("registry.get_standard_entropy")
 def get_standard_entropy(substance) -> Optional[Entropy]:
     """
-    Get the standard (25 Celcius, 1 bar) entropy of a chemical substance. Returns None
-    if the entropy has not been created for the given substance.
+    Get the standard (25 Celcius, 1 bar) entropy of a chemical substance. If the
+    entropy has not been created for the given substance the fallback providers are
+    asked in turn; returns None if none of them has the entropy.
+    """
+    entropy = _get(_STANDARD_ENTROPIES, substance)
+    if entropy is None:
+        count_event("registry.get_standard_entropy.miss")
+        entropy = _from_fallback_providers(_STANDARD_ENTROPIES, substance)
+    return entropy
+
+
+class PropertyProvider(Protocol):
+    """
+    Source of chemical substance properties that are not created in the registry,
+    e.g. an estimation method. Each method returns None if the provider cannot supply
+    the property for the given substance.
+    """
+
+    def critical_properties(self, substance) -> Optional[CriticalProperties]:
+        """
+        Critical temperature, pressure and volume of the substance.
+        """
+
+    def standard_formation_properties(self, substance) -> Optional[FormationProperties]:
+        """
+        Standard enthalpy and Gibbs energy of formation of the substance.
+        """
+
+    def standard_entropy(self, substance) -> Optional[Entropy]:
+        """
+        Standard entropy of the substance.
+        """
+
+
+def add_fallback_provider(
+    provider: PropertyProvider, name: Optional[str] = None
+) -> None:
+    """
+    Append a provider that is asked for the properties of substances that have not
+    been created in the registry, e.g. an on-disk database and then an estimation
+    method. Providers are asked in the order they were added, lazily on the first
+    access of a missing property; the answers are kept in an LRU cache (see
+    `configure_fallback_cache`).
+
+    The `name` of the provider (defaults to the name of its' class) is reported by
+    `get_property_source` for the properties it supplies.
+    """
+    with _lock:
+        _fallback_providers.append(
+            (type(provider).__name__ if name is None else name, provider)
+        )
+        _fallback_changed()
+
+
+def remove_fallback_provider(provider: PropertyProvider) -> None:
+    """
+    Remove a provider added with `add_fallback_provider`.
+
+    Raises `ChemicalUtilsValueError` if the provider has not been added.
+    """
+    with _lock:
+        for i, (_, _provider) in enumerate(_fallback_providers):
+            if _provider is provider:
+                del _fallback_providers[i]
+                _fallback_changed()
+                return
+
+    raise ChemicalUtilsValueError(
+        f"cannot remove fallback provider {provider}; it has not been added. "
+    )
+
+
+def configure_fallback_cache(maxsize: Optional[int]) -> None:
+    """
+    Set the maximum number of properties supplied by fallback providers that are
+    cached; None means no bound. Clears the cache.
+    """
+    global _resolve_fallback  # pylint: disable=global-statement
+    with _lock:
+        _resolve_fallback = lru_cache(maxsize)(_ask_fallback_providers)
+        _fallback_changed()
+
+
+def clear_fallback_cache() -> None:
+    """
+    Forget the properties supplied by fallback providers, e.g. after the data behind
+    a provider changed.
+    """
+    with _lock:
+        _fallback_changed()
+
+
+def get_property_source(substance, property_name: str) -> Optional[str]:
+    """
+    Get where a property of a chemical substance comes from: `REGISTERED` if it has
+    been created in the registry, the name of the fallback provider that supplied
+    it, or None if the property is not available.
+
+    `property_name` is one of "critical_properties", "standard_formation_properties"
+    and "standard_entropy".
+
+    Raises `ChemicalUtilsValueError` if `property_name` is not one of the above.
+
+    Examples:
+        >>> from chemical_utils.substances import METHANE
+        >>> get_property_source(METHANE, "standard_entropy")
+        'registry'
+    """
+    table = _PROPERTY_TABLES.get(property_name)
+    if table is None:
+        raise ChemicalUtilsValueError(
+            f"unknown property: {property_name}; expected one of "
+            f"{', '.join(_PROPERTY_TABLES)}. "
+        )
+
+    if _get(table, substance) is not None:
+        return REGISTERED
+    return _resolve_fallback(table, substance)[0]
+
+
+@contextmanager
+def registry_overlay() -> Iterator[None]:
+    """
+    Scope property creations to the current context (thread or asyncio task).
+
+    Properties created inside the with-block are stored in a context-local layer on
+    top of the shared registry and are discarded on exit; other threads and tasks do
+    not see them. Overlays can be nested; an inner overlay starts with the overrides
+    of the outer one.
+
+    Examples:
+        >>> from chemical_utils.substances import METHANE
+        >>> with registry_overlay():
+        ...     _ = create_standard_formation_properties(
+        ...         METHANE, MolarEnergy(-7e7), MolarEnergy(-5e7)
+        ...     )
+        ...     METHANE.standard_formation_properties.enthalpy.value
+        -70000000.0
+        >>> METHANE.standard_formation_properties.enthalpy.value
+        -74520000.0
+    """
+    parent = _overlay.get()
+    tables = {} if parent is None else parent.tables
+    token = _overlay.set(_RegistryOverlay(tables, next(_versions)))
+    try:
+        yield
+    finally:
+        _overlay.reset(token)
+
+
+def registry_version() -> Tuple[int, int]:
+    """
+    Get a token that changes whenever the properties visible from the current context
+    change, i.e. on every property creation and on entering or leaving an overlay.
+    """
+    overlay = _overlay.get()
+    return _base_version, 0 if overlay is None else overlay.version
+
+
+class registry_cached_property(Generic[T]):  # pylint: disable=invalid-name
+    """
+    Like `functools.cached_property`, but the cached value is recomputed when the
+    properties visible in the registry change (see `registry_version`).
+
+    Registry versions are only meaningful within one process; classes that are
+    pickled should leave the cached values out of their state (see
+    `without_registry_cache`).
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.cache_name = f"{_CACHE_PREFIX}{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.cache_name = f"{_CACHE_PREFIX}{name}"
+
+    @overload
+    def __get__(
+        self, instance: None, owner: Any = None
+    ) -> "registry_cached_property": ...
+
+    @overload
+    def __get__(self, instance: Any, owner: Any = None) -> T: ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        version = registry_version()
+        cached = instance.__dict__.get(self.cache_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        value = self.func(instance)
+        instance.__dict__[self.cache_name] = (version, value)
+        return value
+
+    def is_cached(self, instance: Any) -> bool:
+        """
+        Whether the given instance holds a value that is valid for the current
+        registry version, i.e. reading the property does not compute it.
+        """
+        cached = instance.__dict__.get(self.cache_name)
+        return cached is not None and cached[0] == registry_version()
+
+    def seed(self, instance: Any, value: T) -> None:
+        """
+        Store an already known value for the given instance, valid for the current
+        registry version.
+        """
+        instance.__dict__[self.cache_name] = (registry_version(), value)
+
+
+def without_registry_cache(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of the state (`__dict__`) of an instance without the values cached by its'
+    `registry_cached_property` attributes, e.g. for `__getstate__`.
+    """
+    return {
+        name: value
+        for name, value in state.items()
+        if not name.startswith(_CACHE_PREFIX)
+    }
+
+
+@dataclass(frozen=True)
+class _RegistryOverlay:
     """
-    return _standard_entropies.get(substance, None)
+    Immutable context-local layer of the registry; replaced on every creation.
+    """
+
+    tables: Mapping[str, Mapping[Any, Any]]
+    version: int
+
+
+def _get(table: str, substance) -> Any:
+    overlay = _overlay.get()
+    if overlay is not None:
+        overrides = overlay.tables.get(table)
+        if overrides is not None and substance in overrides:
+            return overrides[substance]
+
+    return _tables[table].get(substance, None)
+
+
+def _from_fallback_providers(table: str, substance) -> Any:
+    if not _fallback_providers:
+        return None
+    return _resolve_fallback(table, substance)[1]
+
+
+def _ask_fallback_providers(table: str, substance) -> Tuple[Optional[str], Any]:
+    count_event("registry.fallback_providers.lookup")
+    for name, provider in list(_fallback_providers):
+        value = _PROVIDER_METHODS[table](provider, substance)
+        if value is not None:
+            return name, value
+    return None, None
+
+
+def _fallback_changed() -> None:
+    """
+    Must be called while holding `_lock`.
+    """
+    _resolve_fallback.cache_clear()
+    _bump_base_version()
+
+
+def _set(table: str, substance, value) -> None:
+    overlay = _overlay.get()
+    if overlay is not None:
+        tables = dict(overlay.tables)
+        tables[table] = {**tables.get(table, {}), substance: value}
+        _overlay.set(_RegistryOverlay(tables, next(_versions)))
+        return
+
+    with _lock:
+        _tables[table][substance] = value
+        _bump_base_version()
+
+
+def _bump_base_version() -> None:
+    global _base_version  # pylint: disable=global-statement
+    _base_version = next(_versions)
 
 
 # ChemicalSubstance cannot be imported here because of circular import. Use this alias
@@ -84,3 +410,51 @@ _critical_properties: Dict[ChemicalSubstanceAlias, CriticalProperties] = {}
 _standard_formation_properties: Dict[ChemicalSubstanceAlias, FormationProperties] = {}
 
 _standard_entropies: Dict[ChemicalSubstanceAlias, Entropy] = {}
+
+_CRITICAL_PROPERTIES = "critical_properties"
+_STANDARD_FORMATION_PROPERTIES = "standard_formation_properties"
+_STANDARD_ENTROPIES = "standard_entropies"
+
+_tables: Dict[str, Dict[ChemicalSubstanceAlias, Any]] = {
+    _CRITICAL_PROPERTIES: _critical_properties,
+    _STANDARD_FORMATION_PROPERTIES: _standard_formation_properties,
+    _STANDARD_ENTROPIES: _standard_entropies,
+}
+
+_PROVIDER_METHODS: Dict[str, Callable[[PropertyProvider, Any], Any]] = {
+    _CRITICAL_PROPERTIES: lambda provider, s: provider.critical_properties(s),
+    _STANDARD_FORMATION_PROPERTIES: (
+        lambda provider, s: provider.standard_formation_properties(s)
+    ),
+    _STANDARD_ENTROPIES: lambda provider, s: provider.standard_entropy(s),
+}
+
+_PROPERTY_TABLES = {
+    "critical_properties": _CRITICAL_PROPERTIES,
+    "standard_formation_properties": _STANDARD_FORMATION_PROPERTIES,
+    "standard_entropy": _STANDARD_ENTROPIES,
+}
+
+REGISTERED = "registry"
+"""
+Source of the properties created in the registry; see `get_property_source`.
+"""
+
+FALLBACK_CACHE_SIZE = 65536
+"""
+Default maximum number of cached properties supplied by fallback providers.
+"""
+
+_fallback_providers: List[Tuple[str, PropertyProvider]] = []
+
+_resolve_fallback = lru_cache(FALLBACK_CACHE_SIZE)(_ask_fallback_providers)
+
+_overlay: ContextVar[Optional[_RegistryOverlay]] = ContextVar(
+    "registry_overlay", default=None
+)
+
+_versions = count(1)
+
+_base_version = 0  # pylint: disable=invalid-name
+
+_lock = Lock()
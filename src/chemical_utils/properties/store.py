@@ -0,0 +1,261 @@
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+from threading import Lock, local
+import sqlite3
+
+from chemical_utils.properties.properties import (
+    Temperature,
+    Pressure,
+    MolarVolume,
+    CriticalProperties,
+    MolarEnergy,
+    FormationProperties,
+    Entropy,
+    default_units_value,
+)
+from chemical_utils.properties.providers import substance_key
+from chemical_utils.properties.registry import clear_fallback_cache
+
+
+class SQLitePropertyStore:
+    """
+    Persistent store of chemical substance properties in an SQLite database file,
+    keyed by `substance_key`.
+
+    The store can be shared by many processes; each process (and thread) opens its'
+    own connection to the same file. An in-memory database (path ":memory:" or "")
+    has one connection, which threads use one at a time. Reads use a fixed set of
+    statements, which SQLite keeps prepared per connection, behind an in-process LRU
+    cache of `cache_size` entries. The cache of a process is cleared by its' own writes, along
+    with the registry fallback cache; call `clear_cache` to see the writes of other
+    processes.
+
+    The store implements the `PropertyProvider` protocol; attach it to the registry
+    with `add_fallback_provider` so that `get_*` functions fall back to it.
+
+    Values are stored in the default units of the property classes.
+
+    Examples:
+        >>> from chemical_utils.substances import METHANE
+        >>> store = SQLitePropertyStore(":memory:")
+        >>> _ = store.create_standard_entropy(METHANE, Entropy(186_250))
+        >>> store.standard_entropy(METHANE)
+        <Entropy: 186250.0 J / K / kmol>
+    """
+
+    def __init__(self, path: str, cache_size: Optional[int] = 65536) -> None:
+        self.path = path
+        self._local = local()
+        self._read = lru_cache(cache_size)(self._read_uncached)
+        # an in-memory database only exists within its' connection.
+        self._shared_connection = self._connect() if path in (":memory:", "") else None
+        self._shared_connection_lock = Lock()
+        with self._connection() as connection:
+            with connection:
+                for statement in _CREATE_TABLES:
+                    connection.execute(statement)
+
+    def create_critical_properties(
+        self,
+        substance,
+        temperature: Temperature,
+        pressure: Pressure,
+        volume: MolarVolume,
+    ) -> CriticalProperties:
+        """
+        Store the critical properties of a chemical substance.
+        """
+        properties = CriticalProperties(temperature, pressure, volume)
+        self.create_many_critical_properties([(substance, properties)])
+        return properties
+
+    def create_standard_formation_properties(
+        self,
+        substance,
+        formation_enthalpy: MolarEnergy,
+        formation_gibbs_energy: MolarEnergy,
+    ) -> FormationProperties:
+        """
+        Store the standard formation properties of a chemical substance.
+        """
+        properties = FormationProperties(formation_enthalpy, formation_gibbs_energy)
+        self.create_many_standard_formation_properties([(substance, properties)])
+        return properties
+
+    def create_standard_entropy(self, substance, entropy: Entropy) -> Entropy:
+        """
+        Store the standard entropy of a chemical substance.
+        """
+        self.create_many_standard_entropies([(substance, entropy)])
+        return entropy
+
+    def create_many_critical_properties(
+        self, items: Iterable[Tuple[Any, CriticalProperties]]
+    ) -> None:
+        """
+        Store the critical properties of many chemical substances in one
+        transaction. Existing properties are overriden.
+        """
+        self._upsert(
+            _CRITICAL_PROPERTIES,
+            (
+                (
+                    substance_key(substance),
+                    default_units_value(properties.temperature),
+                    default_units_value(properties.pressure),
+                    default_units_value(properties.volume),
+                )
+                for substance, properties in items
+            ),
+        )
+
+    def create_many_standard_formation_properties(
+        self, items: Iterable[Tuple[Any, FormationProperties]]
+    ) -> None:
+        """
+        Store the standard formation properties of many chemical substances in one
+        transaction. Existing properties are overriden.
+        """
+        self._upsert(
+            _STANDARD_FORMATION_PROPERTIES,
+            (
+                (
+                    substance_key(substance),
+                    default_units_value(properties.enthalpy),
+                    default_units_value(properties.gibbs_energy),
+                )
+                for substance, properties in items
+            ),
+        )
+
+    def create_many_standard_entropies(
+        self, items: Iterable[Tuple[Any, Entropy]]
+    ) -> None:
+        """
+        Store the standard entropies of many chemical substances in one
+        transaction. Existing entropies are overriden.
+        """
+        self._upsert(
+            _STANDARD_ENTROPIES,
+            (
+                (substance_key(substance), default_units_value(entropy))
+                for substance, entropy in items
+            ),
+        )
+
+    def critical_properties(self, substance) -> Optional[CriticalProperties]:
+        """
+        Read the critical properties of a chemical substance. Returns None if they
+        are not stored.
+        """
+        row = self._read(_CRITICAL_PROPERTIES, substance_key(substance))
+        if row is None:
+            return None
+        return CriticalProperties(
+            Temperature(row[0]), Pressure(row[1]), MolarVolume(row[2])
+        )
+
+    def standard_formation_properties(self, substance) -> Optional[FormationProperties]:
+        """
+        Read the standard formation properties of a chemical substance. Returns None
+        if they are not stored.
+        """
+        row = self._read(_STANDARD_FORMATION_PROPERTIES, substance_key(substance))
+        if row is None:
+            return None
+        return FormationProperties(MolarEnergy(row[0]), MolarEnergy(row[1]))
+
+    def standard_entropy(self, substance) -> Optional[Entropy]:
+        """
+        Read the standard entropy of a chemical substance. Returns None if it is not
+        stored.
+        """
+        row = self._read(_STANDARD_ENTROPIES, substance_key(substance))
+        if row is None:
+            return None
+        return Entropy(row[0])
+
+    def clear_cache(self) -> None:
+        """
+        Forget the values read so far.
+        """
+        self._read.cache_clear()
+
+    def close(self) -> None:
+        """
+        Close the connection of the calling thread.
+        """
+        if self._shared_connection is not None:
+            with self._shared_connection_lock:
+                self._shared_connection.close()
+            return
+
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _upsert(self, table: str, rows: Iterable[Tuple[Any, ...]]) -> None:
+        with self._connection() as connection:
+            with connection:
+                connection.executemany(_UPSERT[table], rows)
+        self.clear_cache()
+        clear_fallback_cache()
+
+    def _read_uncached(self, table: str, key: str) -> Optional[Tuple[float, ...]]:
+        with self._connection() as connection:
+            return connection.execute(_SELECT[table], (key,)).fetchone()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        The connection of the calling thread, or the shared connection of an
+        in-memory database, which is locked while it is used.
+        """
+        if self._shared_connection is not None:
+            with self._shared_connection_lock:
+                yield self._shared_connection
+            return
+
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+        yield connection
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=self.path not in (":memory:", "")
+        )
+        # write-ahead logging lets readers in other processes proceed during writes.
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+
+_CRITICAL_PROPERTIES = "critical_properties"
+_STANDARD_FORMATION_PROPERTIES = "standard_formation_properties"
+_STANDARD_ENTROPIES = "standard_entropies"
+
+_COLUMNS = {
+    _CRITICAL_PROPERTIES: ("temperature", "pressure", "volume"),
+    _STANDARD_FORMATION_PROPERTIES: ("enthalpy", "gibbs_energy"),
+    _STANDARD_ENTROPIES: ("entropy",),
+}
+
+_CREATE_TABLES: List[str] = [
+    f"CREATE TABLE IF NOT EXISTS {table} "
+    f"(key TEXT PRIMARY KEY, {', '.join(f'{c} REAL NOT NULL' for c in columns)})"
+    for table, columns in _COLUMNS.items()
+]
+
+_UPSERT = {
+    table: f"INSERT OR REPLACE INTO {table} (key, {', '.join(columns)}) "
+    f"VALUES ({', '.join('?' * (len(columns) + 1))})"
+    for table, columns in _COLUMNS.items()
+}
+
+_SELECT = {
+    table: f"SELECT {', '.join(columns)} FROM {table} WHERE key = ?"
+    for table, columns in _COLUMNS.items()
+}
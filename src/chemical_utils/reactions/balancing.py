@@ -0,0 +1,149 @@
+from typing import Dict, List, Optional, Sequence
+from fractions import Fraction
+from functools import reduce
+from math import gcd
+
+from chemical_utils.substances.substance import (
+    ChemicalSubstance,
+    ChemicalElement,
+    ChemicalReactionFactor,
+    ChemicalReactionOperand,
+)
+from chemical_utils.substances.species import species_composition
+from chemical_utils.substances.constants import WATER, PROTON, HYDROXIDE
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.numerics.linalg import reduced_row_echelon
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+ACIDIC = "acidic"
+BASIC = "basic"
+
+_MEDIUM_SPECIES = {ACIDIC: (PROTON, WATER), BASIC: (HYDROXIDE, WATER)}
+
+
+def balance_reaction(
+    reactants: Sequence[ChemicalSubstance],
+    products: Sequence[ChemicalSubstance],
+    medium: Optional[str] = None,
+) -> ChemicalReaction:
+    """
+    Find the smallest integer stoichiometric coefficients that balance the atoms of
+    each element and the charge of a reaction between the given substances.
+
+    For redox reactions in aqueous solution pass `medium` ACIDIC or BASIC; water and
+    protons or hydroxide ions, respectively, are then added to whichever side they
+    are needed. Half-reactions are balanced by including `ELECTRON` among the
+    reactants or products.
+
+    The coefficients are found as the null space of the element and charge
+    composition matrix with exact rational arithmetic.
+
+    Raises `ChemicalUtilsValueError` if the substances cannot be balanced or can be
+    balanced in more than one independent way, or if the medium is unknown.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> from chemical_utils.substances.substance import ChemicalIon, c
+        >>> PERMANGANATE = ChemicalIon(c(MANGANESE, OXYGEN*4), -1)
+        >>> balance_reaction(
+        ...     [PERMANGANATE, ChemicalIon(IRON, 2)],
+        ...     [ChemicalIon(MANGANESE, 2), ChemicalIon(IRON, 3)],
+        ...     ACIDIC,
+        ... )
+        <ChemicalReaction: MnO4^- + 5Fe^2+ + 8H^+ -> Mn^2+ + 5Fe^3+ + 4H2O>
+    """
+    if medium is not None and medium not in _MEDIUM_SPECIES:
+        raise ChemicalUtilsValueError(
+            f"unknown medium: {medium}; expected one of {ACIDIC}, {BASIC}. "
+        )
+
+    species: List[ChemicalSubstance] = list(reactants) + list(products)
+    if medium is not None:
+        species += [s for s in _MEDIUM_SPECIES[medium] if s not in species]
+
+    if not reactants or not products or len(set(species)) != len(species):
+        raise ChemicalUtilsValueError(
+            "cannot balance chemical reaction; expected distinct reactants and "
+            "products and at least one of each. "
+        )
+
+    coefficients = _null_vector(_composition_matrix(species))
+    if coefficients[0] > 0:
+        coefficients = [-c for c in coefficients]
+
+    _reactants: List[ChemicalReactionFactor] = []
+    _products: List[ChemicalReactionFactor] = []
+    for i, (substance, coefficient) in enumerate(zip(species, coefficients)):
+        if i < len(reactants) and not coefficient < 0:
+            raise _cannot_balance_error(reactants, products)
+        if len(reactants) <= i < len(reactants) + len(products) and not coefficient > 0:
+            raise _cannot_balance_error(reactants, products)
+
+        if coefficient < 0:
+            _reactants.append(-coefficient * substance)
+        elif coefficient > 0:
+            _products.append(coefficient * substance)
+
+    return ChemicalReaction(
+        ChemicalReactionOperand(_reactants), ChemicalReactionOperand(_products)
+    )
+
+
+def _composition_matrix(species: Sequence[ChemicalSubstance]) -> List[List[Fraction]]:
+    """
+    One row per element plus a row for the charge; one column per substance.
+    """
+    rows: Dict[ChemicalElement, List[Fraction]] = {}
+    for column, substance in enumerate(species):
+        for element, atoms in species_composition(substance).items():
+            row = rows.setdefault(element, [Fraction(0)] * len(species))
+            row[column] = Fraction(atoms)
+
+    matrix = list(rows.values())
+    matrix.append([Fraction(substance.charge) for substance in species])
+    return matrix
+
+
+def _null_vector(matrix: List[List[Fraction]]) -> List[int]:
+    """
+    The integer vector with coprime entries spanning the null space of the matrix.
+
+    Raises `ChemicalUtilsValueError` if the null space is not one-dimensional.
+    """
+    n_columns = len(matrix[0])
+    rows, pivots = reduced_row_echelon(matrix)
+
+    free = [column for column in range(n_columns) if column not in pivots]
+    if len(free) != 1:
+        raise ChemicalUtilsValueError(
+            "cannot balance chemical reaction; "
+            + (
+                "the substances cannot be balanced. "
+                if not free
+                else "the substances can be balanced in more than one independent "
+                "way. "
+            )
+        )
+
+    vector = [Fraction(0)] * n_columns
+    vector[free[0]] = Fraction(1)
+    for row, column in zip(rows, pivots):
+        vector[column] = -row[free[0]]
+
+    denominator = 1
+    for value in vector:
+        denominator = (
+            denominator * value.denominator // gcd(denominator, value.denominator)
+        )
+    integers = [int(value * denominator) for value in vector]
+    divisor = reduce(gcd, integers)
+    return [value // divisor for value in integers]
+
+
+def _cannot_balance_error(
+    reactants: Sequence[ChemicalSubstance], products: Sequence[ChemicalSubstance]
+) -> ChemicalUtilsValueError:
+    return ChemicalUtilsValueError(
+        f"cannot balance chemical reaction {' + '.join(map(str, reactants))} -> "
+        f"{' + '.join(map(str, products))}; no positive coefficients exist. "
+    )
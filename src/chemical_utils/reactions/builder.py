@@ -0,0 +1,125 @@
+from typing import Dict, List, Union
+from fractions import Fraction
+
+from chemical_utils.substances.substance import (
+    ChemicalSubstance,
+    ChemicalElement,
+    ChemicalReactionFactor,
+    ChemicalReactionOperand,
+    Coefficient,
+    SUBSTANCE_TYPES,
+)
+from chemical_utils.substances.species import species_composition
+from chemical_utils.reactions.reaction import (
+    ChemicalReaction,
+    unbalanced_reaction_error,
+)
+from chemical_utils.exceptions.base import (
+    ChemicalUtilsTypeError,
+    ChemicalUtilsValueError,
+)
+
+
+class ChemicalReactionBuilder:
+    """
+    Incrementally builds a chemical reaction.
+
+    Factors are appended in amortized constant time and the per-element atom balance
+    is kept up to date, so the balance check on `build` only compares element counts.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> builder = ChemicalReactionBuilder()
+        >>> _ = builder.add_reactant(METHANE).add_reactant(WATER)
+        >>> _ = builder.add_product(CARBON_MONOXIDE).add_product(HYDROGEN2, 3)
+        >>> builder.build()
+        <ChemicalReaction: CH4 + H2O -> CO + 3H2>
+    """
+
+    def __init__(self) -> None:
+        self._reactants: List[ChemicalReactionFactor] = []
+        self._products: List[ChemicalReactionFactor] = []
+        # atoms of each element in the products minus atoms in the reactants.
+        self._balance: Dict[ChemicalElement, Coefficient] = {}
+        # charge of the products minus charge of the reactants.
+        self._charge: Coefficient = 0
+
+    def add_reactant(
+        self,
+        reactant: Union[ChemicalSubstance, ChemicalReactionFactor],
+        coefficient: Union[int, float, Fraction] = 1,
+    ) -> "ChemicalReactionBuilder":
+        """
+        Append a reactant with the given stoichiometric coefficient. If a reaction
+        factor is given its' own coefficient is used.
+        """
+        factor = self._factor(reactant, coefficient)
+        self._reactants.append(factor)
+        self._update_balance(factor, -1)
+        return self
+
+    def add_product(
+        self,
+        product: Union[ChemicalSubstance, ChemicalReactionFactor],
+        coefficient: Union[int, float, Fraction] = 1,
+    ) -> "ChemicalReactionBuilder":
+        """
+        Append a product with the given stoichiometric coefficient. If a reaction
+        factor is given its' own coefficient is used.
+        """
+        factor = self._factor(product, coefficient)
+        self._products.append(factor)
+        self._update_balance(factor, 1)
+        return self
+
+    def is_balanced(self) -> bool:
+        """
+        Returns True if the factors added so far form a balanced reaction.
+        """
+        return not self._charge and not any(self._balance.values())
+
+    def build(self) -> ChemicalReaction:
+        """
+        Create the chemical reaction from the factors added so far.
+
+        Raises `ChemicalUtilsValueError` if there are no reactants or no products.
+
+        Raises `UnbalancedChemicalReactionError` if the reaction is not balanced.
+        """
+        if not self._reactants or not self._products:
+            raise ChemicalUtilsValueError(
+                "cannot build chemical reaction; at least one reactant and one product "
+                "are required. "
+            )
+
+        reactants = ChemicalReactionOperand(list(self._reactants))
+        products = ChemicalReactionOperand(list(self._products))
+
+        if not self.is_balanced():
+            raise unbalanced_reaction_error(f"{reactants} -> {products}")
+
+        return ChemicalReaction._from_balanced(  # pylint: disable=protected-access
+            reactants, products
+        )
+
+    def _update_balance(self, factor: ChemicalReactionFactor, sign: int) -> None:
+        coefficient = sign * factor.stoichiometric_coefficient
+        self._charge += coefficient * factor.substance.charge
+        for element, atoms in species_composition(factor.substance).items():
+            self._balance[element] = self._balance.get(element, 0) + coefficient * atoms
+
+    @staticmethod
+    def _factor(
+        substance: Union[ChemicalSubstance, ChemicalReactionFactor],
+        coefficient: Union[int, float, Fraction],
+    ) -> ChemicalReactionFactor:
+        if isinstance(substance, ChemicalReactionFactor):
+            return substance
+
+        if not isinstance(substance, SUBSTANCE_TYPES):
+            raise ChemicalUtilsTypeError(
+                f"cannot add {substance} to chemical reaction; expected a chemical "
+                "substance or a chemical reaction factor. "
+            )
+
+        return coefficient * substance
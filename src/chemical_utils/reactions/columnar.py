@@ -0,0 +1,382 @@
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+from array import array
+from fractions import Fraction
+from functools import lru_cache
+from math import isnan, nan
+from os import makedirs, path
+import json
+import mmap
+import sys
+
+from chemical_utils.substances.substance import (
+    ChemicalSubstance,
+    ChemicalElement,
+    ChemicalElementTuple,
+    ChemicalCompound,
+    ChemicalIon,
+    Electron,
+    ChemicalReactionFactor,
+    ChemicalReactionOperand,
+    stoichiometric_coefficient,
+)
+from chemical_utils.reactions.reaction import (
+    ChemicalReaction,
+    seed_standard_change,
+    STANDARD_CHANGE_VALUES,
+)
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+T = TypeVar("T")
+
+FORMAT_VERSION = 1
+
+# column name: array typecode. Species columns have one value per species,
+# reaction columns one per reaction and factor columns one per reaction factor;
+# "indptr" columns have one more value and delimit the parts or factors of each
+# species or reaction.
+COLUMNS = {
+    "species_kind": "b",
+    "species_charge": "i",
+    "species_molecular_weight": "d",
+    "species_indptr": "q",
+    "part_element": "i",
+    "part_count": "i",
+    "reaction_indptr": "q",
+    "reaction_reactants": "i",
+    "reaction_standard_enthalpy_change": "d",
+    "reaction_standard_gibbs_energy_change": "d",
+    "reaction_standard_entropy_change": "d",
+    "factor_species": "q",
+    "factor_numerator": "q",
+    "factor_denominator": "q",
+}
+
+_ELEMENT, _ELEMENT_TUPLE, _COMPOUND, _ELECTRON = range(4)
+
+_PROPERTY_COLUMNS = (
+    "reaction_standard_enthalpy_change",
+    "reaction_standard_gibbs_energy_change",
+    "reaction_standard_entropy_change",
+)
+
+# values buffered per column before they are written.
+_BUFFER_SIZE = 1 << 16
+
+
+def write_columnar_store(  # pylint: disable=too-many-locals
+    directory: str, reactions: Iterable[ChemicalReaction]
+) -> int:
+    """
+    Write chemical reactions to a columnar store in the given directory (created if
+    it does not exist); see `ColumnarStore`. Returns the number of reactions.
+
+    Reactions are streamed to disk, so only the distinct species are held in
+    memory. The standard changes of the reactions that are known at the time of
+    writing are stored along.
+    """
+    makedirs(directory, exist_ok=True)
+    writer = _ColumnWriter(directory)
+    elements: Dict[ChemicalElement, int] = {}
+    species: Dict[ChemicalSubstance, int] = {}
+
+    n_reactions = 0
+    n_factors = 0
+    try:
+        writer.append("reaction_indptr", 0)
+        for reaction in reactions:
+            factors = list(reaction.reactants) + list(reaction.products)
+            for factor in factors:
+                coefficient = Fraction(factor.stoichiometric_coefficient)
+                writer.append(
+                    "factor_species", species.setdefault(factor.substance, len(species))
+                )
+                writer.append("factor_numerator", coefficient.numerator)
+                writer.append("factor_denominator", coefficient.denominator)
+
+            n_factors += len(factors)
+            writer.append("reaction_indptr", n_factors)
+            writer.append("reaction_reactants", len(reaction.reactants.factors))
+            for column, name in zip(_PROPERTY_COLUMNS, STANDARD_CHANGE_VALUES):
+                value = getattr(reaction, name)
+                writer.append(column, nan if value is None else value)
+            n_reactions += 1
+
+        n_parts = 0
+        writer.append("species_indptr", 0)
+        for substance in species:
+            kind, charge, parts = _decompose(substance)
+            writer.append("species_kind", kind)
+            writer.append("species_charge", charge)
+            writer.append("species_molecular_weight", substance.molecular_weight)
+            for element, count in parts:
+                writer.append(
+                    "part_element", elements.setdefault(element, len(elements))
+                )
+                writer.append("part_count", count)
+            n_parts += len(parts)
+            writer.append("species_indptr", n_parts)
+    finally:
+        writer.close()
+
+    with open(path.join(directory, "meta.json"), "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "version": FORMAT_VERSION,
+                "byteorder": sys.byteorder,
+                "n_species": len(species),
+                "n_reactions": n_reactions,
+                "elements": [
+                    [e.atomic_number, e.atomic_mass, e.symbol] for e in elements
+                ],
+            },
+            file,
+        )
+    return n_reactions
+
+
+class LazySequence(Sequence[T]):
+    """
+    Read-only sequence whose items are created on access.
+    """
+
+    def __init__(self, length: int, item: Callable[[int], T]) -> None:
+        self._length = length
+        self._item = item
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[T]:
+        return (self._item(i) for i in range(self._length))
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class ColumnarStore:
+    """
+    Chemical reactions and their species stored column-wise in a directory of
+    binary files (see `write_columnar_store`).
+
+    The files are memory mapped; reading a column does not load it into memory and
+    the operating system pages the accessed parts in and out. `reactions` and
+    `species` are lazy sequences that create `ChemicalReaction` and substance
+    objects only when they are accessed, so iterating over any number of reactions
+    uses flat memory. Numeric columns (see `COLUMNS`) can be read directly with
+    `column`, without creating any objects.
+
+    Recently accessed species are cached (`species_cache_size` of them); reactions
+    are not.
+
+    Examples:
+        >>> from tempfile import TemporaryDirectory
+        >>> from chemical_utils.reactions.constants import *
+        >>> with TemporaryDirectory() as directory:
+        ...     write_columnar_store(directory, [WATER_GAS_SHIFT, STEAM_METHANE_REFORMING])
+        ...     with ColumnarStore(directory) as store:
+        ...         store.reactions[1], store.column("reaction_standard_enthalpy_change")[0]
+        2
+        (<ChemicalReaction: CH4 + H2O -> CO + 3H2>, -41166000.0)
+    """
+
+    def __init__(self, directory: str, species_cache_size: int = 4096) -> None:
+        with open(path.join(directory, "meta.json"), encoding="utf-8") as file:
+            meta = json.load(file)
+        if meta["version"] != FORMAT_VERSION or meta["byteorder"] != sys.byteorder:
+            raise ChemicalUtilsValueError(
+                f"cannot open columnar store in {directory}; expected format version "
+                f"{FORMAT_VERSION} with {sys.byteorder} byte order. "
+            )
+
+        self.directory = directory
+        self._elements = [ChemicalElement(*e) for e in meta["elements"]]
+        self._maps: List[mmap.mmap] = []
+        self._columns: Dict[str, Any] = {
+            name: self._map(name, typecode) for name, typecode in COLUMNS.items()
+        }
+
+        self.species: LazySequence[ChemicalSubstance] = LazySequence(
+            meta["n_species"], lru_cache(species_cache_size)(self._species)
+        )
+        self.reactions: LazySequence[ChemicalReaction] = LazySequence(
+            meta["n_reactions"], self._reaction
+        )
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Memory mapped view of a column (see `COLUMNS`); unknown values of property
+        columns are NaN.
+
+        Raises `ChemicalUtilsValueError` if there is no such column.
+        """
+        if name not in self._columns:
+            raise ChemicalUtilsValueError(
+                f"unknown column: {name}; expected one of {', '.join(COLUMNS)}. "
+            )
+        return self._columns[name]
+
+    def close(self) -> None:
+        """
+        Release the memory maps. The maps of columns (or slices of them) that are
+        still referenced are closed when the last reference goes away.
+        """
+        for view in self._columns.values():
+            if isinstance(view, memoryview):
+                view.release()
+        for _map in self._maps:
+            try:
+                _map.close()
+            except BufferError:
+                pass
+        self._maps.clear()
+        self._columns.clear()
+
+    def __enter__(self) -> "ColumnarStore":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _map(self, name: str, typecode: Any) -> Sequence[Any]:
+        with open(path.join(self.directory, f"{name}.bin"), "rb") as file:
+            if path.getsize(file.name) == 0:
+                return array(typecode)
+            _map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(_map)
+        return memoryview(_map).cast(typecode)
+
+    def _species(self, i: int) -> ChemicalSubstance:
+        columns = self._columns
+        kind = columns["species_kind"][i]
+        if kind == _ELECTRON:
+            return Electron()
+
+        start, end = columns["species_indptr"][i], columns["species_indptr"][i + 1]
+        components = [
+            _component(self._elements[element], count)
+            for element, count in zip(
+                columns["part_element"][start:end], columns["part_count"][start:end]
+            )
+        ]
+        substance: Union[ChemicalElement, ChemicalElementTuple, ChemicalCompound] = (
+            ChemicalCompound(*components) if kind == _COMPOUND else components[0]
+        )
+        charge = columns["species_charge"][i]
+        return ChemicalIon(substance, charge) if charge else substance
+
+    def _reaction(self, i: int) -> ChemicalReaction:
+        columns = self._columns
+        start, end = columns["reaction_indptr"][i], columns["reaction_indptr"][i + 1]
+        factors = [
+            ChemicalReactionFactor(
+                self.species[s],
+                stoichiometric_coefficient(n if d == 1 else Fraction(n, d)),
+            )
+            for s, n, d in zip(
+                columns["factor_species"][start:end],
+                columns["factor_numerator"][start:end],
+                columns["factor_denominator"][start:end],
+            )
+        ]
+        n_reactants = columns["reaction_reactants"][i]
+
+        # pylint: disable-next=protected-access
+        reaction = ChemicalReaction._from_balanced(
+            ChemicalReactionOperand(factors[:n_reactants]),
+            ChemicalReactionOperand(factors[n_reactants:]),
+        )
+        for column, name in zip(_PROPERTY_COLUMNS, STANDARD_CHANGE_VALUES):
+            value = columns[column][i]
+            if not isnan(value):
+                seed_standard_change(reaction, name, value)
+        return reaction
+
+
+class _ColumnWriter:
+    def __init__(self, directory: str) -> None:
+        self._buffers: Dict[str, Any] = {
+            name: array(typecode) for name, typecode in COLUMNS.items()
+        }
+        self._files: Dict[str, BinaryIO] = {}
+        for name in COLUMNS:
+            # pylint: disable-next=consider-using-with
+            self._files[name] = open(path.join(directory, f"{name}.bin"), "wb")
+
+    def append(self, name: str, value: Union[int, float]) -> None:
+        """
+        Append a value to a column, writing the buffered values when full.
+        """
+        buffer = self._buffers[name]
+        buffer.append(value)
+        if len(buffer) >= _BUFFER_SIZE:
+            buffer.tofile(self._files[name])
+            del buffer[:]
+
+    def close(self) -> None:
+        """
+        Write the remaining buffered values and close the files.
+        """
+        for name, file in self._files.items():
+            self._buffers[name].tofile(file)
+            file.close()
+
+
+def _decompose(
+    substance: ChemicalSubstance,
+) -> Tuple[int, int, List[Tuple[ChemicalElement, int]]]:
+    """
+    The kind, charge and (element, count) parts of a substance, as written.
+    """
+    charge = 0
+    if isinstance(substance, ChemicalIon):
+        charge = substance.charge_number
+        substance = substance.substance
+
+    if isinstance(substance, Electron):
+        return _ELECTRON, 0, []
+    if isinstance(substance, ChemicalElement):
+        return _ELEMENT, charge, [(substance, 1)]
+    if isinstance(substance, ChemicalElementTuple):
+        return _ELEMENT_TUPLE, charge, [(substance.element, substance.size)]
+    if isinstance(substance, ChemicalCompound):
+        parts: List[Tuple[ChemicalElement, int]] = []
+        for component in substance.components:
+            _, _, component_parts = _decompose(component)
+            parts.extend(component_parts)
+        return _COMPOUND, charge, parts
+
+    raise ChemicalUtilsValueError(
+        f"cannot store chemical substance: {substance}; unsupported type "
+        f"{type(substance).__name__}. "
+    )
+
+
+def _component(
+    element: ChemicalElement, count: int
+) -> Union[ChemicalElement, ChemicalElementTuple]:
+    return element if count == 1 else ChemicalElementTuple(element, count)
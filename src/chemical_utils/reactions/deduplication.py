@@ -0,0 +1,156 @@
+from typing import Iterable, Iterator, List, Optional, Set
+from tempfile import TemporaryDirectory
+from os import path
+import sqlite3
+
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.reactions.stoichiometry import ReactionKey, ReactionStoichiometry
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+
+class ReactionDeduplicator:
+    """
+    Remembers the canonical keys (see `ChemicalReaction.canonical_key`) of the
+    reactions seen so far.
+
+    Without `memory_limit` all keys are kept in memory. Otherwise, whenever more
+    than `memory_limit` keys are held in memory they are spilled to a temporary
+    on-disk database in `spill_directory` (defaults to the system temporary
+    directory), so memory stays bounded however many reactions are seen. The
+    database is deleted on `close`.
+
+    Keys contain species indices, which are only meaningful within one process.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> from chemical_utils.reactions.reaction import r
+        >>> with ReactionDeduplicator() as deduplicator:
+        ...     deduplicator.add(r(CARBON_MONOXIDE + WATER, CARBON_DIOXIDE + HYDROGEN2))
+        ...     deduplicator.add(r(WATER + CARBON_MONOXIDE, HYDROGEN2 + CARBON_DIOXIDE))
+        True
+        False
+    """
+
+    def __init__(
+        self, memory_limit: Optional[int] = None, spill_directory: Optional[str] = None
+    ) -> None:
+        if memory_limit is not None and memory_limit <= 0:
+            raise ChemicalUtilsValueError(
+                f"invalid memory limit: {memory_limit}; expected a positive integer. "
+            )
+        self.memory_limit = memory_limit
+        self.spill_directory = spill_directory
+        self._keys: Set[ReactionKey] = set()
+        self._spilled = 0
+        self._directory: Optional[TemporaryDirectory] = None
+        self._database: Optional[sqlite3.Connection] = None
+
+    def add(self, reaction: ChemicalReaction) -> bool:
+        """
+        Remember a reaction. Returns True if no reaction with the same canonical key
+        has been added before.
+        """
+        key = reaction.canonical_key
+        if key in self._keys:
+            return False
+        if self._database is not None and self._is_spilled(key):
+            return False
+
+        self._keys.add(key)
+        if self.memory_limit is not None and len(self._keys) > self.memory_limit:
+            self._spill()
+        return True
+
+    def close(self) -> None:
+        """
+        Forget all keys and delete the on-disk database, if any.
+        """
+        self._keys.clear()
+        self._spilled = 0
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+
+    def __len__(self) -> int:
+        return len(self._keys) + self._spilled
+
+    def __enter__(self) -> "ReactionDeduplicator":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _is_spilled(self, key: ReactionKey) -> bool:
+        database = self._connect()
+        row = database.execute(
+            "SELECT 1 FROM reaction_keys WHERE key = ?", (_serialize(key),)
+        ).fetchone()
+        return row is not None
+
+    def _spill(self) -> None:
+        database = self._connect()
+        with database:
+            database.executemany(
+                "INSERT OR IGNORE INTO reaction_keys (key) VALUES (?)",
+                ((_serialize(key),) for key in self._keys),
+            )
+        self._spilled += len(self._keys)
+        self._keys.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._database is None:
+            # pylint: disable-next=consider-using-with
+            self._directory = TemporaryDirectory(dir=self.spill_directory)
+            self._database = sqlite3.connect(
+                path.join(self._directory.name, "reaction_keys.db")
+            )
+            self._database.execute(
+                "CREATE TABLE reaction_keys (key TEXT PRIMARY KEY) WITHOUT ROWID"
+            )
+        return self._database
+
+
+def deduplicate_reactions(
+    reactions: Iterable[ChemicalReaction],
+    memory_limit: Optional[int] = None,
+    spill_directory: Optional[str] = None,
+) -> Iterator[ChemicalReaction]:
+    """
+    Iterate over the reactions skipping those whose canonical key has been seen
+    before; the first reaction with each key is kept.
+
+    See `ReactionDeduplicator` for the meaning of `memory_limit` and
+    `spill_directory`.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> from chemical_utils.reactions.reaction import r
+        >>> reactions = [
+        ...     r(CARBON_MONOXIDE + WATER, CARBON_DIOXIDE + HYDROGEN2),
+        ...     r(WATER + CARBON_MONOXIDE, HYDROGEN2 + CARBON_DIOXIDE),
+        ... ]
+        >>> list(deduplicate_reactions(reactions))
+        [<ChemicalReaction: CO + H2O -> CO2 + H2>]
+    """
+    with ReactionDeduplicator(memory_limit, spill_directory) as deduplicator:
+        for reaction in reactions:
+            if deduplicator.add(reaction):
+                yield reaction
+
+
+def _serialize(key: ReactionKey) -> str:
+    reactants, products = key
+    return (
+        f"{_serialize_stoichiometry(reactants)} > {_serialize_stoichiometry(products)}"
+    )
+
+
+def _serialize_stoichiometry(stoichiometry: ReactionStoichiometry) -> str:
+    parts: List[str] = [
+        f"{index}:{coefficient}"
+        for index, coefficient in zip(stoichiometry.indices, stoichiometry.coefficients)
+    ]
+    return " ".join(parts)
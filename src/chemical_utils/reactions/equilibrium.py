@@ -0,0 +1,213 @@
+from typing import List, Mapping, Optional, Sequence, Tuple
+from concurrent.futures import Executor
+from math import log
+
+from property_utils.units import KELVIN
+from property_utils.units.descriptors import UnitDescriptor
+
+from chemical_utils.substances.substance import ChemicalSubstance
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.properties.properties import (
+    Entropy,
+    convert_values,
+    default_units_value,
+)
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+# Universal gas constant in J/kmol/K; the default units of MolarEnergy and Entropy.
+GAS_CONSTANT = 8314.462618
+STANDARD_TEMPERATURE = 298.15
+
+# per temperature; the factors of the enthalpy and heat capacity change in ln K.
+_TemperatureFactors = Tuple[List[float], List[float]]
+# per reaction; the enthalpy, entropy and heat capacity changes.
+_Chunk = Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]
+
+
+class EquilibriumConstantSweep:  # pylint: disable=too-few-public-methods
+    """
+    Computes the natural logarithm of the equilibrium constants of many chemical
+    reactions over a grid of temperatures with the van 't Hoff equation.
+
+    The standard enthalpy and entropy changes of the reactions are read once, when
+    the sweep is created, so the registry is not consulted again per temperature.
+    The entropy change is derived from the standard Gibbs energy change where that is
+    known, so that K is exact at the standard temperature, otherwise the standard
+    entropy change of the reaction is used.
+
+    If `heat_capacities` (constant molar heat capacities of the substances, which
+    have the units of molar entropy) are given the temperature dependence of the
+    enthalpy and entropy changes is included; otherwise they are taken as constant.
+
+    Reactions whose thermochemistry is not known (including heat capacities, if
+    given) have no equilibrium constants.
+
+    Examples:
+        >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+        >>> sweep = EquilibriumConstantSweep([WATER_GAS_SHIFT])
+        >>> [round(ln_k, 3) for ln_k in sweep.ln_equilibrium_constants([298.15, 500])[0]]
+        [11.549, 4.845]
+    """
+
+    def __init__(
+        self,
+        reactions: Sequence[ChemicalReaction],
+        heat_capacities: Optional[Mapping[ChemicalSubstance, Entropy]] = None,
+    ) -> None:
+        self.reactions = list(reactions)
+        self._enthalpies: List[Optional[float]] = []
+        self._entropies: List[Optional[float]] = []
+        self._heat_capacities: List[Optional[float]] = []
+
+        _heat_capacities = (
+            None
+            if heat_capacities is None
+            else {s: default_units_value(c) for s, c in heat_capacities.items()}
+        )
+        for reaction in self.reactions:
+            # pylint: disable=protected-access
+            enthalpy = reaction._standard_enthalpy_change_value
+            gibbs_energy = reaction._standard_gibbs_energy_change_value
+            # pylint: enable=protected-access
+            self._enthalpies.append(enthalpy)
+            self._entropies.append(
+                reaction.standard_entropy_change_value()
+                if enthalpy is None or gibbs_energy is None
+                else (enthalpy - gibbs_energy) / STANDARD_TEMPERATURE
+            )
+            self._heat_capacities.append(
+                0.0
+                if _heat_capacities is None
+                else _heat_capacity_change(reaction, _heat_capacities)
+            )
+
+    def ln_equilibrium_constants(
+        self,
+        temperatures: Sequence[float],
+        unit: Optional[UnitDescriptor] = None,
+        *,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+    ) -> List[Optional[List[float]]]:
+        """
+        Natural logarithm of the equilibrium constants of the reactions at the given
+        temperatures (in Kelvin by default). Returns one row per reaction with one
+        value per temperature; rows of reactions with unknown thermochemistry are
+        None.
+
+        Chunks of `chunk_size` reactions are computed in the `executor` if one is
+        given, otherwise in the calling thread.
+
+        Raises `ChemicalUtilsValueError` if a temperature is not positive or
+        `chunk_size` is not positive.
+        """
+        if chunk_size <= 0:
+            raise ChemicalUtilsValueError(
+                f"invalid chunk size: {chunk_size}; expected a positive integer. "
+            )
+        kelvins = convert_values(temperatures, unit or KELVIN, KELVIN)
+        if any(t <= 0 for t in kelvins):
+            raise ChemicalUtilsValueError(
+                "cannot compute equilibrium constants at temperatures below or equal "
+                "to absolute 0. "
+            )
+
+        factors = _temperature_factors(kelvins)
+        chunks = [
+            (
+                self._enthalpies[i : i + chunk_size],
+                self._entropies[i : i + chunk_size],
+                self._heat_capacities[i : i + chunk_size],
+            )
+            for i in range(0, len(self.reactions), chunk_size)
+        ]
+
+        if executor is None:
+            return _flatten([_ln_k_chunk(chunk, factors) for chunk in chunks])
+        return _flatten(_map_chunks(executor, chunks, factors))
+
+
+def ln_equilibrium_constants(
+    reactions: Sequence[ChemicalReaction],
+    temperatures: Sequence[float],
+    unit: Optional[UnitDescriptor] = None,
+    heat_capacities: Optional[Mapping[ChemicalSubstance, Entropy]] = None,
+) -> List[Optional[List[float]]]:
+    """
+    Natural logarithm of the equilibrium constants of the reactions at the given
+    temperatures (in Kelvin by default); see `EquilibriumConstantSweep`.
+
+    Examples:
+        >>> from chemical_utils.reactions.constants import STEAM_METHANE_REFORMING
+        >>> round(ln_equilibrium_constants([STEAM_METHANE_REFORMING], [1000])[0][0], 3)
+        1.014
+    """
+    return EquilibriumConstantSweep(
+        reactions, heat_capacities
+    ).ln_equilibrium_constants(temperatures, unit)
+
+
+def _heat_capacity_change(
+    reaction: ChemicalReaction, heat_capacities: Mapping[ChemicalSubstance, float]
+) -> Optional[float]:
+    change = 0.0
+    stoichiometry = reaction.stoichiometry
+    for substance, coefficient in zip(
+        stoichiometry.species, stoichiometry.coefficients
+    ):
+        heat_capacity = heat_capacities.get(substance)
+        if heat_capacity is None:
+            return None
+        change += coefficient * heat_capacity
+    return change
+
+
+def _temperature_factors(temperatures: Sequence[float]) -> _TemperatureFactors:
+    """
+    With constant heat capacity change dCp:
+        ln K = -dH/(RT) + dS/R + dCp (ln(T/T0) - (T - T0)/T) / R
+    """
+    enthalpy_factors = [-1 / (GAS_CONSTANT * t) for t in temperatures]
+    heat_capacity_factors = [
+        (log(t / STANDARD_TEMPERATURE) - (t - STANDARD_TEMPERATURE) / t) / GAS_CONSTANT
+        for t in temperatures
+    ]
+    return enthalpy_factors, heat_capacity_factors
+
+
+def _ln_k_chunk(
+    chunk: _Chunk, factors: _TemperatureFactors
+) -> List[Optional[List[float]]]:
+    enthalpy_factors, heat_capacity_factors = factors
+    rows: List[Optional[List[float]]] = []
+    for enthalpy, entropy, heat_capacity in zip(*chunk):
+        if enthalpy is None or entropy is None or heat_capacity is None:
+            rows.append(None)
+            continue
+
+        constant = entropy / GAS_CONSTANT
+        if heat_capacity:
+            rows.append(
+                [
+                    enthalpy * a + constant + heat_capacity * b
+                    for a, b in zip(enthalpy_factors, heat_capacity_factors)
+                ]
+            )
+        else:
+            rows.append([enthalpy * a + constant for a in enthalpy_factors])
+    return rows
+
+
+def _map_chunks(
+    executor: Executor,
+    chunks: List[_Chunk],
+    factors: _TemperatureFactors,
+) -> List[List[Optional[List[float]]]]:
+    futures = [executor.submit(_ln_k_chunk, chunk, factors) for chunk in chunks]
+    return [future.result() for future in futures]
+
+
+def _flatten(
+    chunks: List[List[Optional[List[float]]]],
+) -> List[Optional[List[float]]]:
+    return [row for chunk in chunks for row in chunk]
@@ -0,0 +1,138 @@
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+from asyncio import get_running_loop, sleep
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import islice
+from time import perf_counter
+
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+REACTION_PROPERTIES = (
+    "standard_enthalpy_change",
+    "standard_gibbs_energy_change",
+    "standard_entropy_change",
+)
+
+ReactionEvaluation = Dict[str, Any]
+
+
+async def evaluate_reactions(  # pylint: disable=too-many-arguments
+    reactions: Iterable[ChemicalReaction],
+    properties: Sequence[str] = REACTION_PROPERTIES,
+    *,
+    chunk_size: int = 1000,
+    executor: Optional[Executor] = None,
+    time_slice: float = 0.01,
+) -> List[ReactionEvaluation]:
+    """
+    Evaluate the given properties of many chemical reactions without blocking the
+    event loop. Returns one dictionary per reaction, mapping property names to values,
+    in the order of the reactions.
+
+    See `iter_evaluate_reactions` for the meaning of the keyword arguments.
+
+    Examples:
+        >>> from asyncio import run
+        >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+        >>> results = run(
+        ...     evaluate_reactions([WATER_GAS_SHIFT], ["standard_enthalpy_change"])
+        ... )
+        >>> results[0]["standard_enthalpy_change"]
+        <Property: -41166000.0 J / kmol>
+    """
+    results: List[ReactionEvaluation] = []
+    async for chunk in iter_evaluate_reactions(
+        reactions,
+        properties,
+        chunk_size=chunk_size,
+        executor=executor,
+        time_slice=time_slice,
+    ):
+        results.extend(chunk)
+    return results
+
+
+async def iter_evaluate_reactions(  # pylint: disable=too-many-arguments
+    reactions: Iterable[ChemicalReaction],
+    properties: Sequence[str] = REACTION_PROPERTIES,
+    *,
+    chunk_size: int = 1000,
+    executor: Optional[Executor] = None,
+    time_slice: float = 0.01,
+) -> AsyncIterator[List[ReactionEvaluation]]:
+    """
+    Evaluate the given properties of many chemical reactions in chunks of
+    `chunk_size` reactions, yielding the results of each chunk as soon as it is ready.
+
+    If an `executor` is given, chunks are evaluated in it; the registry overlay of
+    the calling context is propagated to thread pool executors, while process pool
+    executors see only the registry of the worker processes. Otherwise chunks are
+    evaluated in the event loop thread, which is released to other coroutines every
+    `time_slice` seconds.
+
+    Raises `ChemicalUtilsValueError` if a property is not a reaction property or
+    `chunk_size` is not positive.
+    """
+    _validate_properties(properties)
+    if chunk_size <= 0:
+        raise ChemicalUtilsValueError(
+            f"invalid chunk size: {chunk_size}; expected a positive integer. "
+        )
+
+    loop = get_running_loop()
+    _reactions = iter(reactions)
+
+    while True:
+        chunk = list(islice(_reactions, chunk_size))
+        if not chunk:
+            return
+
+        if executor is None:
+            yield await _evaluate_chunk_cooperatively(chunk, properties, time_slice)
+        elif isinstance(executor, ThreadPoolExecutor):
+            context = copy_context()
+            yield await loop.run_in_executor(
+                executor, context.run, _evaluate_chunk, chunk, properties
+            )
+        else:
+            yield await loop.run_in_executor(
+                executor, _evaluate_chunk, chunk, properties
+            )
+
+
+async def _evaluate_chunk_cooperatively(
+    chunk: List[ChemicalReaction], properties: Sequence[str], time_slice: float
+) -> List[ReactionEvaluation]:
+    results = []
+    start = perf_counter()
+
+    for reaction in chunk:
+        results.append(_evaluate(reaction, properties))
+
+        if perf_counter() - start >= time_slice:
+            await sleep(0)
+            start = perf_counter()
+
+    return results
+
+
+def _evaluate_chunk(
+    chunk: List[ChemicalReaction], properties: Sequence[str]
+) -> List[ReactionEvaluation]:
+    return [_evaluate(reaction, properties) for reaction in chunk]
+
+
+def _evaluate(
+    reaction: ChemicalReaction, properties: Sequence[str]
+) -> ReactionEvaluation:
+    return {name: getattr(reaction, name) for name in properties}
+
+
+def _validate_properties(properties: Sequence[str]) -> None:
+    for name in properties:
+        if name not in REACTION_PROPERTIES:
+            raise ChemicalUtilsValueError(
+                f"cannot evaluate reaction property: {name}; "
+                f"expected one of {', '.join(REACTION_PROPERTIES)}. "
+            )
@@ -0,0 +1,221 @@
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+from itertools import islice
+from os import PathLike, fspath
+import csv
+import gzip
+import json
+
+from property_utils.units.descriptors import UnitDescriptor
+
+from chemical_utils.substances.substance import ChemicalSubstance
+from chemical_utils.reactions.reaction import (
+    ChemicalReaction,
+    is_standard_change_cached,
+    standard_change,
+    STANDARD_CHANGE_VALUES,
+    SUBSTANCE_VALUES,
+)
+from chemical_utils.properties.properties import (
+    MolarEnergy,
+    EntropyChange,
+    convert_values,
+)
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+CSV = "csv"
+JSONL = "jsonl"
+
+EXPORT_COLUMNS = (
+    "reaction",
+    "standard_enthalpy_change",
+    "standard_gibbs_energy_change",
+    "standard_entropy_change",
+)
+
+Row = Tuple[str, Optional[float], Optional[float], Optional[float]]
+
+
+def export_reactions(  # pylint: disable=too-many-arguments
+    reactions: Iterable[ChemicalReaction],
+    file: Union[str, PathLike],
+    *,
+    file_format: Optional[str] = None,
+    compress: Optional[bool] = None,
+    energy_unit: Optional[UnitDescriptor] = None,
+    entropy_unit: Optional[UnitDescriptor] = None,
+    chunk_size: int = 10_000,
+) -> int:
+    """
+    Write chemical reactions and their standard enthalpy, Gibbs energy and entropy
+    changes (see `EXPORT_COLUMNS`) to a CSV or JSON Lines file. Returns the number of
+    reactions written.
+
+    The format is inferred from the file extension (".csv" or ".jsonl", optionally
+    followed by ".gz") unless `file_format` is given, and the file is gzip compressed
+    if `compress` is True or, when it is None, if the name ends with ".gz".
+
+    Reactions are consumed lazily in chunks of `chunk_size`, so any iterable of
+    reactions (e.g. the reactions of a `ColumnarStore`) is exported with bounded
+    memory. The changes are computed as plain floats for a whole chunk at once (see
+    `standard_change_rows`) and converted to `energy_unit` and `entropy_unit`
+    (default MolarEnergy and EntropyChange units) with one conversion factor per chunk.
+    Unknown changes are written as empty fields in CSV and as null in JSON Lines.
+
+    Raises `ChemicalUtilsValueError` if the format cannot be inferred or is not
+    supported, or if `chunk_size` is not positive.
+    """
+    name = fspath(file)
+    _format = file_format or _infer_format(name)
+    if _format not in (CSV, JSONL):
+        raise ChemicalUtilsValueError(
+            f"unsupported export format: {_format}; expected {CSV} or {JSONL}. "
+        )
+    if chunk_size <= 0:
+        raise ChemicalUtilsValueError(
+            f"invalid chunk size: {chunk_size}; expected a positive integer. "
+        )
+    if compress is None:
+        compress = name.endswith(".gz")
+
+    stream: TextIO
+    if compress:
+        stream = gzip.open(name, "wt", encoding="utf-8", newline="")
+    else:
+        # pylint: disable-next=consider-using-with
+        stream = open(name, "w", encoding="utf-8", newline="")
+
+    n_reactions = 0
+    _reactions = iter(reactions)
+    with stream:
+        write_rows = _csv_writer(stream) if _format == CSV else _jsonl_writer(stream)
+        while True:
+            chunk = list(islice(_reactions, chunk_size))
+            if not chunk:
+                return n_reactions
+            write_rows(standard_change_rows(chunk, energy_unit, entropy_unit))
+            n_reactions += len(chunk)
+
+
+def standard_change_rows(
+    reactions: Sequence[ChemicalReaction],
+    energy_unit: Optional[UnitDescriptor] = None,
+    entropy_unit: Optional[UnitDescriptor] = None,
+) -> List[Row]:
+    """
+    The string form and the standard enthalpy, Gibbs energy and entropy changes of
+    each reaction (see `EXPORT_COLUMNS`); changes are None where unknown.
+
+    The standard properties of each distinct species are looked up once, and
+    changes that the reactions already hold (e.g. seeded by `reverse` or read from a
+    `ColumnarStore`) are not computed again. No `Property` objects are created.
+
+    Examples:
+        >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+        >>> standard_change_rows([WATER_GAS_SHIFT])
+        [('CO + H2O -> CO2 + H2', -41166000.0, -28630000.0, -42032.0)]
+    """
+    table = _SubstanceValueTable()
+    substance_values = [table.column(k) for k in range(len(SUBSTANCE_VALUES))]
+    columns: List[List[Optional[float]]] = [[] for _ in SUBSTANCE_VALUES]
+
+    for reaction in reactions:
+        for column, name, substance_value in zip(
+            columns, STANDARD_CHANGE_VALUES, substance_values
+        ):
+            if is_standard_change_cached(reaction, name):
+                column.append(getattr(reaction, name))
+            else:
+                column.append(standard_change(reaction.stoichiometry, substance_value))
+
+    units = (energy_unit, energy_unit, entropy_unit)
+    defaults = (
+        MolarEnergy.default_units,
+        MolarEnergy.default_units,
+        EntropyChange.default_units,
+    )
+    converted = [
+        _convert(column, default, unit)
+        for column, default, unit in zip(columns, defaults, units)
+    ]
+    return [
+        (str(reaction), enthalpy, gibbs_energy, entropy)
+        for reaction, enthalpy, gibbs_energy, entropy in zip(reactions, *converted)
+    ]
+
+
+class _SubstanceValueTable:  # pylint: disable=too-few-public-methods
+    """
+    The values of the standard properties (see `SUBSTANCE_VALUES`) of each
+    substance, looked up once.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[ChemicalSubstance, Tuple[Optional[float], ...]] = {}
+
+    def column(self, k: int) -> Callable[[ChemicalSubstance], Optional[float]]:
+        """
+        Lookup of the k-th value of a substance.
+        """
+
+        def substance_value(substance: ChemicalSubstance) -> Optional[float]:
+            values = self._values.get(substance)
+            if values is None:
+                values = tuple(f(substance) for f in SUBSTANCE_VALUES)
+                self._values[substance] = values
+            return values[k]
+
+        return substance_value
+
+
+def _convert(
+    values: List[Optional[float]],
+    default_unit: Optional[UnitDescriptor],
+    unit: Optional[UnitDescriptor],
+) -> List[Optional[float]]:
+    if unit is None or default_unit is None:
+        return values
+    known = iter(
+        convert_values([v for v in values if v is not None], default_unit, unit)
+    )
+    return [None if v is None else next(known) for v in values]
+
+
+def _csv_writer(stream: TextIO) -> Callable[[List[Row]], None]:
+    writer = csv.writer(stream)
+    writer.writerow(EXPORT_COLUMNS)
+
+    def write_rows(rows: List[Row]) -> None:
+        writer.writerows(rows)
+
+    return write_rows
+
+
+def _jsonl_writer(stream: TextIO) -> Callable[[List[Row]], None]:
+    def write_rows(rows: List[Row]) -> None:
+        stream.write(
+            "".join(json.dumps(dict(zip(EXPORT_COLUMNS, row))) + "\n" for row in rows)
+        )
+
+    return write_rows
+
+
+def _infer_format(name: str) -> str:
+    if name.endswith(".gz"):
+        name = name[: -len(".gz")]
+    extension = name.rsplit(".", 1)[-1] if "." in name else ""
+    if not extension:
+        raise ChemicalUtilsValueError(
+            f"cannot infer export format of {name}; expected a .{CSV} or .{JSONL} "
+            "file extension or an explicit format. "
+        )
+    return extension
@@ -0,0 +1,203 @@
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from fractions import Fraction
+
+from property_utils.properties import Property
+from property_utils.units.descriptors import UnitDescriptor
+
+from chemical_utils.substances.substance import ChemicalSubstance
+from chemical_utils.substances.species import species_at
+from chemical_utils.reactions.reaction import (
+    ChemicalReaction,
+    formation_enthalpy_value,
+    formation_gibbs_energy_value,
+    entropy_value,
+)
+from chemical_utils.properties.properties import MolarEnergy, Entropy, convert_value
+from chemical_utils.numerics.linalg import CSRMatrix, sparse_least_squares
+
+Measurement = Tuple[ChemicalReaction, Property]
+
+
+def estimate_standard_formation_enthalpies(
+    measurements: Iterable[Measurement],
+) -> Dict[ChemicalSubstance, MolarEnergy]:
+    """
+    Estimate the standard formation enthalpies of the substances that have none
+    registered, from reactions with measured standard enthalpy changes (e.g. heats of
+    combustion), with Hess's law.
+
+    The registered formation enthalpies of the other substances are used as they
+    are. The overdetermined linear system over the reaction stoichiometry is solved
+    in the least squares sense with a sparse solver. Substances whose value the
+    measurements do not determine, e.g. two unknown substances that only take part
+    in the same reactions, are left out of the result.
+
+    Examples:
+        >>> from property_utils.units import KILO_JOULE, MOL
+        >>> from chemical_utils.substances import *
+        >>> from chemical_utils.substances.substance import c
+        >>> from chemical_utils.reactions.reaction import r
+        >>> ETHANE = c(CARBON*2, HYDROGEN*6)
+        >>> combustion = r(2*ETHANE + 7*OXYGEN2, 4*CARBON_DIOXIDE + 6*WATER)
+        >>> estimates = estimate_standard_formation_enthalpies(
+        ...     [(combustion, MolarEnergy(-2855.5, KILO_JOULE / MOL))]
+        ... )
+        >>> round(estimates[ETHANE].to_unit(KILO_JOULE / MOL).value, 2)
+        -84.71
+    """
+    return {
+        substance: MolarEnergy(value)
+        for substance, value in _estimate(
+            measurements, formation_enthalpy_value, MolarEnergy.default_units
+        ).items()
+    }
+
+
+def estimate_standard_formation_gibbs_energies(
+    measurements: Iterable[Measurement],
+) -> Dict[ChemicalSubstance, MolarEnergy]:
+    """
+    Estimate the standard formation Gibbs energies of the substances that have none
+    registered, from reactions with measured standard Gibbs energy changes.
+
+    See `estimate_standard_formation_enthalpies`.
+    """
+    return {
+        substance: MolarEnergy(value)
+        for substance, value in _estimate(
+            measurements, formation_gibbs_energy_value, MolarEnergy.default_units
+        ).items()
+    }
+
+
+def estimate_standard_entropies(
+    measurements: Iterable[Measurement],
+) -> Dict[ChemicalSubstance, Entropy]:
+    """
+    Estimate the standard entropies of the substances that have none registered,
+    from reactions with measured standard entropy changes.
+
+    See `estimate_standard_formation_enthalpies`.
+
+    Raises `PropertyValidationError` if an estimated entropy is negative, which
+    indicates inconsistent measurements.
+    """
+    return {
+        substance: Entropy(value)
+        for substance, value in _estimate(
+            measurements, entropy_value, Entropy.default_units
+        ).items()
+    }
+
+
+def _estimate(  # pylint: disable=too-many-locals
+    measurements: Iterable[Measurement],
+    known_value: Callable[[ChemicalSubstance], Optional[float]],
+    unit: Optional[UnitDescriptor],
+) -> Dict[ChemicalSubstance, float]:
+    columns: Dict[int, int] = {}
+    rows: List[Dict[int, Fraction]] = []
+    rhs: List[float] = []
+
+    for reaction, change in measurements:
+        value = (
+            change.value
+            if unit is None
+            else convert_value(change.value, change.unit, unit)
+        )
+        row: Dict[int, Fraction] = {}
+
+        stoichiometry = reaction.stoichiometry
+        for index, coefficient in zip(
+            stoichiometry.indices, stoichiometry.coefficients
+        ):
+            known = known_value(species_at(index))
+            if known is None:
+                column = columns.setdefault(index, len(columns))
+                row[column] = row.get(column, Fraction(0)) + coefficient
+            else:
+                value -= coefficient * known
+
+        rows.append(row)
+        rhs.append(value)
+
+    if not columns:
+        return {}
+
+    identifiable = _identifiable_columns(rows, len(columns))
+    solution = sparse_least_squares(
+        CSRMatrix.from_rows(
+            [{column: float(v) for column, v in row.items()} for row in rows],
+            len(columns),
+        ),
+        rhs,
+    )
+    return {
+        species_at(index): solution[column]
+        for index, column in columns.items()
+        if column in identifiable
+    }
+
+
+def _identifiable_columns(rows: List[Dict[int, Fraction]], n_columns: int) -> Set[int]:
+    """
+    The unknowns that the measurements determine uniquely. Unknown j is determined
+    if the unit vector e_j is in the row space of the system; other unknowns only
+    have a minimum-norm least squares value.
+
+    The rows are added one at a time to a sparse basis of the row space in reduced
+    row echelon form, with exact fractions; rows that are combinations of the basis
+    are dropped and the elimination stops once every unknown has a pivot, so the
+    cost follows the fill-in of the basis rather than the size of the system. j is
+    determined when its' basis row has no other entries.
+    """
+    basis: Dict[int, Dict[int, Fraction]] = {}
+    # per non-pivot column; the pivots of the basis rows that have an entry in it.
+    occurrences: Dict[int, Set[int]] = {}
+
+    for row in rows:
+        reduced = dict(row)
+        for column in [column for column in row if column in basis]:
+            _subtract(reduced, reduced.pop(column), basis[column], column)
+        if not reduced:
+            continue
+
+        pivot = min(reduced, key=lambda column: len(occurrences.get(column, ())))
+        scale = reduced[pivot]
+        pivot_row = {column: value / scale for column, value in reduced.items()}
+        for other in occurrences.pop(pivot, set()):
+            other_row = basis[other]
+            before = set(other_row)
+            _subtract(other_row, other_row.pop(pivot), pivot_row, pivot)
+            for column in before - set(other_row) - {pivot}:
+                occurrences[column].discard(other)
+            for column in set(other_row) - before:
+                occurrences.setdefault(column, set()).add(other)
+
+        basis[pivot] = pivot_row
+        for column in pivot_row:
+            if column != pivot:
+                occurrences.setdefault(column, set()).add(pivot)
+        if len(basis) == n_columns:
+            break
+
+    return {pivot for pivot, row in basis.items() if len(row) == 1}
+
+
+def _subtract(
+    row: Dict[int, Fraction],
+    factor: Fraction,
+    other: Dict[int, Fraction],
+    skip: int,
+) -> None:
+    """
+    row -= factor * other, in place and sparse, leaving out column `skip`.
+    """
+    for column, value in other.items():
+        if column == skip:
+            continue
+        difference = row.get(column, 0) - factor * value
+        if difference:
+            row[column] = difference
+        else:
+            row.pop(column, None)
@@ -0,0 +1,371 @@
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+from math import exp, log
+
+from chemical_utils.substances.substance import (
+    ChemicalSubstance,
+    ChemicalReactionOperand,
+)
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.reactions.equilibrium import (
+    EquilibriumConstantSweep,
+    GAS_CONSTANT,
+)
+from chemical_utils.numerics.linalg import CSRMatrix
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+# Standard pressure in Pa.
+STANDARD_PRESSURE = 1e5
+
+# per reaction; (species position, reaction order) pairs.
+_Orders = List[Tuple[int, float]]
+# per reaction; maps species positions to the (Jacobian data position,
+# stoichiometric coefficient) pairs that the derivatives of the rate of progress
+# with respect to the species' concentration contribute to.
+_JacobianTargets = List[Dict[int, List[Tuple[int, float]]]]
+
+
+@dataclass(frozen=True)
+class ArrheniusRate:
+    """
+    Modified Arrhenius rate constant expression k = A T^n exp(-Ea / (R T)).
+
+    The activation energy is in J/kmol (the default units of MolarEnergy); the units
+    of the pre-exponential factor follow from the reaction order, with concentrations
+    in kmol/m^3 and time in s.
+
+    Examples:
+        >>> rate = ArrheniusRate(1e10, 0.5, 8e7)
+        >>> round(rate.rate_constant(1000), 3)
+        20956096.53
+    """
+
+    pre_exponential_factor: float
+    temperature_exponent: float = 0.0
+    activation_energy: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.pre_exponential_factor <= 0:
+            raise ChemicalUtilsValueError(
+                f"invalid pre-exponential factor: {self.pre_exponential_factor}; "
+                "expected a positive number. "
+            )
+
+    def rate_constant(self, temperature: float) -> float:
+        """
+        Rate constant at the given temperature (in Kelvin).
+        """
+        return exp(
+            log(self.pre_exponential_factor)
+            + self.temperature_exponent * log(temperature)
+            - self.activation_energy / (GAS_CONSTANT * temperature)
+        )
+
+
+@dataclass(frozen=True)
+class ElementaryReaction:
+    """
+    A chemical reaction with mass action kinetics; the reaction orders are the
+    stoichiometric coefficients of the reactants (and of the products, for the
+    reverse reaction).
+
+    The rate constant of the reverse reaction of reversible reactions follows from
+    detailed balance, k_reverse = k_forward / Kc.
+    """
+
+    reaction: ChemicalReaction
+    rate: ArrheniusRate
+    reversible: bool = True
+
+
+class KineticMechanism:  # pylint: disable=too-many-instance-attributes
+    """
+    A set of elementary reactions whose rates are evaluated together.
+
+    The species of the mechanism are the substances taking part in its' reactions,
+    in order of appearance; concentration vectors (in kmol/m^3) and production rate
+    vectors (in kmol/m^3/s) follow this order. The logarithms of the pre-exponential
+    factors, the Arrhenius parameters, the reaction orders and the sparse
+    stoichiometric matrix are computed once, when the mechanism is created.
+
+    Equilibrium constants are computed from the standard thermochemistry of the
+    reactions (see `EquilibriumConstantSweep`) and converted to concentration units
+    assuming ideal gases, Kc = K (P0 / (R T))^dn.
+
+    Raises `ChemicalUtilsValueError` if the standard thermochemistry of a reversible
+    reaction is not known.
+
+    Examples:
+        >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+        >>> mechanism = KineticMechanism(
+        ...     [ElementaryReaction(WATER_GAS_SHIFT, ArrheniusRate(1e8, 0, 5e7))]
+        ... )
+        >>> mechanism.species
+        (<ChemicalCompound: CO>, <ChemicalCompound: H2O>, <ChemicalCompound: CO2>, <ChemicalCompound: H2>)
+        >>> [round(r, 3) for r in mechanism.production_rates([0.1, 0.1, 0.0, 0.0], 800)]
+        [-543.749, -543.749, 543.749, 543.749]
+    """
+
+    def __init__(self, reactions: Sequence[ElementaryReaction]) -> None:
+        self.reactions = list(reactions)
+
+        positions: Dict[ChemicalSubstance, int] = {}
+        for elementary in self.reactions:
+            for factor in list(elementary.reaction.reactants) + list(
+                elementary.reaction.products
+            ):
+                positions.setdefault(factor.substance, len(positions))
+        self.species: Tuple[ChemicalSubstance, ...] = tuple(positions)
+
+        species_rows = _species_rows(self.reactions, positions)
+        self.stoichiometric_matrix = CSRMatrix.from_rows(
+            species_rows, len(self.reactions)
+        )
+        self._forward_orders = [
+            _orders(r.reaction.reactants, positions) for r in self.reactions
+        ]
+        self._reverse_orders = [
+            _orders(r.reaction.products, positions) for r in self.reactions
+        ]
+        self._jacobian_indptr, self._jacobian_indices, self._jacobian_targets = (
+            _jacobian_pattern(species_rows, self._forward_orders, self._reverse_orders)
+        )
+
+        rates = [r.rate for r in self.reactions]
+        self._ln_pre_exponential_factors = [
+            log(rate.pre_exponential_factor) for rate in rates
+        ]
+        self._temperature_exponents = [rate.temperature_exponent for rate in rates]
+        self._activation_temperatures = [
+            rate.activation_energy / GAS_CONSTANT for rate in rates
+        ]
+
+        self._reversible = [i for i, r in enumerate(self.reactions) if r.reversible]
+        self._equilibrium = EquilibriumConstantSweep(
+            [self.reactions[i].reaction for i in self._reversible]
+        )
+        self._mole_changes = [
+            float(sum(self.reactions[i].reaction.stoichiometry.coefficients))
+            for i in self._reversible
+        ]
+        if self._reversible and None in self._equilibrium.ln_equilibrium_constants(
+            [_REFERENCE_TEMPERATURE]
+        ):
+            raise ChemicalUtilsValueError(
+                "cannot create kinetic mechanism; the standard thermochemistry of "
+                "every reversible reaction should be known. "
+            )
+
+    def rate_constants(self, temperature: float) -> Tuple[List[float], List[float]]:
+        """
+        Forward and reverse rate constants of the reactions at the given temperature
+        (in Kelvin); reverse rate constants of irreversible reactions are 0.
+        """
+        ln_t, inverse_t = log(temperature), 1 / temperature
+        forward = [
+            exp(ln_a + n * ln_t - t_a * inverse_t)
+            for ln_a, n, t_a in zip(
+                self._ln_pre_exponential_factors,
+                self._temperature_exponents,
+                self._activation_temperatures,
+            )
+        ]
+
+        reverse = [0.0] * len(forward)
+        if self._reversible:
+            ln_k = self._equilibrium.ln_equilibrium_constants([temperature])
+            ln_concentration = log(STANDARD_PRESSURE / (GAS_CONSTANT * temperature))
+            for i, row, mole_change in zip(self._reversible, ln_k, self._mole_changes):
+                # the rows of reversible reactions are known; see __init__.
+                ln_kc = row[0] + mole_change * ln_concentration  # type: ignore[index]
+                reverse[i] = forward[i] * exp(-ln_kc)
+
+        return forward, reverse
+
+    def rates_of_progress(
+        self, concentrations: Sequence[float], temperature: float
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Forward and reverse rates of progress of the reactions (in kmol/m^3/s) at the
+        given species concentrations and temperature.
+
+        Raises `ChemicalUtilsValueError` if the number of concentrations does not
+        match the number of species.
+        """
+        if len(concentrations) != len(self.species):
+            raise ChemicalUtilsValueError(
+                f"cannot evaluate the rates of {len(self.species)} species with "
+                f"{len(concentrations)} concentrations. "
+            )
+
+        forward_constants, reverse_constants = self.rate_constants(temperature)
+        forward = [
+            k * _mass_action(concentrations, orders)
+            for k, orders in zip(forward_constants, self._forward_orders)
+        ]
+        reverse = [
+            k * _mass_action(concentrations, orders) if k else 0.0
+            for k, orders in zip(reverse_constants, self._reverse_orders)
+        ]
+        return forward, reverse
+
+    def net_rates_of_progress(
+        self, concentrations: Sequence[float], temperature: float
+    ) -> List[float]:
+        """
+        Net (forward minus reverse) rates of progress of the reactions (in
+        kmol/m^3/s).
+        """
+        forward, reverse = self.rates_of_progress(concentrations, temperature)
+        return [f - r for f, r in zip(forward, reverse)]
+
+    def production_rates(
+        self, concentrations: Sequence[float], temperature: float
+    ) -> List[float]:
+        """
+        Net production rates of the species (in kmol/m^3/s); the product of the
+        stoichiometric matrix with the net rates of progress.
+        """
+        return self.stoichiometric_matrix.matvec(
+            self.net_rates_of_progress(concentrations, temperature)
+        )
+
+    def production_rate_jacobian(  # pylint: disable=too-many-locals
+        self, concentrations: Sequence[float], temperature: float
+    ) -> CSRMatrix:
+        """
+        Jacobian of the production rates with respect to the concentrations (in
+        1/s); row i holds the derivatives of the production rate of species i.
+
+        The sparsity pattern (species coupled through a common reaction) is
+        computed once, when the mechanism is created; all Jacobians of a mechanism
+        share it, including structural zeros.
+        """
+        if len(concentrations) != len(self.species):
+            raise ChemicalUtilsValueError(
+                f"cannot evaluate the rates of {len(self.species)} species with "
+                f"{len(concentrations)} concentrations. "
+            )
+
+        forward_constants, reverse_constants = self.rate_constants(temperature)
+        data = [0.0] * len(self._jacobian_indices)
+        for reaction_constants, orders_per_reaction, sign in (
+            (forward_constants, self._forward_orders, 1.0),
+            (reverse_constants, self._reverse_orders, -1.0),
+        ):
+            for k, orders, targets in zip(
+                reaction_constants, orders_per_reaction, self._jacobian_targets
+            ):
+                if not k:
+                    continue
+                for position, _ in orders:
+                    derivative = (
+                        sign
+                        * k
+                        * _mass_action_derivative(concentrations, orders, position)
+                    )
+                    for data_position, coefficient in targets[position]:
+                        data[data_position] += coefficient * derivative
+
+        return CSRMatrix(
+            (len(self.species), len(self.species)),
+            self._jacobian_indptr,
+            self._jacobian_indices,
+            tuple(data),
+        )
+
+
+_REFERENCE_TEMPERATURE = 298.15
+
+
+def _species_rows(
+    reactions: Sequence[ElementaryReaction], positions: Dict[ChemicalSubstance, int]
+) -> List[Dict[int, float]]:
+    rows: List[Dict[int, float]] = [{} for _ in positions]
+    for column, elementary in enumerate(reactions):
+        stoichiometry = elementary.reaction.stoichiometry
+        for substance, coefficient in zip(
+            stoichiometry.species, stoichiometry.coefficients
+        ):
+            rows[positions[substance]][column] = float(coefficient)
+    return rows
+
+
+def _orders(
+    operand: ChemicalReactionOperand, positions: Dict[ChemicalSubstance, int]
+) -> _Orders:
+    orders: Dict[int, float] = {}
+    for factor in operand:
+        position = positions[factor.substance]
+        orders[position] = orders.get(position, 0) + factor.stoichiometric_coefficient
+    return [
+        (position, int(order) if float(order).is_integer() else float(order))
+        for position, order in orders.items()
+    ]
+
+
+def _jacobian_pattern(
+    species_rows: List[Dict[int, float]],
+    forward_orders: List[_Orders],
+    reverse_orders: List[_Orders],
+) -> Tuple[Tuple[int, ...], Tuple[int, ...], _JacobianTargets]:
+    columns: List[List[Tuple[int, float]]] = [[] for _ in forward_orders]
+    for i, row in enumerate(species_rows):
+        for j, coefficient in row.items():
+            columns[j].append((i, coefficient))
+
+    entries = sorted(
+        {
+            (i, position)
+            for j, column in enumerate(columns)
+            for i, _ in column
+            for position, _ in forward_orders[j] + reverse_orders[j]
+        }
+    )
+    data_positions = {entry: p for p, entry in enumerate(entries)}
+
+    indptr = [0] * (len(species_rows) + 1)
+    for i, _ in entries:
+        indptr[i + 1] += 1
+    for i in range(len(species_rows)):
+        indptr[i + 1] += indptr[i]
+
+    targets: _JacobianTargets = [
+        {
+            position: [(data_positions[(i, position)], c) for i, c in column]
+            for position, _ in forward_orders[j] + reverse_orders[j]
+        }
+        for j, column in enumerate(columns)
+    ]
+    return tuple(indptr), tuple(k for _, k in entries), targets
+
+
+def _mass_action(concentrations: Sequence[float], orders: _Orders) -> float:
+    product = 1.0
+    for position, order in orders:
+        product *= _power(concentrations[position], order)
+    return product
+
+
+def _mass_action_derivative(
+    concentrations: Sequence[float], orders: _Orders, wrt: int
+) -> float:
+    product = 1.0
+    for position, order in orders:
+        concentration = concentrations[position]
+        if position != wrt:
+            product *= _power(concentration, order)
+        elif order < 1 and concentration <= 0:
+            # the derivative is unbounded; leave it out of the Jacobian.
+            return 0.0
+        else:
+            product *= order * _power(concentration, order - 1)
+    return product
+
+
+def _power(concentration: float, order: float) -> float:
+    if isinstance(order, int):
+        return concentration**order
+    # fractional orders of small negative concentrations, e.g. from integration
+    # round-off, would be complex.
+    return max(concentration, 0.0) ** order
@@ -1,19 +1,44 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Callable, Dict, Iterable, List, Sequence, Tuple, Union
+from fractions import Fraction
 from functools import cached_property
 
-from typing_extensions import Counter
+from property_utils.units.descriptors import UnitDescriptor
 
 from chemical_utils.substances.substance import (
     ChemicalReactionOperand,
     ChemicalElement,
-    ChemicalElementTuple,
-    ChemicalCompound,
     ChemicalReactionFactor,
+    ChemicalSubstance,
+    Coefficient,
+    stoichiometric_coefficient,
+    SUBSTANCE_TYPES,
+)
+from chemical_utils.substances.species import species_composition, species_at
+from chemical_utils.reactions.stoichiometry import (
+    ReactionStoichiometry,
+    stoichiometry_of,
+    ReactionKey,
+    reaction_key,
+)
+from chemical_utils.exceptions.base import (
+    ChemicalUtilsTypeError,
+    ChemicalUtilsValueError,
 )
-from chemical_utils.exceptions.base import ChemicalUtilsTypeError
 from chemical_utils.exceptions.reactions.reaction import UnbalancedChemicalReactionError
-from chemical_utils.properties.properties import MolarEnergy, Entropy
+from chemical_utils.properties.properties import (
+    MolarEnergy,
+    EntropyChange,
+    convert_value,
+    default_units_value,
+)
+from chemical_utils.properties.registry import (
+    registry_cached_property,
+    without_registry_cache,
+)
+from chemical_utils.instrumentation.instrumentation import instrumented
+
+CHARGE = "charge"
 
 
 def r(
@@ -30,6 +55,121 @@ def r(
     return ChemicalReaction(reactants, products)
 
 
+def is_balanced(
+    reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
+) -> bool:
+    """
+    Check whether a reaction of the given reactants and products would be balanced,
+    without creating it or raising an exception if it is not.
+
+    Raises `ChemicalUtilsTypeError` if the reactants or products are not chemical
+    substances or sums of chemical substances.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> is_balanced(CARBON_MONOXIDE + OXYGEN2, CARBON_DIOXIDE)
+        False
+    """
+    return not _imbalance(
+        _as_operand(reactants, "reactants"), _as_operand(products, "products")
+    )
+
+
+def balanced_mask(
+    candidates: Iterable[Tuple[ChemicalReactionOperand, ChemicalReactionOperand]],
+) -> List[bool]:
+    """
+    Check many (reactants, products) candidates at once; see `is_balanced`. Returns
+    one boolean per candidate, in order.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> balanced_mask([
+        ...     (CARBON_MONOXIDE + OXYGEN2, CARBON_DIOXIDE),
+        ...     (CARBON_MONOXIDE + WATER, CARBON_DIOXIDE + HYDROGEN2),
+        ... ])
+        [False, True]
+    """
+    return [is_balanced(reactants, products) for reactants, products in candidates]
+
+
+def element_imbalance(
+    reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
+) -> Dict[Union[ChemicalElement, str], Coefficient]:
+    """
+    Atoms of each element, and the charge (keyed by `CHARGE`), on the product side
+    minus the reactant side. Only non-zero differences are included, so a balanced
+    reaction has an empty imbalance.
+
+    Raises `ChemicalUtilsTypeError` if the reactants or products are not chemical
+    substances or sums of chemical substances.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> element_imbalance(CARBON_MONOXIDE + OXYGEN2, CARBON_DIOXIDE)
+        {<ChemicalElement: O>: -1}
+    """
+    return _imbalance(
+        _as_operand(reactants, "reactants"), _as_operand(products, "products")
+    )
+
+
+def combine_reactions(
+    reactions: Sequence["ChemicalReaction"],
+    coefficients: Sequence[Union[int, float, Fraction]],
+) -> "ChemicalReaction":
+    """
+    Create the linear combination of the given reactions, e.g. for Hess's law
+    calculations. Substances present on both sides of the result cancel out.
+
+    The work is proportional to the number of distinct substances; standard
+    thermochemical values that are known for all reactions are combined directly.
+
+    Raises `ChemicalUtilsValueError` if the number of coefficients does not match the
+    number of reactions, a coefficient is zero or all substances cancel out.
+
+    Examples:
+        >>> from property_utils.units import KILO_JOULE, MOL
+        >>> from chemical_utils.reactions.constants import *
+        >>> reaction = combine_reactions([STEAM_METHANE_REFORMING, WATER_GAS_SHIFT], [1, 1])
+        >>> reaction.stoichiometry.as_dict()[HYDROGEN2]
+        4
+        >>> round(reaction.standard_enthalpy_change_value(KILO_JOULE / MOL), 3)
+        164.638
+    """
+    if len(reactions) != len(coefficients):
+        raise ChemicalUtilsValueError(
+            f"cannot combine {len(reactions)} reactions with {len(coefficients)} "
+            "coefficients. "
+        )
+
+    scales = [_signed_coefficient(coefficient) for coefficient in coefficients]
+
+    net: Dict[int, Coefficient] = {}
+    for reaction, scale in zip(reactions, scales):
+        stoichiometry = reaction.stoichiometry
+        for index, coefficient in zip(
+            stoichiometry.indices, stoichiometry.coefficients
+        ):
+            net[index] = net.get(index, 0) + scale * coefficient
+
+    # pylint: disable-next=protected-access
+    combined = ChemicalReaction._from_net_coefficients(net)
+
+    changes = [_standard_change_values(reaction) for reaction in reactions]
+    for name in STANDARD_CHANGE_VALUES:
+        total = 0.0
+        for scale, change in zip(scales, changes):
+            value = change[name]
+            if value is None:
+                break
+            total += scale * value
+        else:
+            seed_standard_change(combined, name, total)
+
+    return combined
+
+
 @dataclass(frozen=True)
 class ChemicalReaction:
     """
@@ -41,152 +181,512 @@ class ChemicalReaction:
     reactants: ChemicalReactionOperand
     products: ChemicalReactionOperand
 
+    @instrumented("ChemicalReaction.__post_init__")
     def __post_init__(self) -> None:
         self._parse_reactants()
         self._parse_products()
 
         if not self._is_balanced(self.reactants, self.products):
-            raise UnbalancedChemicalReactionError(
-                f"{self} is not balanced; the number of atoms of each species on the "
-                "left side should equal the number of atoms of that species on the "
-                "right side. "
-            )
+            raise unbalanced_reaction_error(self)
 
-    @cached_property
+    @classmethod
+    def try_create(
+        cls, reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
+    ) -> Optional["ChemicalReaction"]:
+        """
+        Create a chemical reaction, or return None if it is not balanced. Unlike the
+        constructor, no exception (or error message) is created for unbalanced
+        reactions; see `element_imbalance` for what is missing.
+
+        Raises `ChemicalUtilsTypeError` if the reactants or products are not chemical
+        substances or sums of chemical substances.
+
+        Examples:
+            >>> from chemical_utils.substances import *
+            >>> ChemicalReaction.try_create(CARBON_MONOXIDE + OXYGEN2, CARBON_DIOXIDE)
+            >>> ChemicalReaction.try_create(2*CARBON_MONOXIDE + OXYGEN2, 2*CARBON_DIOXIDE)
+            <ChemicalReaction: 2CO + O2 -> 2CO2>
+        """
+        _reactants = _as_operand(reactants, "reactants")
+        _products = _as_operand(products, "products")
+        if _imbalance(_reactants, _products):
+            return None
+        return cls._from_balanced(_reactants, _products)
+
+    @registry_cached_property
+    @instrumented("ChemicalReaction.standard_enthalpy_change")
     def standard_enthalpy_change(self) -> Optional[MolarEnergy]:
         """
         Enthalpy change of reaction at standard conditions (25 Celcius, 1 bar).
         """
-        diff = MolarEnergy(0)
-
-        for factor in self.products:
-            if factor.substance.standard_formation_properties is None:
-                return None
+        value = self._standard_enthalpy_change_value
+        return None if value is None else MolarEnergy(value)
 
-            diff += (
-                factor.stoichiometric_coefficient
-                * factor.substance.standard_formation_properties.enthalpy
-            )
+    @registry_cached_property
+    @instrumented("ChemicalReaction.standard_gibbs_energy_change")
+    def standard_gibbs_energy_change(self) -> Optional[MolarEnergy]:
+        """
+        Gibbs energy change of reaction at standard conditions (25 Celcius, 1 bar).
+        """
+        value = self._standard_gibbs_energy_change_value
+        return None if value is None else MolarEnergy(value)
 
-        for factor in self.reactants:
-            if factor.substance.standard_formation_properties is None:
-                return None
+    @registry_cached_property
+    @instrumented("ChemicalReaction.standard_entropy_change")
+    def standard_entropy_change(self) -> Optional[EntropyChange]:
+        """
+        Entropy change of reaction at standard conditions (25 Celcius, 1 bar); it is
+        negative for reactions that decrease the entropy.
 
-            diff -= (
-                factor.stoichiometric_coefficient
-                * factor.substance.standard_formation_properties.enthalpy
-            )
+        Examples:
+            >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+            >>> WATER_GAS_SHIFT.standard_entropy_change
+            <EntropyChange: -42032.0 J / K / kmol>
+        """
+        value = self._standard_entropy_change_value
+        return None if value is None else EntropyChange(value)
 
-        return diff
+    @cached_property
+    def stoichiometry(self) -> ReactionStoichiometry:
+        """
+        Signed stoichiometry of the reaction; products have positive and reactants
+        negative coefficients.
+
+        Examples:
+            >>> from chemical_utils.substances import *
+            >>> reaction = r(2*CARBON_MONOXIDE + OXYGEN2, 2*CARBON_DIOXIDE)
+            >>> coefficients = reaction.stoichiometry.as_dict()
+            >>> coefficients[CARBON_MONOXIDE], coefficients[CARBON_DIOXIDE]
+            (-2, 2)
+        """
+        return stoichiometry_of(self.reactants, self.products)
 
     @cached_property
-    def standard_gibbs_energy_change(self) -> Optional[MolarEnergy]:
+    def canonical_key(self) -> ReactionKey:
         """
-        Gibbs energy change of reaction at standard conditions (25 Celcius, 1 bar).
+        Hashable key of the reaction that does not depend on the order of the
+        reactants and products; the stoichiometry of the reactants and of the
+        products (see `reaction_key`). Reactions with equal reactants and products
+        have equal keys, while reactions with the same net stoichiometry but a
+        different substance on both sides (e.g. a catalyst) do not.
+
+        Examples:
+            >>> from chemical_utils.substances import *
+            >>> a = r(CARBON_MONOXIDE + WATER, CARBON_DIOXIDE + HYDROGEN2)
+            >>> b = r(WATER + CARBON_MONOXIDE, HYDROGEN2 + CARBON_DIOXIDE)
+            >>> a == b, a.canonical_key == b.canonical_key
+            (False, True)
         """
-        diff = MolarEnergy(0)
+        return reaction_key(self.reactants, self.products)
 
-        for factor in self.products:
-            if factor.substance.standard_formation_properties is None:
-                return None
+    def reverse(self) -> "ChemicalReaction":
+        """
+        Create the reverse reaction; reactants become products and vice versa.
 
-            diff += (
-                factor.stoichiometric_coefficient
-                * factor.substance.standard_formation_properties.gibbs_energy
-            )
+        Examples:
+            >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+            >>> WATER_GAS_SHIFT.reverse()
+            <ChemicalReaction: CO2 + H2 -> CO + H2O>
+        """
+        reverse = self._from_balanced(self.products, self.reactants)
+
+        stoichiometry = self.stoichiometry
+        reverse.__dict__["stoichiometry"] = ReactionStoichiometry(
+            stoichiometry.indices, tuple(-c for c in stoichiometry.coefficients)
+        )
+        for name, value in _standard_change_values(self).items():
+            if value is not None:
+                seed_standard_change(reverse, name, -value)
 
-        for factor in self.reactants:
-            if factor.substance.standard_formation_properties is None:
-                return None
+        return reverse
 
-            diff -= (
-                factor.stoichiometric_coefficient
-                * factor.substance.standard_formation_properties.gibbs_energy
+    def per_mole_of(self, substance: ChemicalSubstance) -> "ChemicalReaction":
+        """
+        Scale the reaction so that the given substance has a stoichiometric
+        coefficient of 1. Coefficients become exact fractions where needed; the
+        balance is preserved, so it is not validated again.
+
+        Raises `ChemicalUtilsValueError` if the substance does not take part in the
+        reaction.
+
+        Examples:
+            >>> from chemical_utils.substances import *
+            >>> r(2*CARBON_MONOXIDE + OXYGEN2, 2*CARBON_DIOXIDE).per_mole_of(CARBON_MONOXIDE)
+            <ChemicalReaction: CO + 1/2O2 -> CO2>
+        """
+        coefficient = self.stoichiometry.as_dict().get(substance)
+        if coefficient is None:
+            raise ChemicalUtilsValueError(
+                f"cannot scale {self} per mole of {substance}; {substance} does not "
+                "take part in the reaction. "
             )
 
-        return diff
+        scale = 1 / abs(Fraction(coefficient))
+        return self._from_balanced(
+            self._scaled(self.reactants, scale), self._scaled(self.products, scale)
+        )
 
-    @cached_property
-    def standard_entropy_change(self) -> Optional[Entropy]:
+    def standard_enthalpy_change_value(
+        self, unit: Optional[UnitDescriptor] = None
+    ) -> Optional[float]:
         """
-        Entropy change of reaction at standard conditions (25 Celcius, 1 bar).
+        Numeric value of the enthalpy change of reaction at standard conditions
+        (25 Celcius, 1 bar) in the given units; defaults to MolarEnergy default units.
+
+        The change is computed with plain float arithmetic and converted to the
+        requested units once.
+
+        Examples:
+            >>> from property_utils.units import KILO_JOULE, MOL
+            >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+            >>> round(WATER_GAS_SHIFT.standard_enthalpy_change_value(KILO_JOULE / MOL), 3)
+            -41.166
         """
-        diff = Entropy(0)
+        return self._to_unit(
+            self._standard_enthalpy_change_value, MolarEnergy.default_units, unit
+        )
 
-        for factor in self.products:
-            if factor.substance.standard_entropy is None:
-                return None
+    def standard_gibbs_energy_change_value(
+        self, unit: Optional[UnitDescriptor] = None
+    ) -> Optional[float]:
+        """
+        Numeric value of the Gibbs energy change of reaction at standard conditions
+        (25 Celcius, 1 bar) in the given units; defaults to MolarEnergy default units.
+        """
+        return self._to_unit(
+            self._standard_gibbs_energy_change_value, MolarEnergy.default_units, unit
+        )
 
-            diff += (
-                factor.stoichiometric_coefficient * factor.substance.standard_entropy
-            )
+    def standard_entropy_change_value(
+        self, unit: Optional[UnitDescriptor] = None
+    ) -> Optional[float]:
+        """
+        Numeric value of the entropy change of reaction at standard conditions
+        (25 Celcius, 1 bar) in the given units; defaults to EntropyChange default
+        units.
+        """
+        return self._to_unit(
+            self._standard_entropy_change_value, EntropyChange.default_units, unit
+        )
 
-        for factor in self.reactants:
-            if factor.substance.standard_entropy is None:
-                return None
+    @registry_cached_property
+    def _standard_enthalpy_change_value(self) -> Optional[float]:
+        return standard_change(self.stoichiometry, formation_enthalpy_value)
 
-            diff -= (
-                factor.stoichiometric_coefficient * factor.substance.standard_entropy
-            )
+    @registry_cached_property
+    def _standard_gibbs_energy_change_value(self) -> Optional[float]:
+        return standard_change(self.stoichiometry, formation_gibbs_energy_value)
 
-        return diff
+    @registry_cached_property
+    def _standard_entropy_change_value(self) -> Optional[float]:
+        return standard_change(self.stoichiometry, entropy_value)
+
+    @staticmethod
+    def _to_unit(
+        value: Optional[float],
+        default_unit: Optional[UnitDescriptor],
+        unit: Optional[UnitDescriptor],
+    ) -> Optional[float]:
+        if value is None or unit is None or default_unit is None:
+            return value
+        return convert_value(value, default_unit, unit)
 
     def _parse_reactants(self):
-        if isinstance(
-            self.reactants, (ChemicalElement, ChemicalElementTuple, ChemicalCompound)
-        ):
-            object.__setattr__(
-                self, "reactants", ChemicalReactionOperand([1 * self.reactants])
-            )
+        object.__setattr__(self, "reactants", _as_operand(self.reactants, "reactants"))
 
-        elif isinstance(self.reactants, ChemicalReactionFactor):
-            object.__setattr__(
-                self, "reactants", ChemicalReactionOperand([self.reactants])
-            )
+    def _parse_products(self):
+        object.__setattr__(self, "products", _as_operand(self.products, "products"))
 
-        if not isinstance(self.reactants, ChemicalReactionOperand):
-            raise ChemicalUtilsTypeError(
-                f"cannot create chemical reaction with reactants: {self.reactants}; "
-                "expected a chemical substance or a sum of chemical substances. "
+    @classmethod
+    def _from_net_coefficients(cls, net: Dict[int, Coefficient]) -> "ChemicalReaction":
+        """
+        Create a reaction from balanced net coefficients keyed by species index.
+        """
+        indices = tuple(
+            sorted(index for index, coefficient in net.items() if coefficient)
+        )
+        if not indices:
+            raise ChemicalUtilsValueError(
+                "cannot create chemical reaction; all substances cancel out. "
             )
 
-    def _parse_products(self):
-        if isinstance(
-            self.products, (ChemicalElement, ChemicalElementTuple, ChemicalCompound)
-        ):
-            object.__setattr__(
-                self, "products", ChemicalReactionOperand([1 * self.products])
+        reactants: List[ChemicalReactionFactor] = []
+        products: List[ChemicalReactionFactor] = []
+        for index in indices:
+            coefficient = net[index]
+            factor = ChemicalReactionFactor(
+                species_at(index),
+                stoichiometric_coefficient(
+                    coefficient if coefficient > 0 else -coefficient
+                ),
             )
+            (products if coefficient > 0 else reactants).append(factor)
 
-        elif isinstance(self.products, ChemicalReactionFactor):
-            object.__setattr__(
-                self, "products", ChemicalReactionOperand([self.products])
-            )
+        reaction = cls._from_balanced(
+            ChemicalReactionOperand(reactants), ChemicalReactionOperand(products)
+        )
+        reaction.__dict__["stoichiometry"] = ReactionStoichiometry(
+            indices, tuple(net[index] for index in indices)
+        )
+        return reaction
 
-        if not isinstance(self.products, ChemicalReactionOperand):
-            raise ChemicalUtilsTypeError(
-                f"cannot create chemical reaction with products: {self.products}; "
-                "expected a chemical substance or a sum of chemical substances. "
-            )
+    @staticmethod
+    def _scaled(
+        operand: ChemicalReactionOperand, scale: Fraction
+    ) -> ChemicalReactionOperand:
+        return ChemicalReactionOperand(
+            [
+                ChemicalReactionFactor(
+                    factor.substance,
+                    stoichiometric_coefficient(
+                        factor.stoichiometric_coefficient * scale
+                    ),
+                )
+                for factor in operand
+            ]
+        )
+
+    @classmethod
+    def _from_balanced(
+        cls, reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
+    ) -> "ChemicalReaction":
+        """
+        Create a reaction from operands whose balance has already been validated.
+        """
+        reaction = object.__new__(cls)
+        object.__setattr__(reaction, "reactants", reactants)
+        object.__setattr__(reaction, "products", products)
+        return reaction
 
     @classmethod
     def _is_balanced(
         cls, reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
     ) -> bool:
+        if _net_charge(reactants) != _net_charge(products):
+            return False
         return cls._count_elements(reactants) == cls._count_elements(products)
 
     @staticmethod
-    def _count_elements(operand: ChemicalReactionOperand) -> Counter[ChemicalElement]:
-        return Counter(
-            [
-                element
-                for factor in operand
-                for element in factor.stoichiometric_elements()
-            ]
-        )
+    @instrumented("ChemicalReaction._count_elements")
+    def _count_elements(
+        operand: ChemicalReactionOperand,
+    ) -> Dict[ChemicalElement, Coefficient]:
+        counts: Dict[ChemicalElement, Coefficient] = {}
+        for factor in operand:
+            coefficient = factor.stoichiometric_coefficient
+            for element, atoms in species_composition(factor.substance).items():
+                counts[element] = counts.get(element, 0) + coefficient * atoms
+        return counts
+
+    def __add__(self, other: "ChemicalReaction") -> "ChemicalReaction":
+        """
+        Defines addition between chemical reactions; see `combine_reactions`.
+        """
+        if not isinstance(other, ChemicalReaction):
+            raise ChemicalUtilsTypeError(
+                f"cannot add {other} to {self}; expected a ChemicalReaction. "
+            )
+        return combine_reactions([self, other], [1, 1])
+
+    def __radd__(self, other: "ChemicalReaction") -> "ChemicalReaction":
+        """
+        Defines right addition between chemical reactions. Adding a reaction to 0
+        returns the reaction, so that `sum` can be used on reactions.
+        """
+        if isinstance(other, int) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other: "ChemicalReaction") -> "ChemicalReaction":
+        """
+        Defines subtraction between chemical reactions; see `combine_reactions`.
+
+        Examples:
+            >>> from chemical_utils.reactions.constants import *
+            >>> reaction = STEAM_METHANE_REFORMING - WATER_GAS_SHIFT
+            >>> reaction.stoichiometry.as_dict()[CARBON_DIOXIDE]
+            -1
+        """
+        if not isinstance(other, ChemicalReaction):
+            raise ChemicalUtilsTypeError(
+                f"cannot subtract {other} from {self}; expected a ChemicalReaction. "
+            )
+        return combine_reactions([self, other], [1, -1])
+
+    def __mul__(self, scale: Union[int, float, Fraction]) -> "ChemicalReaction":
+        """
+        Defines multiplication between chemical reactions and non-zero numbers; a
+        negative number also reverses the reaction.
+        """
+        return combine_reactions([self], [scale])
+
+    def __rmul__(self, scale: Union[int, float, Fraction]) -> "ChemicalReaction":
+        """
+        Defines right multiplication between non-zero numbers and chemical reactions.
+        """
+        return self.__mul__(scale)
+
+    def __neg__(self) -> "ChemicalReaction":
+        return self.reverse()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # cached values are recomputed on access; the stoichiometry holds species
+        # indices and the registry cache registry versions, which are only
+        # meaningful within this process.
+        state = without_registry_cache(self.__dict__)
+        state.pop("stoichiometry", None)
+        state.pop("canonical_key", None)
+        state.pop("_string", None)
+        return state
+
+    @cached_property
+    def _string(self) -> str:
+        return f"{self.reactants} -> {self.products}"
 
     def __repr__(self) -> str:
-        return f"<ChemicalReaction: {str(self)}>"
+        return f"<ChemicalReaction: {self._string}>"
 
     def __str__(self) -> str:
-        return f"{self.reactants} -> {self.products}"
+        return self._string
+
+
+def seed_standard_change(reaction: ChemicalReaction, name: str, value: float) -> None:
+    """
+    Cache `value` as the standard change `name` (one of `STANDARD_CHANGE_VALUES`)
+    of the reaction, e.g. when it is known without the substance properties.
+    """
+    descriptor: registry_cached_property = vars(ChemicalReaction)[name]
+    descriptor.seed(reaction, value)
+
+
+def is_standard_change_cached(reaction: ChemicalReaction, name: str) -> bool:
+    """
+    Whether the standard change `name` (one of `STANDARD_CHANGE_VALUES`) of the
+    reaction is cached for the current state of the property registry.
+    """
+    descriptor: registry_cached_property = vars(ChemicalReaction)[name]
+    return descriptor.is_cached(reaction)
+
+
+def unbalanced_reaction_error(reaction) -> UnbalancedChemicalReactionError:
+    """
+    The error raised for an unbalanced reaction, given the reaction or its' string.
+    """
+    return UnbalancedChemicalReactionError(
+        f"{reaction} is not balanced; the number of atoms of each species on the "
+        "left side should equal the number of atoms of that species on the "
+        "right side and the total charge of both sides should be equal. "
+    )
+
+
+def standard_change(
+    stoichiometry: ReactionStoichiometry,
+    substance_value: Callable[[ChemicalSubstance], Optional[float]],
+) -> Optional[float]:
+    """
+    Change of a standard property over a reaction, given the value of the property
+    for each substance (in default units); None if a value is unknown.
+    """
+    diff = 0.0
+    for substance, coefficient in zip(
+        stoichiometry.species, stoichiometry.coefficients
+    ):
+        value = substance_value(substance)
+        if value is None:
+            return None
+
+        diff += coefficient * value
+
+    return diff
+
+
+def formation_enthalpy_value(substance: ChemicalSubstance) -> Optional[float]:
+    """
+    Standard formation enthalpy of a substance in default units; None if unknown.
+    """
+    properties = substance.standard_formation_properties
+    return None if properties is None else default_units_value(properties.enthalpy)
+
+
+def formation_gibbs_energy_value(substance: ChemicalSubstance) -> Optional[float]:
+    """
+    Standard formation Gibbs energy of a substance in default units; None if
+    unknown.
+    """
+    properties = substance.standard_formation_properties
+    return None if properties is None else default_units_value(properties.gibbs_energy)
+
+
+def entropy_value(substance: ChemicalSubstance) -> Optional[float]:
+    """
+    Standard entropy of a substance in default units; None if unknown.
+    """
+    entropy = substance.standard_entropy
+    return None if entropy is None else default_units_value(entropy)
+
+
+STANDARD_CHANGE_VALUES = (
+    "_standard_enthalpy_change_value",
+    "_standard_gibbs_energy_change_value",
+    "_standard_entropy_change_value",
+)
+"""
+Names of the cached standard changes of a reaction, as plain floats in default
+units.
+"""
+
+SUBSTANCE_VALUES: Tuple[Callable[[ChemicalSubstance], Optional[float]], ...] = (
+    formation_enthalpy_value,
+    formation_gibbs_energy_value,
+    entropy_value,
+)
+"""
+The substance values of each standard change, in the order of
+`STANDARD_CHANGE_VALUES`.
+"""
+
+
+def _standard_change_values(reaction: ChemicalReaction) -> Dict[str, Optional[float]]:
+    return {name: getattr(reaction, name) for name in STANDARD_CHANGE_VALUES}
+
+
+def _as_operand(value, side: str) -> ChemicalReactionOperand:
+    if isinstance(value, SUBSTANCE_TYPES):
+        return ChemicalReactionOperand([1 * value])
+    if isinstance(value, ChemicalReactionFactor):
+        return ChemicalReactionOperand([value])
+    if not isinstance(value, ChemicalReactionOperand):
+        raise ChemicalUtilsTypeError(
+            f"cannot create chemical reaction with {side}: {value}; "
+            "expected a chemical substance or a sum of chemical substances. "
+        )
+    return value
+
+
+def _imbalance(
+    reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
+) -> Dict[Union[ChemicalElement, str], Coefficient]:
+    imbalance: Dict[Union[ChemicalElement, str], Coefficient] = {}
+    charge: Coefficient = 0
+    for sign, operand in ((-1, reactants), (1, products)):
+        for factor in operand:
+            coefficient = sign * factor.stoichiometric_coefficient
+            charge += coefficient * factor.substance.charge
+            for element, atoms in species_composition(factor.substance).items():
+                imbalance[element] = imbalance.get(element, 0) + coefficient * atoms
+    imbalance[CHARGE] = charge
+    return {key: value for key, value in imbalance.items() if value}
+
+
+def _signed_coefficient(value: Union[int, float, Fraction]) -> Coefficient:
+    if isinstance(value, (int, float, Fraction)) and not isinstance(value, bool):
+        if value < 0:
+            return -stoichiometric_coefficient(-value, "ChemicalReaction")
+    return stoichiometric_coefficient(value, "ChemicalReaction")
+
+
+def _net_charge(operand: ChemicalReactionOperand) -> Coefficient:
+    charge: Coefficient = 0
+    for factor in operand:
+        charge += factor.stoichiometric_coefficient * factor.substance.charge
+    return charge
@@ -0,0 +1,248 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+from concurrent.futures import Executor
+
+from chemical_utils.reactions.kinetics import KineticMechanism
+from chemical_utils.numerics.linalg import CSRMatrix
+from chemical_utils.numerics.ode import ODESolution, solve_bdf
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+
+@dataclass(frozen=True)
+class ReactorConditions:
+    """
+    Operating conditions of a batch reactor; the temperature (in Kelvin) and the
+    initial concentrations of the species of the mechanism (in kmol/m^3).
+    """
+
+    temperature: float
+    concentrations: Sequence[float]
+
+
+class BatchReactor:
+    """
+    Isothermal, isobaric, ideal gas batch reactor.
+
+    At constant temperature and pressure the total concentration of the gas is
+    constant, so the volume changes with the number of moles:
+
+        d[C]/dt = w - [C] sum(w) / C_total
+
+    where w are the production rates of the mechanism. If no reaction of the
+    mechanism changes the number of moles the second term vanishes and the reactor
+    also has constant volume.
+
+    The analytic Jacobian is assembled from the Jacobian of the production rates
+    (see `KineticMechanism.production_rate_jacobian`) in a sparsity pattern that is
+    computed once, when the reactor is created, so all Jacobians of a reactor share
+    it and its' iteration matrices are analyzed once (see `solve_bdf`).
+
+    Examples:
+        >>> from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+        >>> from chemical_utils.reactions.kinetics import ArrheniusRate, ElementaryReaction
+        >>> mechanism = KineticMechanism(
+        ...     [ElementaryReaction(WATER_GAS_SHIFT, ArrheniusRate(1e8, 0, 5e7))]
+        ... )
+        >>> reactor = BatchReactor(mechanism, 800, 0.2)
+        >>> [round(c, 4) for c in reactor.simulate([0.1, 0.1, 0.0, 0.0], [0, 10]).y[-1]]
+        [0.0362, 0.0362, 0.0638, 0.0638]
+    """
+
+    def __init__(
+        self,
+        mechanism: KineticMechanism,
+        temperature: float,
+        total_concentration: float,
+    ) -> None:
+        if total_concentration <= 0:
+            raise ChemicalUtilsValueError(
+                f"invalid total concentration: {total_concentration}; expected a "
+                "positive number. "
+            )
+        self.mechanism = mechanism
+        self.temperature = temperature
+        self.total_concentration = total_concentration
+        # per reaction; the change of the number of moles.
+        self._mole_changes = mechanism.stoichiometric_matrix.rmatvec(
+            [1.0] * len(mechanism.species)
+        )
+        self._constant_volume = not any(self._mole_changes)
+        self._pattern = (
+            None
+            if self._constant_volume
+            else _JacobianPattern.create(mechanism, temperature)
+        )
+
+    def rhs(self, _: float, concentrations: List[float]) -> List[float]:
+        """
+        Time derivatives of the concentrations (in kmol/m^3/s).
+        """
+        net_rates = self.mechanism.net_rates_of_progress(
+            concentrations, self.temperature
+        )
+        production_rates = self.mechanism.stoichiometric_matrix.matvec(net_rates)
+        if self._constant_volume:
+            return production_rates
+
+        dilution = (
+            sum(d * q for d, q in zip(self._mole_changes, net_rates))
+            / self.total_concentration
+        )
+        return [w - c * dilution for w, c in zip(production_rates, concentrations)]
+
+    def jacobian(self, _: float, concentrations: List[float]) -> CSRMatrix:
+        """
+        Jacobian of `rhs` with respect to the concentrations (in 1/s).
+        """
+        jacobian = self.mechanism.production_rate_jacobian(
+            concentrations, self.temperature
+        )
+        pattern = self._pattern
+        if pattern is None:
+            return jacobian
+
+        data = [0.0] * len(pattern.indices)
+        for position, value in zip(pattern.rate_positions, jacobian.data):
+            data[position] = value
+
+        dilution = (
+            sum(self.mechanism.production_rates(concentrations, self.temperature))
+            / self.total_concentration
+        )
+        for position in pattern.diagonal_positions:
+            data[position] -= dilution
+
+        column_sums = jacobian.rmatvec([1.0] * len(concentrations))
+        coupled_sums = [column_sums[k] for k in pattern.coupled_columns]
+        for concentration, positions in zip(concentrations, pattern.coupled_positions):
+            if concentration:
+                factor = concentration / self.total_concentration
+                for position, column_sum in zip(positions, coupled_sums):
+                    data[position] -= factor * column_sum
+
+        return CSRMatrix(jacobian.shape, pattern.indptr, pattern.indices, tuple(data))
+
+    def simulate(
+        self,
+        concentrations: Sequence[float],
+        times: Sequence[float],
+        *,
+        rtol: float = 1e-6,
+        atol: float = 1e-12,
+    ) -> ODESolution:
+        """
+        Integrate the concentrations from their initial values at times[0] and
+        return them at the given times (in s); see `solve_bdf`.
+        """
+        return solve_bdf(
+            self.rhs, self.jacobian, concentrations, times, rtol=rtol, atol=atol
+        )
+
+
+@dataclass(frozen=True)
+class _JacobianPattern:
+    """
+    Sparsity pattern of the Jacobian of a batch reactor that does not have constant
+    volume: the pattern of the production rate Jacobian, the diagonal and, in every
+    row, the columns that change the total production rate. The positions of the
+    entries of each part in the pattern are kept.
+    """
+
+    indptr: Tuple[int, ...]
+    indices: Tuple[int, ...]
+    rate_positions: Tuple[int, ...]
+    diagonal_positions: Tuple[int, ...]
+    coupled_columns: Tuple[int, ...]
+    coupled_positions: Tuple[Tuple[int, ...], ...]
+
+    @classmethod
+    def create(
+        cls, mechanism: KineticMechanism, temperature: float
+    ) -> "_JacobianPattern":
+        """
+        Create the pattern from the (fixed) pattern of the production rate Jacobian.
+        """
+        n = len(mechanism.species)
+        rates = mechanism.production_rate_jacobian([0.0] * n, temperature)
+        coupled_columns = tuple(sorted(set(rates.indices)))
+
+        indptr = [0]
+        indices: List[int] = []
+        rate_positions: List[int] = []
+        diagonal_positions: List[int] = []
+        coupled_positions: List[Tuple[int, ...]] = []
+        for i in range(n):
+            rate_columns = rates.indices[rates.indptr[i] : rates.indptr[i + 1]]
+            row = sorted(set(rate_columns) | {i} | set(coupled_columns))
+            positions = {column: len(indices) + k for k, column in enumerate(row)}
+            rate_positions.extend(positions[column] for column in rate_columns)
+            diagonal_positions.append(positions[i])
+            coupled_positions.append(
+                tuple(positions[column] for column in coupled_columns)
+            )
+            indices.extend(row)
+            indptr.append(len(indices))
+
+        return cls(
+            tuple(indptr),
+            tuple(indices),
+            tuple(rate_positions),
+            tuple(diagonal_positions),
+            coupled_columns,
+            tuple(coupled_positions),
+        )
+
+
+def simulate_batch_reactors(  # pylint: disable=too-many-arguments
+    mechanism: KineticMechanism,
+    conditions: Sequence[ReactorConditions],
+    times: Sequence[float],
+    *,
+    executor: Optional[Executor] = None,
+    rtol: float = 1e-6,
+    atol: float = 1e-12,
+) -> List[ODESolution]:
+    """
+    Simulate a batch reactor (see `BatchReactor`) for each of the given conditions
+    and return the solutions in the same order. The total concentration of each
+    reactor is the sum of its' initial concentrations.
+
+    Reactors are simulated in the `executor`, if one is given, otherwise one after
+    the other in the calling thread.
+    """
+    if executor is None:
+        return [
+            _simulate(mechanism, condition, times, rtol=rtol, atol=atol)
+            for condition in conditions
+        ]
+    return _map_conditions(executor, mechanism, conditions, times, rtol=rtol, atol=atol)
+
+
+def _map_conditions(  # pylint: disable=too-many-arguments
+    executor: Executor,
+    mechanism: KineticMechanism,
+    conditions: Sequence[ReactorConditions],
+    times: Sequence[float],
+    *,
+    rtol: float,
+    atol: float,
+) -> List[ODESolution]:
+    futures = [
+        executor.submit(_simulate, mechanism, condition, times, rtol=rtol, atol=atol)
+        for condition in conditions
+    ]
+    return [future.result() for future in futures]
+
+
+def _simulate(
+    mechanism: KineticMechanism,
+    conditions: ReactorConditions,
+    times: Sequence[float],
+    *,
+    rtol: float,
+    atol: float,
+) -> ODESolution:
+    reactor = BatchReactor(
+        mechanism, conditions.temperature, sum(conditions.concentrations)
+    )
+    return reactor.simulate(conditions.concentrations, times, rtol=rtol, atol=atol)
@@ -0,0 +1,243 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from fractions import Fraction
+
+from chemical_utils.substances.substance import ChemicalSubstance, ChemicalElement
+from chemical_utils.substances.species import species_composition
+from chemical_utils.reactions.reaction import CHARGE
+from chemical_utils.reactions.kinetics import ElementaryReaction
+from chemical_utils.numerics.linalg import (
+    CSRMatrix,
+    LUDecomposition,
+    reduced_row_echelon,
+)
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+ConservedQuantity = Union[ChemicalElement, str]
+
+
+class ElementConservation:  # pylint: disable=too-many-instance-attributes
+    """
+    Element (and charge) conservation constraints of a set of chemical species.
+
+    `matrix` has one row per conserved quantity (see `conserved`); the elements of
+    the species, in order of appearance, and the charge if any species is charged.
+    Row i holds the number of atoms of element i (or the charge) of each species,
+    so the element totals of a state are `matrix.matvec(concentrations)`.
+
+    Reactions conserve these totals, so a state of n species has only n - rank
+    independent coordinates. The first species, in order, whose compositions are
+    linearly independent are the dependent species; their amounts follow from the
+    amounts of the rest (the independent species) and the totals of a reference
+    state, such as the feed.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> conservation = ElementConservation(
+        ...     [CARBON_MONOXIDE, WATER, CARBON_DIOXIDE, HYDROGEN2]
+        ... )
+        >>> conservation.rank, conservation.independent_species
+        (3, (<ChemicalCompound: H2>,))
+        >>> conservation.expand([0.25], reference=[1.0, 1.0, 0.0, 0.0])
+        [0.75, 0.75, 0.25, 0.25]
+    """
+
+    def __init__(self, species: Sequence[ChemicalSubstance]) -> None:
+        self.species = tuple(species)
+
+        rows: Dict[ConservedQuantity, Dict[int, float]] = {}
+        for column, substance in enumerate(self.species):
+            for element, atoms in species_composition(substance).items():
+                rows.setdefault(element, {})[column] = float(atoms)
+        if any(substance.charge for substance in self.species):
+            rows[CHARGE] = {
+                column: float(substance.charge)
+                for column, substance in enumerate(self.species)
+            }
+
+        self.conserved: Tuple[ConservedQuantity, ...] = tuple(rows)
+        self.matrix = CSRMatrix.from_rows(rows.values(), len(self.species))
+
+        echelon, pivots = reduced_row_echelon(
+            [
+                [Fraction(row.get(column, 0)) for column in range(len(self.species))]
+                for row in rows.values()
+            ]
+        )
+        self.rank = len(pivots)
+        self._dependent = pivots
+        self._independent = [
+            column for column in range(len(self.species)) if column not in pivots
+        ]
+        # in reduced row echelon form the constraints read
+        # c_dependent = echelon c_reference - echelon_independent c_independent.
+        self._echelon = CSRMatrix.from_rows(
+            [{i: float(v) for i, v in enumerate(row) if v} for row in echelon],
+            len(self.species),
+        )
+        self._echelon_independent = [
+            [(k, float(row[column])) for k, column in enumerate(self._independent)]
+            for row in echelon
+        ]
+        self._projection: Optional[LUDecomposition] = (
+            LUDecomposition.factorize(_gram(self._echelon)) if self.rank else None
+        )
+
+    @property
+    def dependent_species(self) -> Tuple[ChemicalSubstance, ...]:
+        """
+        The species whose amounts follow from the rest and the conserved totals.
+        """
+        return tuple(self.species[i] for i in self._dependent)
+
+    @property
+    def independent_species(self) -> Tuple[ChemicalSubstance, ...]:
+        """
+        The species that are the coordinates of the reduced state.
+        """
+        return tuple(self.species[i] for i in self._independent)
+
+    def element_totals(self, concentrations: Sequence[float]) -> List[float]:
+        """
+        Totals of the conserved quantities (see `conserved`) of a state.
+        """
+        self._validate(concentrations)
+        return self.matrix.matvec(concentrations)
+
+    def reduce(self, concentrations: Sequence[float]) -> List[float]:
+        """
+        The reduced state; the amounts of the independent species.
+        """
+        self._validate(concentrations)
+        return [concentrations[i] for i in self._independent]
+
+    def expand(
+        self, reduced: Sequence[float], reference: Sequence[float]
+    ) -> List[float]:
+        """
+        The full state with the given amounts of the independent species and the
+        conserved totals of the reference state.
+
+        Raises `ChemicalUtilsValueError` if the number of values does not match the
+        number of independent species or the reference the number of species.
+        """
+        self._validate(reference)
+        if len(reduced) != len(self._independent):
+            raise ChemicalUtilsValueError(
+                f"cannot expand reduced state of {len(reduced)} values; expected "
+                f"{len(self._independent)} values. "
+            )
+
+        state = [0.0] * len(self.species)
+        for i, value in zip(self._independent, reduced):
+            state[i] = value
+        for i, total, row in zip(
+            self._dependent, self._echelon.matvec(reference), self._echelon_independent
+        ):
+            state[i] = total - sum(v * reduced[k] for k, v in row)
+        return state
+
+    def project(
+        self, concentrations: Sequence[float], reference: Sequence[float]
+    ) -> List[float]:
+        """
+        The state closest to the given one (in the least squares sense) with the
+        conserved totals of the reference state; e.g. to remove the drift of the
+        totals accumulated by a numerical solution.
+        """
+        self._validate(concentrations)
+        self._validate(reference)
+        if self._projection is None:
+            return list(concentrations)
+
+        violation = self._echelon.matvec(
+            [c - r for c, r in zip(concentrations, reference)]
+        )
+        correction = self._echelon.rmatvec(self._projection.solve(violation))
+        return [c - d for c, d in zip(concentrations, correction)]
+
+    def _validate(self, concentrations: Sequence[float]) -> None:
+        if len(concentrations) != len(self.species):
+            raise ChemicalUtilsValueError(
+                f"invalid state of {len(concentrations)} values; expected "
+                f"{len(self.species)} values. "
+            )
+
+
+def reachable_species(
+    reactions: Sequence[ElementaryReaction], feed: Iterable[ChemicalSubstance]
+) -> Set[ChemicalSubstance]:
+    """
+    The species that can be formed from the feed through the reactions; the feed
+    species and the products of every reaction whose reactants are all reachable
+    (and the reactants of every reversible reaction whose products are all
+    reachable).
+
+    Each reaction direction is visited once, when its' last missing species becomes
+    reachable.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> from chemical_utils.reactions.reaction import r
+        >>> from chemical_utils.reactions.kinetics import ArrheniusRate, ElementaryReaction
+        >>> reactions = [
+        ...     ElementaryReaction(r(CARBON + OXYGEN2, CARBON_DIOXIDE), ArrheniusRate(1), False),
+        ...     ElementaryReaction(r(2*HYDROGEN2 + OXYGEN2, 2*WATER), ArrheniusRate(1), False),
+        ... ]
+        >>> sorted(map(str, reachable_species(reactions, [CARBON, OXYGEN2])))
+        ['C', 'CO2', 'O2']
+    """
+    # directions are (reactants, products) pairs.
+    directions: List[Tuple[Set[ChemicalSubstance], Set[ChemicalSubstance]]] = []
+    for elementary in reactions:
+        reactants = {f.substance for f in elementary.reaction.reactants}
+        products = {f.substance for f in elementary.reaction.products}
+        directions.append((reactants, products))
+        if elementary.reversible:
+            directions.append((products, reactants))
+
+    waiting_on: Dict[ChemicalSubstance, List[int]] = {}
+    missing: List[int] = []
+    for d, (reactants, _) in enumerate(directions):
+        missing.append(len(reactants))
+        for substance in reactants:
+            waiting_on.setdefault(substance, []).append(d)
+
+    reachable: Set[ChemicalSubstance] = set()
+    pending = list(feed)
+    while pending:
+        substance = pending.pop()
+        if substance in reachable:
+            continue
+        reachable.add(substance)
+        for d in waiting_on.get(substance, ()):
+            missing[d] -= 1
+            if missing[d] == 0:
+                pending.extend(directions[d][1])
+    return reachable
+
+
+def prune_unreachable(
+    reactions: Sequence[ElementaryReaction], feed: Iterable[ChemicalSubstance]
+) -> List[ElementaryReaction]:
+    """
+    Remove the reactions that cannot take place starting from the feed, i.e. that
+    involve species that are not reachable (see `reachable_species`).
+    """
+    reachable = reachable_species(reactions, feed)
+    return [
+        elementary
+        for elementary in reactions
+        if all(
+            factor.substance in reachable
+            for factor in list(elementary.reaction.reactants)
+            + list(elementary.reaction.products)
+        )
+    ]
+
+
+def _gram(matrix: CSRMatrix) -> List[List[float]]:
+    """
+    The matrix times its' transpose.
+    """
+    rows = [matrix.row(i) for i in range(matrix.shape[0])]
+    return [[sum(v * b.get(k, 0.0) for k, v in a.items()) for b in rows] for a in rows]
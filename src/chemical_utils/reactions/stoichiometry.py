@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Sequence, Tuple
+
+from chemical_utils.substances.substance import (
+    ChemicalSubstance,
+    ChemicalElement,
+    ChemicalReactionOperand,
+    Coefficient,
+)
+from chemical_utils.substances.species import (
+    species_index,
+    species_at,
+    species_composition,
+)
+
+
+@dataclass(frozen=True)
+class ReactionStoichiometry:
+    """
+    Compact signed stoichiometry of a chemical reaction.
+
+    `indices` are the species indices (see `species_index`) of the substances taking
+    part in the reaction, in ascending order, and `coefficients` their net
+    stoichiometric coefficients; positive for products and negative for reactants.
+    Substances whose net coefficient is zero are omitted.
+
+    The stoichiometry does not depend on the order of the reactants and products,
+    so it serves as a hashable key of the net reaction (see `reaction_key`); its'
+    hash is computed once. Species indices are only meaningful within one process, so a pickled
+    stoichiometry stores the substances and is indexed again when unpickled.
+    """
+
+    indices: Tuple[int, ...]
+    coefficients: Tuple[Coefficient, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.indices, self.coefficients)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _from_species, (self.species, self.coefficients)
+
+    @property
+    def species(self) -> Tuple[ChemicalSubstance, ...]:
+        """
+        The substances taking part in the reaction, in the order of `indices`.
+        """
+        return tuple(species_at(index) for index in self.indices)
+
+    def as_dict(self) -> Dict[ChemicalSubstance, Coefficient]:
+        """
+        Map each substance to its' signed stoichiometric coefficient.
+
+        Examples:
+            >>> from chemical_utils.reactions.constants import *
+            >>> coefficients = WATER_GAS_SHIFT.stoichiometry.as_dict()
+            >>> coefficients[WATER], coefficients[CARBON_DIOXIDE]
+            (-1, 1)
+        """
+        return dict(zip(self.species, self.coefficients))
+
+    def element_balance(self) -> Dict[ChemicalElement, Coefficient]:
+        """
+        Net number of atoms of each element produced by the reaction; all values are
+        zero for a balanced reaction.
+        """
+        balance: Dict[ChemicalElement, Coefficient] = {}
+        for substance, coefficient in zip(self.species, self.coefficients):
+            for element, atoms in species_composition(substance).items():
+                balance[element] = balance.get(element, 0) + coefficient * atoms
+        return balance
+
+    def charge_balance(self) -> Coefficient:
+        """
+        Net electric charge produced by the reaction; zero for a balanced reaction.
+        """
+        return sum(
+            (
+                coefficient * substance.charge
+                for substance, coefficient in zip(self.species, self.coefficients)
+            ),
+            0,
+        )
+
+
+# canonical key of a reaction; the stoichiometry of its' reactants and of its'
+# products.
+ReactionKey = Tuple[ReactionStoichiometry, ReactionStoichiometry]
+
+
+def stoichiometry_of(
+    reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
+) -> ReactionStoichiometry:
+    """
+    Compute the signed stoichiometry of the reaction of the given operands.
+    """
+    net: Dict[int, Coefficient] = {}
+
+    for factor in reactants:
+        index = species_index(factor.substance)
+        net[index] = net.get(index, 0) - factor.stoichiometric_coefficient
+
+    for factor in products:
+        index = species_index(factor.substance)
+        net[index] = net.get(index, 0) + factor.stoichiometric_coefficient
+
+    indices = tuple(sorted(index for index, coefficient in net.items() if coefficient))
+    return ReactionStoichiometry(indices, tuple(net[index] for index in indices))
+
+
+def reaction_key(
+    reactants: ChemicalReactionOperand, products: ChemicalReactionOperand
+) -> ReactionKey:
+    """
+    Compute the canonical key of the reaction of the given operands; the signed
+    stoichiometry of the reactants and of the products, each on its' own, so that
+    substances on both sides (e.g. catalysts) are kept.
+    """
+    empty = ChemicalReactionOperand([])
+    return stoichiometry_of(reactants, empty), stoichiometry_of(empty, products)
+
+
+def _from_species(
+    species: Sequence[ChemicalSubstance], coefficients: Sequence[Coefficient]
+) -> ReactionStoichiometry:
+    pairs = sorted(zip(map(species_index, species), coefficients))
+    return ReactionStoichiometry(
+        tuple(index for index, _ in pairs), tuple(c for _, c in pairs)
+    )
@@ -7,6 +7,8 @@ from chemical_utils.substances.substance import (
     ChemicalElement,
     ChemicalCompound,
     ChemicalCompoundComponent,
+    ChemicalIon,
+    Electron,
 )
 from chemical_utils.properties.properties import (
     Temperature,
@@ -86,6 +88,9 @@ __all__ = [
     "CARBON_MONOXIDE",
     "CARBON_DIOXIDE",
     "METHANE",
+    "PROTON",
+    "HYDROXIDE",
+    "ELECTRON",
 ]
 
 
@@ -278,4 +283,8 @@ METHANE = _compound(
     _e(-5.049e7),
     _s(1.8627e5),
 )
+
+PROTON = ChemicalIon(HYDROGEN, 1)
+HYDROXIDE = ChemicalIon(ChemicalCompound(OXYGEN, HYDROGEN), -1)
+ELECTRON = Electron()
 # NOTE: don't forget to add the compound to the __all__ list
@@ -0,0 +1,159 @@
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+from bisect import bisect_left, bisect_right, insort
+
+from chemical_utils.substances.substance import ChemicalSubstance, ChemicalElement
+from chemical_utils.substances.species import species_composition
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+Range = Tuple[Optional[float], Optional[float]]
+
+_INF = float("inf")
+
+
+class CompoundLibrary:
+    """
+    Collection of chemical substances indexed by composition and molecular weight.
+
+    Each element has a sorted index of the number of its' atoms in the substances
+    that contain it and the molecular weights are kept in another sorted index, so
+    range queries cost a binary search per condition plus the size of the matching
+    sets. Substances can be added at any time; the indexes are updated in place.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> library = CompoundLibrary([METHANE, WATER, CARBON_MONOXIDE, CARBON_DIOXIDE])
+        >>> library.query({CARBON: (None, 6), OXYGEN: (1, None)}, (40, 90))
+        [<ChemicalCompound: CO2>]
+    """
+
+    def __init__(self, substances: Iterable[ChemicalSubstance] = ()) -> None:
+        self._substances: List[ChemicalSubstance] = []
+        self._ids: Dict[ChemicalSubstance, int] = {}
+        # per element; sorted (number of atoms, id) pairs.
+        self._counts: Dict[ChemicalElement, List[Tuple[float, int]]] = {}
+        # sorted (molecular weight, id) pairs.
+        self._weights: List[Tuple[float, int]] = []
+        self.add_many(substances)
+
+    def add(self, substance: ChemicalSubstance) -> bool:
+        """
+        Add a chemical substance to the library. Returns False if the substance is
+        already in the library.
+        """
+        if substance in self._ids:
+            return False
+
+        _id = len(self._substances)
+        self._substances.append(substance)
+        self._ids[substance] = _id
+
+        for element, atoms in species_composition(substance).items():
+            insort(self._counts.setdefault(element, []), (atoms, _id))
+        insort(self._weights, (substance.molecular_weight, _id))
+        return True
+
+    def add_many(self, substances: Iterable[ChemicalSubstance]) -> None:
+        """
+        Add many chemical substances to the library.
+        """
+        for substance in substances:
+            self.add(substance)
+
+    def query(
+        self,
+        counts: Optional[Mapping[ChemicalElement, Range]] = None,
+        molecular_weight: Optional[Range] = None,
+    ) -> List[ChemicalSubstance]:
+        """
+        Find the substances that satisfy all the given conditions, in the order they
+        were added.
+
+        `counts` maps chemical elements to inclusive (minimum, maximum) ranges of
+        the number of their atoms; `molecular_weight` is an inclusive (minimum,
+        maximum) range. None leaves a side of a range open, e.g. (1, None) means
+        "contains the element".
+
+        Raises `ChemicalUtilsValueError` if a range is empty or a number of atoms is
+        negative.
+        """
+        included: Optional[Set[int]] = None
+        excluded: Set[int] = set()
+
+        conditions: List[Tuple[List[Tuple[float, int]], Tuple[float, float]]] = []
+        for element, _range in (counts or {}).items():
+            index = self._counts.get(element, [])
+            lower, upper = _validate_count_range(_range)
+
+            if lower > 0:
+                conditions.append((index, (lower, upper)))
+            elif upper < _INF:
+                # substances without the element have zero atoms of it.
+                excluded.update(_ids_in(index, upper, _INF, lower_open=True))
+        if molecular_weight is not None:
+            conditions.append((self._weights, _validate_range(molecular_weight)))
+
+        for index, (lower, upper) in sorted(
+            conditions, key=lambda c: _count_in(c[0], *c[1])
+        ):
+            ids = set(_ids_in(index, lower, upper))
+            included = ids if included is None else included & ids
+            if not included:
+                return []
+
+        if included is None:
+            return [s for i, s in enumerate(self._substances) if i not in excluded]
+        return [self._substances[i] for i in sorted(included - excluded)]
+
+    def __contains__(self, substance: object) -> bool:
+        return substance in self._ids
+
+    def __iter__(self) -> Iterator[ChemicalSubstance]:
+        return iter(self._substances)
+
+    def __len__(self) -> int:
+        return len(self._substances)
+
+
+def _validate_range(_range: Range) -> Tuple[float, float]:
+    lower = -_INF if _range[0] is None else _range[0]
+    upper = _INF if _range[1] is None else _range[1]
+    if lower > upper:
+        raise ChemicalUtilsValueError(
+            f"invalid range: {_range}; the minimum is greater than the maximum. "
+        )
+    return lower, upper
+
+
+def _validate_count_range(_range: Range) -> Tuple[float, float]:
+    if any(bound is not None and bound < 0 for bound in _range):
+        raise ChemicalUtilsValueError(
+            f"invalid range of number of atoms: {_range}; expected non-negative "
+            "numbers. "
+        )
+    return _validate_range(_range)
+
+
+def _bounds(
+    index: List[Tuple[float, int]], lower: float, upper: float, lower_open: bool
+) -> Tuple[int, int]:
+    start = (
+        bisect_right(index, (lower, _INF))
+        if lower_open
+        else bisect_left(index, (lower, -1))
+    )
+    return start, bisect_right(index, (upper, _INF))
+
+
+def _count_in(index: List[Tuple[float, int]], lower: float, upper: float) -> int:
+    start, end = _bounds(index, lower, upper, False)
+    return max(end - start, 0)
+
+
+def _ids_in(
+    index: List[Tuple[float, int]],
+    lower: float,
+    upper: float,
+    lower_open: bool = False,
+) -> List[int]:
+    start, end = _bounds(index, lower, upper, lower_open)
+    return [_id for _, _id in index[start:end]]
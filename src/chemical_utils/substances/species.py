@@ -0,0 +1,101 @@
+from typing import Dict, List
+from threading import Lock
+
+from typing_extensions import Counter
+
+from chemical_utils.substances.substance import (
+    ChemicalSubstance,
+    ChemicalElement,
+    charge_suffix,
+)
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+
+
+def species_index(substance: ChemicalSubstance) -> int:
+    """
+    Get the process-wide integer index of a chemical substance. Substances are indexed
+    in the order in which they are first seen; equal substances share an index.
+
+    Examples:
+        >>> from chemical_utils.substances import METHANE
+        >>> species_index(METHANE) == species_index(METHANE)
+        True
+    """
+    index = _indices.get(substance)
+    if index is not None:
+        return index
+
+    with _lock:
+        index = _indices.get(substance)
+        if index is None:
+            index = len(_species)
+            _species.append(substance)
+            _compositions.append(dict(Counter(substance.elements())))
+            _indices[substance] = index
+    return index
+
+
+def species_at(index: int) -> ChemicalSubstance:
+    """
+    Get the chemical substance with the given species index.
+
+    Raises `ChemicalUtilsValueError` if no substance has the index.
+    """
+    if not 0 <= index < len(_species):
+        raise ChemicalUtilsValueError(f"there is no species with index {index}. ")
+    return _species[index]
+
+
+def species_composition(substance: ChemicalSubstance) -> Dict[ChemicalElement, int]:
+    """
+    Get the number of atoms of each element in a chemical substance. The composition
+    is computed once per substance; do not mutate the returned dictionary.
+
+    Examples:
+        >>> from chemical_utils.substances import METHANE
+        >>> species_composition(METHANE)
+        {<ChemicalElement: C>: 1, <ChemicalElement: H>: 4}
+    """
+    return _compositions[species_index(substance)]
+
+
+def hill_formula(substance: ChemicalSubstance) -> str:
+    """
+    Get the Hill formula of a chemical substance; carbon first, hydrogen second and
+    the rest of the elements in alphabetical order of their symbols, or all
+    elements in alphabetical order if there is no carbon. Ions are followed by their
+    charge. The formula is computed once per substance.
+
+    Examples:
+        >>> from chemical_utils.substances import *
+        >>> from chemical_utils.substances.substance import c
+        >>> hill_formula(c(HYDROGEN * 3, CARBON, OXYGEN, HYDROGEN)), hill_formula(WATER)
+        ('CH4O', 'H2O')
+    """
+    index = species_index(substance)
+    formula = _hill_formulas.get(index)
+    if formula is None:
+        formula = _hill_formulas[index] = _hill_formula(substance)
+    return formula
+
+
+def _hill_formula(substance: ChemicalSubstance) -> str:
+    counts = {e.symbol: n for e, n in species_composition(substance).items()}
+    if not counts:
+        return str(substance)
+
+    first = [s for s in ("C", "H") if s in counts] if "C" in counts else []
+    symbols = first + sorted(s for s in counts if s not in first)
+    formula = "".join(f"{s}{counts[s] if counts[s] > 1 else ''}" for s in symbols)
+    return formula + charge_suffix(substance.charge)
+
+
+_species: List[ChemicalSubstance] = []
+
+_compositions: List[Dict[ChemicalElement, int]] = []
+
+_indices: Dict[ChemicalSubstance, int] = {}
+
+_hill_formulas: Dict[int, str] = {}
+
+_lock = Lock()
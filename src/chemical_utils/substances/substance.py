@@ -1,10 +1,12 @@
-from typing import Protocol, Iterable, Union, List, Iterator, Optional
+from typing import Any, Dict, Protocol, Iterable, Union, List, Iterator, Optional
 
 try:
     from typing import TypeAlias  # Python >= 3.10
 except ImportError:
     from typing_extensions import TypeAlias  # Python < 3.10
 from dataclasses import dataclass
+from fractions import Fraction
+from functools import cached_property
 
 from chemical_utils.exceptions.base import (
     ChemicalUtilsTypeError,
@@ -34,6 +36,45 @@ def c(*components) -> "ChemicalCompound":
     return ChemicalCompound(*components)
 
 
+def stoichiometric_coefficient(
+    value: Union[int, float, Fraction], name: str = "chemical substance"
+) -> "Coefficient":
+    """
+    Validate and normalize a stoichiometric coefficient. Integers are returned as
+    they are, fractions and floats are converted to exact fractions; fractions
+    with a denominator of 1 become integers.
+
+    Raises `ChemicalUtilsTypeError` if the value is not numeric.
+
+    Raises `ChemicalUtilsValueError` if the value is not positive and finite.
+
+    Examples:
+        >>> stoichiometric_coefficient(0.25)
+        Fraction(1, 4)
+        >>> stoichiometric_coefficient(Fraction(4, 2))
+        2
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float, Fraction)):
+        raise ChemicalUtilsTypeError(
+            f"cannot multiply {name} with {value}; "
+            "expected a positive integer or fraction. "
+        )
+    if not value > 0 or value == float("inf"):
+        raise ChemicalUtilsValueError(
+            f"cannot multiply {name} with {value}; "
+            "expected a positive integer or fraction. "
+        )
+
+    if isinstance(value, int):
+        return value
+
+    coefficient = Fraction(value)
+    if isinstance(value, float):
+        coefficient = coefficient.limit_denominator(_MAX_FLOAT_DENOMINATOR)
+
+    return coefficient.numerator if coefficient.denominator == 1 else coefficient
+
+
 class ChemicalSubstance(Protocol):
     """
     A chemical substance is a chemical element or a compound consisting of multiple
@@ -67,6 +108,14 @@ class ChemicalSubstance(Protocol):
         """
         return get_critical_properties(self)
 
+    @property
+    def charge(self) -> int:
+        """
+        Electric charge of the chemical substance in elementary charges; zero for
+        neutral substances.
+        """
+        return 0
+
     def elements(self) -> Iterator["ChemicalElement"]:
         """
         Returns an iterator over the chemical elements of this substance.
@@ -78,7 +127,7 @@ class ChemicalSubstance(Protocol):
         """
         Defines addition for chemical elements.
         """
-        if isinstance(other, (ChemicalElement, ChemicalElementTuple, ChemicalCompound)):
+        if isinstance(other, SUBSTANCE_TYPES):
             other = ChemicalReactionFactor(substance=other)
 
         if not isinstance(other, ChemicalReactionFactor):
@@ -88,22 +137,22 @@ class ChemicalSubstance(Protocol):
 
         return ChemicalReactionOperand([ChemicalReactionFactor(substance=self), other])
 
-    def __rmul__(self, coeff: int) -> "ChemicalReactionFactor":
+    def __rmul__(self, coeff: Union[int, float, Fraction]) -> "ChemicalReactionFactor":
         """
-        Defines right multiplication between integers and chemical substances.
+        Defines right multiplication between positive numbers and chemical substances.
         The product is a chemical reaction factor.
+
+        Integer coefficients are kept as they are; fractions and floats become exact
+        rational coefficients.
+
+        Examples:
+            >>> from chemical_utils.substances import OXYGEN2
+            >>> 0.5*OXYGEN2
+            <ChemicalReactionFactor: 1/2O2>
         """
-        if not isinstance(coeff, int):
-            raise ChemicalUtilsTypeError(
-                f"cannot multiply {self.__class__.__name__} with {coeff}; "
-                "expected a positive integer. "
-            )
-        if not coeff > 0:
-            raise ChemicalUtilsValueError(
-                f"cannot multiply {self.__class__.__name__} with {coeff}; "
-                "expected a positive integer. "
-            )
-        return ChemicalReactionFactor(self, coeff)
+        return ChemicalReactionFactor(
+            self, stoichiometric_coefficient(coeff, self.__class__.__name__)
+        )
 
 
 @dataclass(frozen=True)
@@ -195,6 +244,8 @@ class ChemicalElementTuple(ChemicalSubstance):
 
 ChemicalCompoundComponent: TypeAlias = Union[ChemicalElement, ChemicalElementTuple]
 
+Coefficient: TypeAlias = Union[int, Fraction]
+
 
 @dataclass(frozen=True)
 class ChemicalCompound(ChemicalSubstance):
@@ -239,11 +290,126 @@ class ChemicalCompound(ChemicalSubstance):
         ]
         return iter(_elements)
 
+    @cached_property
+    def _string(self) -> str:
+        return "".join(str(c) for c in self.components)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return _without_cached_string(self.__dict__)
+
     def __repr__(self) -> str:
-        return f"<ChemicalCompound: {''.join(str(c) for c in self.components)}>"
+        return f"<ChemicalCompound: {self._string}>"
 
     def __str__(self) -> str:
-        return "".join(str(c) for c in self.components)
+        return self._string
+
+
+@dataclass(frozen=True)
+class ChemicalIon(ChemicalSubstance):
+    """
+    An ion; a chemical element or compound with a non-zero electric charge.
+
+    Examples:
+        >>> from chemical_utils.substances import IRON
+        >>> ChemicalIon(IRON, 3)
+        <ChemicalIon: Fe^3+>
+    """
+
+    substance: Union[ChemicalElement, ChemicalElementTuple, ChemicalCompound]
+    charge_number: int
+
+    def __post_init__(self) -> None:
+        if not isinstance(
+            self.substance, (ChemicalElement, ChemicalElementTuple, ChemicalCompound)
+        ):
+            raise ChemicalUtilsTypeError(
+                f"cannot create ChemicalIon from {self.substance}; "
+                "expected a neutral chemical substance. "
+            )
+        if isinstance(self.charge_number, bool) or not isinstance(
+            self.charge_number, int
+        ):
+            raise ChemicalUtilsTypeError(
+                f"cannot create ChemicalIon with charge {self.charge_number}; "
+                "expected a non-zero integer. "
+            )
+        if self.charge_number == 0:
+            raise ChemicalUtilsValueError(
+                "cannot create ChemicalIon with zero charge; "
+                "expected a non-zero integer. "
+            )
+
+    @property
+    def charge(self) -> int:
+        """
+        Electric charge of the ion in elementary charges.
+        """
+        return self.charge_number
+
+    @property
+    def molecular_weight(self) -> float:
+        """
+        Unitless relative molecular mass of the ion; the mass of the electrons
+        gained or lost is neglected.
+        """
+        return self.substance.molecular_weight
+
+    def elements(self) -> Iterator[ChemicalElement]:
+        """
+        Returns an iterator over the chemical elements of this ion.
+        """
+        return self.substance.elements()
+
+    @cached_property
+    def _string(self) -> str:
+        return f"{self.substance}{charge_suffix(self.charge_number)}"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return _without_cached_string(self.__dict__)
+
+    def __repr__(self) -> str:
+        return f"<ChemicalIon: {self._string}>"
+
+    def __str__(self) -> str:
+        return self._string
+
+
+@dataclass(frozen=True)
+class Electron(ChemicalSubstance):
+    """
+    The electron as a pseudo-species of half-reactions; it contains no chemical
+    elements and has a charge of -1.
+
+    Examples:
+        >>> Electron()
+        <Electron: e^->
+    """
+
+    @property
+    def charge(self) -> int:
+        """
+        Electric charge of the electron in elementary charges.
+        """
+        return -1
+
+    @property
+    def molecular_weight(self) -> float:
+        """
+        Unitless relative mass of the electron.
+        """
+        return _ELECTRON_RELATIVE_MASS
+
+    def elements(self) -> Iterator[ChemicalElement]:
+        """
+        Returns an empty iterator; the electron contains no chemical elements.
+        """
+        return iter([])
+
+    def __repr__(self) -> str:
+        return "<Electron: e^->"
+
+    def __str__(self) -> str:
+        return "e^-"
 
 
 @dataclass(frozen=True)
@@ -253,13 +419,15 @@ class ChemicalReactionFactor:
     """
 
     substance: ChemicalSubstance
-    stoichiometric_coefficient: int = 1
+    stoichiometric_coefficient: Coefficient = 1
 
     def stoichiometric_elements(self) -> Iterator[ChemicalElement]:
         """
         Iterate over the elements of this factor taking into account the stoichiometric
         coefficient.
 
+        Raises `ChemicalUtilsValueError` if the coefficient is not an integer.
+
         Example:
             >>> from chemical_utils.substances import HYDROGEN2
             >>> [e for e in (2*HYDROGEN2).stoichiometric_elements()]
@@ -268,6 +436,12 @@ class ChemicalReactionFactor:
         if self.stoichiometric_coefficient == 1:
             return self.substance.elements()
 
+        if not isinstance(self.stoichiometric_coefficient, int):
+            raise ChemicalUtilsValueError(
+                f"cannot iterate over the elements of {self}; the stoichiometric "
+                "coefficient is not an integer. "
+            )
+
         _elements: List[ChemicalElement] = []
         _ = {
             _elements.extend([e] * self.stoichiometric_coefficient)  # type: ignore
@@ -277,7 +451,7 @@ class ChemicalReactionFactor:
         return iter(_elements)
 
     def __add__(self, other: "ChemicalReactionFactor") -> "ChemicalReactionOperand":
-        if isinstance(other, (ChemicalElement, ChemicalElementTuple, ChemicalCompound)):
+        if isinstance(other, SUBSTANCE_TYPES):
             other = ChemicalReactionFactor(other)
 
         if not isinstance(other, ChemicalReactionFactor):
@@ -290,7 +464,7 @@ class ChemicalReactionFactor:
         return f"<ChemicalReactionFactor: {str(self)}>"
 
     def __str__(self) -> str:
-        if self.stoichiometric_coefficient > 1:
+        if self.stoichiometric_coefficient != 1:
             return f"{self.stoichiometric_coefficient}{self.substance}"
         return f"{self.substance}"
 
@@ -305,7 +479,7 @@ class ChemicalReactionOperand:
     factors: List[ChemicalReactionFactor]
 
     def __add__(self, other: ChemicalReactionFactor) -> "ChemicalReactionOperand":
-        if isinstance(other, (ChemicalElement, ChemicalElementTuple, ChemicalCompound)):
+        if isinstance(other, SUBSTANCE_TYPES):
             other = ChemicalReactionFactor(other)
 
         if not isinstance(other, ChemicalReactionFactor):
@@ -323,3 +497,44 @@ class ChemicalReactionOperand:
 
     def __str__(self) -> str:
         return " + ".join(map(str, self.factors))
+
+
+def charge_suffix(charge_number: int) -> str:
+    """
+    The charge of an ion as written after its' formula; empty for neutral species.
+
+    Examples:
+        >>> charge_suffix(2), charge_suffix(-1), charge_suffix(0)
+        ('^2+', '^-', '')
+    """
+    if charge_number == 0:
+        return ""
+    size = abs(charge_number)
+    sign = "+" if charge_number > 0 else "-"
+    return f"^{size if size > 1 else ''}{sign}"
+
+
+def _without_cached_string(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of an instance state without the cached string form, which is recomputed
+    on access instead of being pickled.
+    """
+    return {name: value for name, value in state.items() if name != "_string"}
+
+
+SUBSTANCE_TYPES = (
+    ChemicalElement,
+    ChemicalElementTuple,
+    ChemicalCompound,
+    ChemicalIon,
+    Electron,
+)
+"""
+Classes of chemical substances, e.g. for checks with `isinstance`.
+"""
+
+_ELECTRON_RELATIVE_MASS = 5.48579909065e-4
+
+# Floats are converted to the closest fraction with a denominator up to this value,
+# so that e.g. 1/3 written as 0.333... becomes Fraction(1, 3).
+_MAX_FLOAT_DENOMINATOR = 10**6
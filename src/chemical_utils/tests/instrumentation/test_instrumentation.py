@@ -0,0 +1,160 @@
+from unittest import TestSuite, TextTestRunner
+from threading import Event, Thread
+
+from unittest_extensions import args
+
+from chemical_utils.instrumentation.instrumentation import (
+    Metric,
+    HISTOGRAM_BUCKETS,
+    instrumented,
+    instrumentation,
+    is_instrumentation_enabled,
+    enable_instrumentation,
+    disable_instrumentation,
+)
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.properties.registry import get_standard_entropy
+from chemical_utils.tests.base import TestBase
+from chemical_utils.tests.data import TESTIUM, TESTIUM2, PYTHONIUM, TS_PY
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.instrumentation.instrumentation")
+
+instrumentation_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(instrumentation_test_suite)
+
+
+@instrumented("test.square")
+def _square(x):
+    return x * x
+
+
+@add_to(instrumentation_test_suite)
+class TestInstrumentedCalls(TestBase):
+    def subject(self, calls):
+        with instrumentation() as recorder:
+            for x in range(calls):
+                _square(x)
+        return recorder.metrics
+
+    @args({"calls": 3})
+    def test_calls_are_counted(self):
+        self.assertEqual(self.result()["test.square"].count, 3)
+
+    @args({"calls": 3})
+    def test_histogram_counts_all_calls(self):
+        self.assertEqual(sum(self.result()["test.square"].histogram), 3)
+
+    @args({"calls": 0})
+    def test_without_calls(self):
+        self.assertNotIn("test.square", self.result())
+
+    def test_calls_outside_block_are_not_recorded(self):
+        with instrumentation() as recorder:
+            pass
+        _square(2)
+        self.assertNotIn("test.square", recorder.metrics)
+
+    def test_disabled_after_block(self):
+        with instrumentation():
+            pass
+        self.assertFalse(is_instrumentation_enabled())
+
+    def test_return_value(self):
+        with instrumentation():
+            self.assertEqual(_square(3), 9)
+
+
+@add_to(instrumentation_test_suite)
+class TestOverlappingBlocks(TestBase):
+    def test_nested_blocks(self):
+        with instrumentation():
+            with instrumentation():
+                pass
+            self.assertTrue(is_instrumentation_enabled())
+        self.assertFalse(is_instrumentation_enabled())
+
+    def test_blocks_in_threads(self):
+        entered, exited = Event(), Event()
+
+        def block():
+            with instrumentation():
+                entered.set()
+                exited.wait()
+
+        thread = Thread(target=block)
+        with instrumentation():
+            thread.start()
+            entered.wait()
+        # the block of the other thread is still active.
+        self.assertTrue(is_instrumentation_enabled())
+        exited.set()
+        thread.join()
+        self.assertFalse(is_instrumentation_enabled())
+
+    def test_enabled_inside_block(self):
+        self.addCleanup(disable_instrumentation)
+        with instrumentation():
+            enable_instrumentation()
+        self.assertTrue(is_instrumentation_enabled())
+
+
+@add_to(instrumentation_test_suite)
+class TestInstrumentedHotPaths(TestBase):
+    def subject(self, reactants, products):
+        with instrumentation() as recorder:
+            try:
+                ChemicalReaction(reactants, products)
+            except Exception:  # pylint: disable=broad-except
+                pass
+        return recorder.metrics
+
+    @args({"reactants": TESTIUM + PYTHONIUM, "products": TS_PY})
+    def test_reaction_init(self):
+        self.assertEqual(self.result()["ChemicalReaction.__post_init__"].count, 1)
+
+    @args({"reactants": TESTIUM + PYTHONIUM, "products": TS_PY})
+    def test_count_elements(self):
+        self.assertEqual(self.result()["ChemicalReaction._count_elements"].count, 2)
+
+    @args({"reactants": PYTHONIUM, "products": TESTIUM})
+    def test_unbalanced_reaction_init(self):
+        self.assertEqual(self.result()["ChemicalReaction.__post_init__"].count, 1)
+
+    def test_registry_miss(self):
+        with instrumentation() as recorder:
+            get_standard_entropy(TS_PY)
+            get_standard_entropy(TESTIUM2)
+        self.assertEqual(recorder.metrics["registry.get_standard_entropy"].count, 2)
+        self.assertEqual(
+            recorder.metrics["registry.get_standard_entropy.miss"].count, 1
+        )
+
+
+@add_to(instrumentation_test_suite)
+class TestMetric(TestBase):
+    def subject(self, timings):
+        metric = Metric("test")
+        for elapsed in timings:
+            metric._add(elapsed)  # pylint: disable=protected-access
+        return metric
+
+    @args({"timings": [1.0, 3.0]})
+    def test_mean_time(self):
+        self.assertEqual(self.result().mean_time, 2.0)
+
+    @args({"timings": []})
+    def test_mean_time_without_calls(self):
+        self.assertEqual(self.result().mean_time, 0.0)
+
+    @args({"timings": [HISTOGRAM_BUCKETS[-1] * 10]})
+    def test_overflow_bucket(self):
+        self.assertEqual(self.result().histogram[-1], 1)
+
+    @args({"timings": [HISTOGRAM_BUCKETS[0]]})
+    def test_first_bucket(self):
+        self.assertEqual(self.result().histogram[0], 1)
@@ -0,0 +1,198 @@
+from unittest import TestSuite, TextTestRunner
+from fractions import Fraction
+
+from unittest_extensions import args
+
+from chemical_utils.numerics.linalg import (
+    CSRMatrix,
+    LUDecomposition,
+    SparseLUPattern,
+    reduced_row_echelon,
+    sparse_least_squares,
+)
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+from chemical_utils.tests.base import TestBase
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.numerics.linalg")
+
+linalg_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(linalg_test_suite)
+
+
+@add_to(linalg_test_suite)
+class TestCSRMatrix(TestBase):
+    def build_matrix(self):
+        return CSRMatrix.from_rows([{0: 1.0, 2: 2.0}, {}, {1: -1.0}], 3)
+
+    def test_shape(self):
+        self.assertEqual(self.build_matrix().shape, (3, 3))
+
+    def test_matvec(self):
+        self.assertEqual(self.build_matrix().matvec([1.0, 2.0, 3.0]), [7.0, 0, -2.0])
+
+    def test_rmatvec(self):
+        self.assertEqual(self.build_matrix().rmatvec([1.0, 2.0, 3.0]), [1.0, -3.0, 2.0])
+
+    def test_row(self):
+        self.assertEqual(self.build_matrix().row(0), {0: 1.0, 2: 2.0})
+
+    def test_zeros_are_not_stored(self):
+        self.assertEqual(CSRMatrix.from_rows([{0: 0.0, 1: 1.0}], 2).indices, (1,))
+
+    def test_invalid_column(self):
+        with self.assertRaises(Exception):
+            CSRMatrix.from_rows([{3: 1.0}], 3)
+
+
+@add_to(linalg_test_suite)
+class TestSparseLeastSquares(TestBase):
+    def subject(self, rows, n_columns, rhs):
+        return sparse_least_squares(CSRMatrix.from_rows(rows, n_columns), rhs)
+
+    def assert_result_close(self, expected):
+        for value, expected_value in zip(self.result(), expected):
+            self.assertAlmostEqual(value, expected_value)
+
+    @args({"rows": [{0: 2.0}, {1: 4.0}], "n_columns": 2, "rhs": [2.0, 2.0]})
+    def test_square_system(self):
+        self.assert_result_close([1.0, 0.5])
+
+    @args(
+        {
+            "rows": [{0: 1.0}, {0: 1.0}, {1: 1.0}],
+            "n_columns": 2,
+            "rhs": [1.0, 3.0, 5.0],
+        }
+    )
+    def test_overdetermined_system(self):
+        self.assert_result_close([2.0, 5.0])
+
+    @args({"rows": [{0: 1.0, 1: 1.0}], "n_columns": 2, "rhs": [2.0]})
+    def test_underdetermined_system_minimum_norm(self):
+        self.assert_result_close([1.0, 1.0])
+
+    @args({"rows": [{0: 1.0}], "n_columns": 1, "rhs": [0.0]})
+    def test_zero_rhs(self):
+        self.assertResultList([0.0])
+
+    @args({"rows": [{0: 1.0}], "n_columns": 1, "rhs": [1.0, 2.0]})
+    def test_mismatched_rhs(self):
+        self.assert_value_error()
+
+
+@add_to(linalg_test_suite)
+class TestLUDecomposition(TestBase):
+    def subject(self, matrix, rhs):
+        return LUDecomposition.factorize(matrix).solve(rhs)
+
+    def assert_result_close(self, expected):
+        for value, expected_value in zip(self.result(), expected):
+            self.assertAlmostEqual(value, expected_value)
+
+    @args({"matrix": [[4.0, 1.0], [2.0, 3.0]], "rhs": [6.0, 8.0]})
+    def test_solve(self):
+        self.assert_result_close([1.0, 2.0])
+
+    @args(
+        {
+            "matrix": [[0.0, 1.0, 2.0], [1.0, 0.0, 0.0], [3.0, 1.0, 1.0]],
+            "rhs": [5.0, 1.0, 6.0],
+        }
+    )
+    def test_zero_leading_pivot(self):
+        self.assert_result_close([1.0, 1.0, 2.0])
+
+    @args({"matrix": [[1.0, 2.0], [2.0, 4.0]], "rhs": [1.0, 2.0]})
+    def test_singular_matrix(self):
+        self.assert_value_error()
+
+    @args({"matrix": [[1.0, 2.0]], "rhs": [1.0]})
+    def test_non_square_matrix(self):
+        self.assert_value_error()
+
+
+@add_to(linalg_test_suite)
+class TestSparseLUPattern(TestBase):
+    def subject(self, rows, rhs, **kwargs):
+        matrix = CSRMatrix.from_rows(rows, len(rows))
+        return SparseLUPattern.analyze(matrix).factorize(matrix, **kwargs).solve(rhs)
+
+    def assert_result_close(self, expected):
+        for value, expected_value in zip(self.result(), expected):
+            self.assertAlmostEqual(value, expected_value)
+
+    @args({"rows": [{0: 4.0, 1: 1.0}, {0: 2.0, 1: 3.0}], "rhs": [6.0, 8.0]})
+    def test_solve(self):
+        self.assert_result_close([1.0, 2.0])
+
+    @args(
+        {
+            "rows": [{0: 4.0, 1: 1.0, 2: 1.0}, {0: 1.0, 1: 4.0}, {0: 1.0, 2: 4.0}],
+            "rhs": [9.0, 9.0, 13.0],
+        }
+    )
+    def test_fill_in(self):
+        self.assert_result_close([1.0, 2.0, 3.0])
+
+    @args({"rows": [{1: -1.0}, {0: 2.0}], "rhs": [3.0, -2.0], "shift": 1.0})
+    def test_shift(self):
+        # [[1, -1], [2, 1]] x = [3, -2]
+        self.assert_result_close([1 / 3, -8 / 3])
+
+    @args({"rows": [{0: 1.0}, {1: 4.0}], "rhs": [1.0, 2.0], "scale": -2.0})
+    def test_scale(self):
+        self.assert_result_close([-0.5, -0.25])
+
+    @args({"rows": [{1: 1.0}, {0: 1.0}], "rhs": [1.0, 2.0]})
+    def test_zero_pivot(self):
+        self.assert_value_error()
+
+    def test_fill_in_pattern(self):
+        pattern = SparseLUPattern.analyze(
+            CSRMatrix.from_rows([{0: 4.0, 1: 1.0, 2: 1.0}, {0: 1.0}, {0: 1.0}], 3)
+        )
+        self.assertEqual(pattern.indices, (0, 1, 2, 0, 1, 2, 0, 1, 2))
+
+    def test_reuse_pattern(self):
+        first = CSRMatrix.from_rows([{0: 4.0, 1: 1.0}, {0: 2.0, 1: 3.0}], 2)
+        second = CSRMatrix.from_rows([{0: 1.0, 1: 1.0}, {0: 1.0, 1: 2.0}], 2)
+        pattern = SparseLUPattern.analyze(first)
+        self.assertTrue(pattern.matches(second))
+        self.assertEqual(pattern.factorize(second).solve([3.0, 5.0]), [1.0, 2.0])
+
+    def test_other_pattern_does_not_match(self):
+        pattern = SparseLUPattern.analyze(CSRMatrix.from_rows([{0: 1.0}, {1: 1.0}], 2))
+        self.assertFalse(
+            pattern.matches(CSRMatrix.from_rows([{0: 1.0, 1: 1.0}, {1: 1.0}], 2))
+        )
+
+    def test_non_square_matrix(self):
+        with self.assertRaises(ChemicalUtilsValueError):
+            SparseLUPattern.analyze(CSRMatrix.from_rows([{0: 1.0, 1: 1.0}], 2))
+
+
+@add_to(linalg_test_suite)
+class TestReducedRowEchelon(TestBase):
+    def subject(self, matrix):
+        return reduced_row_echelon(
+            [[Fraction(value) for value in row] for row in matrix]
+        )
+
+    @args({"matrix": [[0, 2, 4], [1, 1, 1], [1, 3, 5]]})
+    def test_rank_deficient(self):
+        self.assertResult(
+            ([[1, 0, -1], [0, 1, 2]], [0, 1]),
+        )
+
+    @args({"matrix": [[0, 0], [0, 0]]})
+    def test_zero_matrix(self):
+        self.assertResult(([], []))
+
+    @args({"matrix": [[3, 1], [1, 2]]})
+    def test_exact_fractions(self):
+        self.assertResult(([[1, 0], [0, 1]], [0, 1]))
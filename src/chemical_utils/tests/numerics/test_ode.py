@@ -0,0 +1,105 @@
+from unittest import TestSuite, TextTestRunner
+from math import exp
+
+from unittest_extensions import args
+
+from chemical_utils.numerics.linalg import CSRMatrix
+from chemical_utils.numerics.ode import solve_bdf
+from chemical_utils.tests.base import TestBase
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.numerics.ode")
+
+ode_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(ode_test_suite)
+
+
+def _linear(rows):
+    matrix = CSRMatrix.from_rows(rows, len(rows))
+    return (lambda t, y: matrix.matvec(y)), (lambda t, y: matrix)
+
+
+def _robertson(_, y):
+    a, b, c = y
+    return [
+        -0.04 * a + 1e4 * b * c,
+        0.04 * a - 1e4 * b * c - 3e7 * b * b,
+        3e7 * b * b,
+    ]
+
+
+def _robertson_jacobian(_, y):
+    _, b, c = y
+    return CSRMatrix.from_rows(
+        [
+            {0: -0.04, 1: 1e4 * c, 2: 1e4 * b},
+            {0: 0.04, 1: -1e4 * c - 6e7 * b, 2: -1e4 * b},
+            {1: 6e7 * b},
+        ],
+        3,
+    )
+
+
+@add_to(ode_test_suite)
+class TestSolveBDF(TestBase):
+    def subject(self, fun, jacobian, y0, times, **kwargs):
+        return solve_bdf(fun, jacobian, y0, times, **kwargs)
+
+    @args({"y0": [1.0, 1.0], "times": [0.0, 0.5, 1.0], "rtol": 1e-8})
+    def test_stiff_linear_system(self):
+        fun, jacobian = _linear([{0: -1.0}, {1: -1e4}])
+        solution = self.subject(fun, jacobian, **self._subjectKwargs)
+        self.assertEqual(solution.t, [0.0, 0.5, 1.0])
+        self.assertAlmostEqual(solution.y[1][0], exp(-0.5), places=5)
+        self.assertAlmostEqual(solution.y[2][0], exp(-1.0), places=5)
+        self.assertAlmostEqual(solution.y[2][1], 0.0, places=8)
+
+    @args(
+        {
+            "fun": _robertson,
+            "jacobian": _robertson_jacobian,
+            "y0": [1.0, 0.0, 0.0],
+            "times": [0.0, 40.0],
+            "atol": 1e-10,
+        }
+    )
+    def test_robertson(self):
+        y = self.result().y[-1]
+        self.assertAlmostEqual(y[0], 0.7158, places=3)
+        self.assertAlmostEqual(y[1] * 1e5, 0.9185, places=3)
+        self.assertAlmostEqual(sum(y), 1.0, places=10)
+
+    @args(
+        {
+            "fun": _robertson,
+            "jacobian": _robertson_jacobian,
+            "y0": [1.0, 0.0, 0.0],
+            "times": [0.0, 40.0],
+        }
+    )
+    def test_jacobian_and_factorizations_are_reused(self):
+        solution = self.result()
+        self.assertLess(solution.n_jacobians, solution.n_steps)
+        self.assertLess(solution.n_factorizations, solution.n_steps)
+
+    @args({"y0": [1.0], "times": [0.0, 1.0, 1.0]})
+    def test_times_not_increasing(self):
+        fun, jacobian = _linear([{0: -1.0}])
+        with self.assertRaises(Exception):
+            self.subject(fun, jacobian, **self._subjectKwargs)
+
+    @args(
+        {
+            "fun": _robertson,
+            "jacobian": _robertson_jacobian,
+            "y0": [1.0, 0.0, 0.0],
+            "times": [0.0, 40.0],
+            "max_steps": 5,
+        }
+    )
+    def test_max_steps(self):
+        self.assert_value_error()
@@ -0,0 +1,165 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+from property_utils.units import KILO_JOULE, MOL, JOULE, KELVIN, BAR, CENTI_METER
+
+from chemical_utils.properties.group_additivity import (
+    GroupAdditivityEstimator,
+    GroupDecomposition,
+)
+from chemical_utils.properties.registry import (
+    add_fallback_provider,
+    remove_fallback_provider,
+    get_standard_formation_properties,
+)
+from chemical_utils.substances.substance import c
+from chemical_utils.substances import CARBON, HYDROGEN, OXYGEN, CHLORINE, NITROGEN
+from chemical_utils.tests.base import TestBase
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.properties.group_additivity")
+
+group_additivity_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(group_additivity_test_suite)
+
+
+ACETONE = c(CARBON * 3, HYDROGEN * 6, OXYGEN)
+PROPANE = c(CARBON * 3, HYDROGEN * 8)
+CHLOROMETHANE = c(CARBON, HYDROGEN * 3, CHLORINE)
+METHYLAMINE = c(CARBON, HYDROGEN * 5, NITROGEN)
+
+
+def estimator():
+    _estimator = GroupAdditivityEstimator()
+    _estimator.register_decomposition(ACETONE, {"-CH3": 2, ">C=O": 1}, 18)
+    _estimator.register_decomposition(PROPANE, {"-CH3": 2, "-CH2-": 1}, 18)
+    _estimator.register_decomposition(CHLOROMETHANE, {"-CH3": 1, "-Cl": 1})
+    _estimator.register_decomposition(METHYLAMINE, {"-CH3": 1, "-NH2": 1})
+    return _estimator
+
+
+@add_to(group_additivity_test_suite)
+class TestRegisterDecomposition(TestBase):
+    def subject(self, groups, symmetry_number):
+        return GroupAdditivityEstimator().register_decomposition(
+            ACETONE, groups, symmetry_number
+        )
+
+    @args({"groups": {"-CH3": 2, ">C=O": 1}, "symmetry_number": 18})
+    def test_valid_decomposition(self):
+        self.assertResult(None)
+
+    @args({"groups": {"-CH3": 2, "-C=O": 1}, "symmetry_number": 1})
+    def test_unknown_group(self):
+        self.assert_value_error()
+
+    @args({"groups": {"-CH3": 0}, "symmetry_number": 1})
+    def test_zero_groups(self):
+        self.assert_value_error()
+
+    @args({"groups": {"-CH3": 2}, "symmetry_number": 0})
+    def test_zero_symmetry_number(self):
+        self.assert_value_error()
+
+
+@add_to(group_additivity_test_suite)
+class TestDecomposition(TestBase):
+    def test_registered_decomposition(self):
+        self.assertEqual(
+            estimator().decomposition(ACETONE),
+            GroupDecomposition({"-CH3": 2, ">C=O": 1}, 18),
+        )
+
+    def test_unknown_substance(self):
+        self.assertIsNone(estimator().decomposition(OXYGEN))
+
+    def test_decompose_function_is_memoized(self):
+        calls = []
+
+        def decompose(substance):
+            calls.append(substance)
+            return GroupDecomposition({"-CH3": 2, "-CH2-": 1})
+
+        _estimator = GroupAdditivityEstimator(decompose=decompose)
+        _estimator.decomposition(PROPANE)
+        _estimator.decomposition(PROPANE)
+        self.assertEqual(calls, [PROPANE])
+
+    def test_decompose_function_with_unknown_group(self):
+        _estimator = GroupAdditivityEstimator(
+            decompose=lambda s: GroupDecomposition({"-CH4": 1})
+        )
+        with self.assertRaises(Exception):
+            _estimator.decomposition(PROPANE)
+
+
+@add_to(group_additivity_test_suite)
+class TestEstimates(TestBase):
+    def test_critical_properties(self):
+        properties = estimator().critical_properties(ACETONE)
+        self.assertAlmostEqual(properties.temperature.to_unit(KELVIN).value, 500.248, 3)
+        self.assertAlmostEqual(properties.pressure.to_unit(BAR).value, 48.025, 3)
+        self.assertAlmostEqual(
+            properties.volume.to_unit(CENTI_METER**3 / MOL).value, 209.5
+        )
+
+    def test_standard_formation_properties(self):
+        properties = estimator().standard_formation_properties(PROPANE)
+        self.assertAlmostEqual(
+            properties.enthalpy.to_unit(KILO_JOULE / MOL).value, -105.25
+        )
+        self.assertAlmostEqual(
+            properties.gibbs_energy.to_unit(KILO_JOULE / MOL).value, -25.62
+        )
+
+    def test_standard_formation_properties_of_amine(self):
+        properties = estimator().standard_formation_properties(METHYLAMINE)
+        self.assertAlmostEqual(
+            properties.enthalpy.to_unit(KILO_JOULE / MOL).value, -30.18
+        )
+        self.assertAlmostEqual(
+            properties.gibbs_energy.to_unit(KILO_JOULE / MOL).value, 23.99
+        )
+
+    def test_standard_entropy(self):
+        entropy = estimator().standard_entropy(PROPANE)
+        self.assertAlmostEqual(
+            entropy.to_unit(JOULE / MOL / KELVIN).value, 294.0 - 24.0319, 3
+        )
+
+    def test_standard_entropy_without_contribution(self):
+        self.assertIsNone(estimator().standard_entropy(CHLOROMETHANE))
+
+    def test_unknown_substance(self):
+        self.assertIsNone(estimator().critical_properties(OXYGEN))
+        self.assertIsNone(estimator().standard_formation_properties(OXYGEN))
+        self.assertIsNone(estimator().standard_entropy(OXYGEN))
+
+    def test_batch_estimates_match_single(self):
+        _estimator = estimator()
+        batch = _estimator.estimate_standard_formation_properties(
+            [ACETONE, OXYGEN, PROPANE]
+        )
+        self.assertEqual(
+            batch,
+            [
+                _estimator.standard_formation_properties(ACETONE),
+                None,
+                _estimator.standard_formation_properties(PROPANE),
+            ],
+        )
+
+    def test_fallback_provider(self):
+        _estimator = estimator()
+        add_fallback_provider(_estimator)
+        try:
+            properties = get_standard_formation_properties(ACETONE)
+        finally:
+            remove_fallback_provider(_estimator)
+        self.assertAlmostEqual(
+            properties.enthalpy.to_unit(KILO_JOULE / MOL).value, -217.83
+        )
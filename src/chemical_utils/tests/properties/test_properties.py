@@ -0,0 +1,172 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+from property_utils.units import (
+    KELVIN,
+    CELCIUS,
+    FAHRENHEIT,
+    BAR,
+    PSI,
+    JOULE,
+    KILO_JOULE,
+    MOL,
+    KILO_MOL,
+)
+from property_utils.exceptions import PropertyValidationError
+from property_utils.exceptions.properties.property import (
+    PropertyUnitConversionError,
+)
+
+from chemical_utils.properties.properties import (
+    Temperature,
+    Pressure,
+    MolarEnergy,
+    Entropy,
+    UnitConversion,
+    unit_conversion,
+    convert_value,
+    convert_values,
+    convert_properties,
+)
+from chemical_utils.tests.base import TestBase
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.properties.properties")
+
+properties_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(properties_test_suite)
+
+
+@add_to(properties_test_suite)
+class TestUnitConversion(TestBase):
+    def subject(self, from_unit, to_unit):
+        return unit_conversion(from_unit, to_unit)
+
+    @args({"from_unit": KILO_JOULE / MOL, "to_unit": JOULE / KILO_MOL})
+    def test_factor(self):
+        self.assertResult(UnitConversion(1e6))
+
+    @args({"from_unit": KELVIN, "to_unit": KELVIN})
+    def test_same_units(self):
+        self.assertResult(UnitConversion(1.0))
+
+    @args({"from_unit": KELVIN, "to_unit": CELCIUS})
+    def test_offset(self):
+        self.assertResult(UnitConversion(1.0, -273.15))
+
+    @args({"from_unit": CELCIUS, "to_unit": FAHRENHEIT})
+    def test_factor_and_offset(self):
+        conversion = self.result()
+        self.assertAlmostEqual(conversion.factor, 1.8)
+        self.assertAlmostEqual(conversion.offset, 32)
+
+    @args({"from_unit": KELVIN, "to_unit": BAR})
+    def test_incompatible_units(self):
+        self.assertResultRaises(PropertyUnitConversionError)
+
+    def test_is_cached(self):
+        self.assertIs(unit_conversion(BAR, PSI), unit_conversion(BAR, PSI))
+
+
+@add_to(properties_test_suite)
+class TestConvertValues(TestBase):
+    def subject(self, values, from_unit, to_unit):
+        return convert_values(values, from_unit, to_unit)
+
+    @args({"values": [0, 100], "from_unit": CELCIUS, "to_unit": KELVIN})
+    def test_affine_conversion(self):
+        self.assertResult([273.15, 373.15])
+
+    @args({"values": (1, 2), "from_unit": BAR, "to_unit": BAR})
+    def test_same_units(self):
+        self.assertResult([1, 2])
+
+    @args({"values": [], "from_unit": BAR, "to_unit": PSI})
+    def test_no_values(self):
+        self.assertResult([])
+
+    def test_matches_convert_value(self):
+        self.assertEqual(
+            convert_values([3.5], KILO_JOULE / MOL, JOULE / KILO_MOL),
+            [convert_value(3.5, KILO_JOULE / MOL, JOULE / KILO_MOL)],
+        )
+
+
+@add_to(properties_test_suite)
+class TestConvertProperties(TestBase):
+    def subject(self, properties, unit):
+        return convert_properties(properties, unit)
+
+    @args({"properties": [Temperature(0, CELCIUS), Temperature(300)], "unit": KELVIN})
+    def test_mixed_units(self):
+        self.assertResult([Temperature(273.15), Temperature(300)])
+
+    @args({"properties": [Pressure(1)], "unit": BAR})
+    def test_keeps_class(self):
+        self.assertIsInstance(self.result()[0], Pressure)
+
+
+@add_to(properties_test_suite)
+class TestToUnit(TestBase):
+    def test_cached_conversion_matches_property_utils(self):
+        self.assertAlmostEqual(
+            MolarEnergy(-74.52, KILO_JOULE / MOL).to_unit(JOULE / KILO_MOL).value,
+            -74520000,
+        )
+
+    def test_temperature(self):
+        self.assertEqual(Temperature(25, CELCIUS).to_unit(KELVIN), Temperature(298.15))
+
+    def test_incompatible_units(self):
+        with self.assertRaises(PropertyUnitConversionError):
+            Temperature(25).to_unit(BAR)
+
+
+@add_to(properties_test_suite)
+class TestFromValues(TestBase):
+    def subject(self, cls, values, unit=None):
+        return cls.from_values(values, unit)
+
+    @args({"cls": Temperature, "values": [0, 25.5], "unit": CELCIUS})
+    def test_temperatures(self):
+        self.assertResult([Temperature(0, CELCIUS), Temperature(25.5, CELCIUS)])
+
+    @args({"cls": MolarEnergy, "values": [-1, 2]})
+    def test_default_units(self):
+        self.assertResult([MolarEnergy(-1), MolarEnergy(2)])
+
+    @args({"cls": Pressure, "values": []})
+    def test_no_values(self):
+        self.assertResult([])
+
+    @args({"cls": Pressure, "values": iter([1, 2])})
+    def test_iterator(self):
+        self.assertResult([Pressure(1), Pressure(2)])
+
+    @args({"cls": Temperature, "values": [0, -274], "unit": CELCIUS})
+    def test_below_absolute_zero(self):
+        self.assertResultRaises(PropertyValidationError)
+
+    @args({"cls": Pressure, "values": [1, float("nan")]})
+    def test_nan_pressure(self):
+        self.assertResultRaises(PropertyValidationError)
+
+    @args({"cls": Entropy, "values": [1, -1]})
+    def test_negative_entropy(self):
+        self.assertResultRaises(PropertyValidationError)
+
+    @args({"cls": Pressure, "values": [1, "2"]})
+    def test_non_numeric_value(self):
+        self.assertResultRaises(PropertyValidationError)
+
+    @args({"cls": Pressure, "values": [1, 2], "unit": KELVIN})
+    def test_invalid_units(self):
+        self.assertResultRaises(PropertyValidationError)
+
+    def test_temperature_validation_in_other_units(self):
+        with self.assertRaises(PropertyValidationError):
+            Temperature(-460, FAHRENHEIT)
@@ -0,0 +1,51 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+
+from chemical_utils.properties.providers import MappingPropertyProvider
+from chemical_utils.properties.properties import (
+    Entropy,
+    FormationProperties,
+    MolarEnergy,
+)
+from chemical_utils.tests.base import TestBase
+from chemical_utils.tests.data import TS_PY, TS2_PY3
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.properties.providers")
+
+providers_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(providers_test_suite)
+
+
+FORMATION = FormationProperties(MolarEnergy(1), MolarEnergy(2))
+
+
+@add_to(providers_test_suite)
+class TestMappingPropertyProvider(TestBase):
+    def subject(self, method, substance):
+        provider = MappingPropertyProvider(
+            standard_formation_properties={"TsPy": FORMATION},
+            standard_entropies={"Ts2Py3": Entropy(3)},
+        )
+        return getattr(provider, method)(substance)
+
+    @args({"method": "standard_formation_properties", "substance": TS_PY})
+    def test_formation_properties(self):
+        self.assertResult(FORMATION)
+
+    @args({"method": "standard_entropy", "substance": TS2_PY3})
+    def test_entropy(self):
+        self.assertResult(Entropy(3))
+
+    @args({"method": "standard_entropy", "substance": TS_PY})
+    def test_missing_key(self):
+        self.assertResult(None)
+
+    @args({"method": "critical_properties", "substance": TS_PY})
+    def test_missing_mapping(self):
+        self.assertResult(None)
@@ -0,0 +1,242 @@
+from unittest import TestSuite, TextTestRunner
+from threading import Thread
+import pickle
+
+from chemical_utils.properties.registry import (
+    add_fallback_provider,
+    remove_fallback_provider,
+    configure_fallback_cache,
+    clear_fallback_cache,
+    get_property_source,
+    REGISTERED,
+    FALLBACK_CACHE_SIZE,
+    create_standard_entropy,
+    get_standard_entropy,
+    registry_overlay,
+    registry_version,
+    without_registry_cache,
+)
+from chemical_utils.properties.properties import Entropy
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.tests.base import TestBase
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+from chemical_utils.tests.data import TESTIUM2, TS_PY, TS_PY_AN, reaction_1, reaction_2
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.properties.registry")
+
+registry_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(registry_test_suite)
+
+
+@add_to(registry_test_suite)
+class TestRegistryOverlay(TestBase):
+    def test_override_is_visible_inside_overlay(self):
+        with registry_overlay():
+            create_standard_entropy(TESTIUM2, Entropy(10))
+            self.assertEqual(get_standard_entropy(TESTIUM2), Entropy(10))
+
+    def test_override_is_discarded_on_exit(self):
+        with registry_overlay():
+            create_standard_entropy(TESTIUM2, Entropy(10))
+        self.assertEqual(get_standard_entropy(TESTIUM2), Entropy(50))
+
+    def test_new_substance_inside_overlay(self):
+        with registry_overlay():
+            create_standard_entropy(TS_PY, Entropy(10))
+        self.assertIsNone(get_standard_entropy(TS_PY))
+
+    def test_nested_overlay_inherits_overrides(self):
+        with registry_overlay():
+            create_standard_entropy(TESTIUM2, Entropy(10))
+            with registry_overlay():
+                self.assertEqual(get_standard_entropy(TESTIUM2), Entropy(10))
+                create_standard_entropy(TESTIUM2, Entropy(20))
+            self.assertEqual(get_standard_entropy(TESTIUM2), Entropy(10))
+
+    def test_override_is_not_visible_from_other_threads(self):
+        seen = []
+        with registry_overlay():
+            create_standard_entropy(TESTIUM2, Entropy(10))
+            thread = Thread(target=lambda: seen.append(get_standard_entropy(TESTIUM2)))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [Entropy(50)])
+
+    def test_version_changes_inside_overlay(self):
+        version = registry_version()
+        with registry_overlay():
+            self.assertNotEqual(registry_version(), version)
+        self.assertEqual(registry_version(), version)
+
+    def test_reaction_properties_follow_overlay(self):
+        self.assertEqual(reaction_1.standard_entropy_change, Entropy(105))
+        with registry_overlay():
+            create_standard_entropy(TESTIUM2, Entropy(40))
+            self.assertEqual(reaction_1.standard_entropy_change, Entropy(115))
+        self.assertEqual(reaction_1.standard_entropy_change, Entropy(105))
+
+    def test_cached_value_is_not_current_inside_overlay(self):
+        reaction = 2 * reaction_1
+        descriptor = vars(ChemicalReaction)["standard_entropy_change"]
+        self.assertFalse(descriptor.is_cached(reaction))
+        _ = reaction.standard_entropy_change
+        self.assertTrue(descriptor.is_cached(reaction))
+        with registry_overlay():
+            self.assertFalse(descriptor.is_cached(reaction))
+
+
+class _EntropyProvider:
+    def __init__(self, entropy, entropies=None):
+        self.entropy = entropy
+        self.entropies = entropies or {}
+
+    def critical_properties(self, substance):
+        return None
+
+    def standard_formation_properties(self, substance):
+        return None
+
+    def standard_entropy(self, substance):
+        return self.entropies.get(substance, self.entropy)
+
+
+@add_to(registry_test_suite)
+class TestWithoutRegistryCache(TestBase):
+    def test_cached_values_are_removed(self):
+        reaction = 2 * reaction_1
+        _ = reaction.standard_entropy_change
+        state = without_registry_cache(vars(reaction))
+        self.assertIn("reactants", state)
+        self.assertFalse([name for name in state if name.startswith("_registry")])
+
+    def test_pickled_reaction_does_not_keep_cached_values(self):
+        reaction = 2 * reaction_1
+        _ = reaction.standard_entropy_change
+        unpickled = pickle.loads(pickle.dumps(reaction))
+        descriptor = vars(ChemicalReaction)["standard_entropy_change"]
+        self.assertFalse(descriptor.is_cached(unpickled))
+        self.assertEqual(unpickled.standard_entropy_change, Entropy(210))
+
+
+@add_to(registry_test_suite)
+class TestFallbackProviders(TestBase):
+    def setUp(self):
+        self.providers = []
+
+    def tearDown(self):
+        for provider in self.providers:
+            remove_fallback_provider(provider)
+
+    def add_provider(self, entropy, entropies=None):
+        provider = _EntropyProvider(entropy, entropies)
+        add_fallback_provider(provider)
+        self.providers.append(provider)
+
+    def test_provider_supplies_missing_value(self):
+        self.add_provider(Entropy(10))
+        self.assertEqual(get_standard_entropy(TS_PY), Entropy(10))
+
+    def test_registered_value_takes_precedence(self):
+        self.add_provider(Entropy(10))
+        self.assertEqual(get_standard_entropy(TESTIUM2), Entropy(50))
+
+    def test_providers_are_asked_in_order(self):
+        self.add_provider(None)
+        self.add_provider(Entropy(20))
+        self.add_provider(Entropy(30))
+        self.assertEqual(get_standard_entropy(TS_PY), Entropy(20))
+
+    def test_removed_provider_is_not_asked(self):
+        provider = _EntropyProvider(Entropy(10))
+        add_fallback_provider(provider)
+        remove_fallback_provider(provider)
+        self.assertIsNone(get_standard_entropy(TS_PY))
+
+    def test_adding_provider_changes_version(self):
+        version = registry_version()
+        self.add_provider(Entropy(10))
+        self.assertNotEqual(registry_version(), version)
+
+    def test_reaction_properties_use_provider(self):
+        self.assertIsNone(reaction_2.standard_entropy_change)
+        self.add_provider(Entropy(10), {TS_PY: Entropy(30)})
+        self.assertEqual(reaction_2.standard_entropy_change, Entropy(10))
+
+
+@add_to(registry_test_suite)
+class TestGetPropertySource(TestBase):
+    def setUp(self):
+        self.provider = _EntropyProvider(None, {TS_PY: Entropy(30)})
+        add_fallback_provider(self.provider, "database")
+
+    def tearDown(self):
+        remove_fallback_provider(self.provider)
+
+    def test_registered_property(self):
+        self.assertEqual(get_property_source(TESTIUM2, "standard_entropy"), REGISTERED)
+
+    def test_provided_property(self):
+        self.assertEqual(get_property_source(TS_PY, "standard_entropy"), "database")
+
+    def test_missing_property(self):
+        self.assertIsNone(get_property_source(TS_PY, "critical_properties"))
+
+    def test_property_created_in_overlay(self):
+        with registry_overlay():
+            create_standard_entropy(TS_PY, Entropy(10))
+            self.assertEqual(get_property_source(TS_PY, "standard_entropy"), REGISTERED)
+
+    def test_unknown_property(self):
+        with self.assertRaises(ChemicalUtilsValueError):
+            get_property_source(TS_PY, "entropy")
+
+
+@add_to(registry_test_suite)
+class TestFallbackCache(TestBase):
+    def setUp(self):
+        self.calls = []
+        self.provider = _EntropyProvider(None, {TS_PY: Entropy(30)})
+        standard_entropy = self.provider.standard_entropy
+
+        def counting_standard_entropy(substance):
+            self.calls.append(substance)
+            return standard_entropy(substance)
+
+        self.provider.standard_entropy = counting_standard_entropy
+        add_fallback_provider(self.provider)
+
+    def tearDown(self):
+        remove_fallback_provider(self.provider)
+        configure_fallback_cache(FALLBACK_CACHE_SIZE)
+
+    def test_provider_is_asked_once(self):
+        get_standard_entropy(TS_PY)
+        get_standard_entropy(TS_PY)
+        self.assertEqual(self.calls, [TS_PY])
+
+    def test_missing_value_is_cached(self):
+        get_standard_entropy(TS_PY_AN)
+        get_standard_entropy(TS_PY_AN)
+        self.assertEqual(self.calls, [TS_PY_AN])
+
+    def test_clear_fallback_cache(self):
+        get_standard_entropy(TS_PY)
+        clear_fallback_cache()
+        get_standard_entropy(TS_PY)
+        self.assertEqual(self.calls, [TS_PY, TS_PY])
+
+    def test_least_recently_used_is_evicted(self):
+        configure_fallback_cache(1)
+        get_standard_entropy(TS_PY)
+        get_standard_entropy(TS_PY_AN)
+        get_standard_entropy(TS_PY)
+        self.assertEqual(self.calls, [TS_PY, TS_PY_AN, TS_PY])
+
+    def test_remove_unknown_provider(self):
+        with self.assertRaises(ChemicalUtilsValueError):
+            remove_fallback_provider(_EntropyProvider(None))
@@ -0,0 +1,172 @@
+from unittest import TestSuite, TextTestRunner
+from tempfile import TemporaryDirectory
+from threading import Thread
+from os import path
+
+from property_utils.units import JOULE, MOL, KELVIN
+
+from chemical_utils.properties.store import SQLitePropertyStore
+from chemical_utils.properties.registry import (
+    add_fallback_provider,
+    remove_fallback_provider,
+    get_standard_entropy,
+    get_property_source,
+)
+from chemical_utils.properties.properties import (
+    Temperature,
+    Pressure,
+    MolarVolume,
+    CriticalProperties,
+    MolarEnergy,
+    FormationProperties,
+    Entropy,
+)
+from chemical_utils.tests.base import TestBase
+from chemical_utils.substances.substance import ChemicalCompound, ChemicalIon, c
+from chemical_utils.substances import CARBON, HYDROGEN, OXYGEN
+from chemical_utils.tests.data import TESTIUM, PYTHONIUM, TS_PY, TS_PY_AN
+from chemical_utils.tests.utils import def_load_tests, add_to
+
+load_tests = def_load_tests("chemical_utils.properties.store")
+
+store_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(store_test_suite)
+
+
+ETHANOL = c(CARBON, HYDROGEN * 3, CARBON, HYDROGEN * 2, OXYGEN, HYDROGEN)
+DIMETHYL_ETHER = c(CARBON, HYDROGEN * 3, OXYGEN, CARBON, HYDROGEN * 3)
+
+
+@add_to(store_test_suite)
+class TestSQLitePropertyStore(TestBase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = path.join(self.directory.name, "properties.db")
+        self.store = SQLitePropertyStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_critical_properties(self):
+        self.store.create_critical_properties(
+            TS_PY, Temperature(500), Pressure(40), MolarVolume(0.2)
+        )
+        self.assertEqual(
+            self.store.critical_properties(TS_PY),
+            CriticalProperties(Temperature(500), Pressure(40), MolarVolume(0.2)),
+        )
+
+    def test_standard_formation_properties(self):
+        self.store.create_standard_formation_properties(
+            TS_PY, MolarEnergy(1), MolarEnergy(2)
+        )
+        self.assertEqual(
+            self.store.standard_formation_properties(TS_PY),
+            FormationProperties(MolarEnergy(1), MolarEnergy(2)),
+        )
+
+    def test_missing_property(self):
+        self.assertIsNone(self.store.standard_entropy(TS_PY))
+
+    def test_values_are_stored_in_default_units(self):
+        self.store.create_standard_entropy(TS_PY, Entropy(1, JOULE / MOL / KELVIN))
+        self.assertEqual(self.store.standard_entropy(TS_PY).value, 1000)
+
+    def test_bulk_upsert_overrides(self):
+        self.store.create_many_standard_entropies(
+            [(TS_PY, Entropy(1)), (TS_PY_AN, Entropy(2))]
+        )
+        self.store.create_many_standard_entropies([(TS_PY, Entropy(3))])
+        self.assertEqual(self.store.standard_entropy(TS_PY), Entropy(3))
+        self.assertEqual(self.store.standard_entropy(TS_PY_AN), Entropy(2))
+
+    def test_writes_clear_cache(self):
+        self.assertIsNone(self.store.standard_entropy(TS_PY))
+        self.store.create_standard_entropy(TS_PY, Entropy(1))
+        self.assertEqual(self.store.standard_entropy(TS_PY), Entropy(1))
+
+    def test_shared_file(self):
+        self.store.create_standard_entropy(TS_PY, Entropy(1))
+        other = SQLitePropertyStore(self.path)
+        try:
+            self.assertEqual(other.standard_entropy(TS_PY), Entropy(1))
+        finally:
+            other.close()
+
+    def test_writes_of_other_store_after_clear_cache(self):
+        other = SQLitePropertyStore(self.path)
+        try:
+            self.assertIsNone(self.store.standard_entropy(TS_PY))
+            other.create_standard_entropy(TS_PY, Entropy(1))
+            self.assertIsNone(self.store.standard_entropy(TS_PY))
+            self.store.clear_cache()
+            self.assertEqual(self.store.standard_entropy(TS_PY), Entropy(1))
+        finally:
+            other.close()
+
+    def test_read_from_other_thread(self):
+        self.store.create_standard_entropy(TS_PY, Entropy(1))
+        self.store.clear_cache()
+        seen = []
+        thread = Thread(target=lambda: seen.append(self.store.standard_entropy(TS_PY)))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [Entropy(1)])
+
+    def test_isomers_have_own_keys(self):
+        self.store.create_standard_entropy(ETHANOL, Entropy(1))
+        self.store.create_standard_entropy(DIMETHYL_ETHER, Entropy(2))
+        self.assertEqual(self.store.standard_entropy(ETHANOL), Entropy(1))
+        self.assertEqual(self.store.standard_entropy(DIMETHYL_ETHER), Entropy(2))
+        self.assertIsNone(
+            self.store.standard_entropy(ChemicalCompound(PYTHONIUM, TESTIUM))
+        )
+
+    def test_ions_have_own_key(self):
+        self.store.create_standard_entropy(TS_PY, Entropy(1))
+        self.assertIsNone(self.store.standard_entropy(ChemicalIon(TS_PY, 1)))
+
+    def test_registry_fallback(self):
+        add_fallback_provider(self.store, "sqlite")
+        try:
+            self.assertIsNone(get_standard_entropy(TS_PY))
+            self.store.create_standard_entropy(TS_PY, Entropy(1))
+            self.assertEqual(get_standard_entropy(TS_PY), Entropy(1))
+            self.assertEqual(get_property_source(TS_PY, "standard_entropy"), "sqlite")
+        finally:
+            remove_fallback_provider(self.store)
+
+
+@add_to(store_test_suite)
+class TestInMemorySQLitePropertyStore(TestBase):
+    def setUp(self):
+        self.store = SQLitePropertyStore(":memory:", cache_size=None)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_concurrent_threads(self):
+        errors = []
+
+        def write_and_read(n):
+            try:
+                for _ in range(50):
+                    self.store.create_standard_entropy(TS_PY, Entropy(n))
+                    self.store.standard_entropy(TS_PY_AN)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                errors.append(error)
+
+        threads = [Thread(target=write_and_read, args=(n,)) for n in range(1, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertIn(
+            self.store.standard_entropy(TS_PY), [Entropy(n) for n in range(1, 5)]
+        )
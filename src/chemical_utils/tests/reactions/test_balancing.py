@@ -0,0 +1,113 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.reactions.balancing import balance_reaction, ACIDIC, BASIC
+from chemical_utils.substances import (
+    MANGANESE,
+    OXYGEN,
+    IRON,
+    IODINE,
+    CHROMIUM,
+    HYDROGEN2,
+    OXYGEN2,
+    WATER,
+    METHANE,
+    CARBON_MONOXIDE,
+    CARBON_DIOXIDE,
+    ELECTRON,
+)
+from chemical_utils.substances.substance import ChemicalIon, c
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.reactions.reaction_utils import TestReaction
+
+load_tests = def_load_tests("chemical_utils.reactions.balancing")
+
+balancing_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(balancing_test_suite)
+
+
+PERMANGANATE = ChemicalIon(c(MANGANESE, OXYGEN * 4), -1)
+DICHROMATE = ChemicalIon(c(CHROMIUM * 2, OXYGEN * 7), -2)
+
+
+@add_to(balancing_test_suite)
+class TestBalanceReaction(TestReaction):
+    produced_type = ChemicalReaction
+
+    def subject(self, reactants, products, medium=None):
+        return balance_reaction(reactants, products, medium)
+
+    @args({"reactants": [METHANE, OXYGEN2], "products": [CARBON_DIOXIDE, WATER]})
+    def test_combustion(self):
+        self.assert_result("CH4 + 2O2 -> CO2 + 2H2O")
+
+    @args(
+        {
+            "reactants": [PERMANGANATE, ChemicalIon(IODINE, -1)],
+            "products": [c(MANGANESE, OXYGEN * 2), c(IODINE * 2)],
+            "medium": BASIC,
+        }
+    )
+    def test_basic_medium(self):
+        self.assert_result("2MnO4^- + 6I^- + 4H2O -> 2MnO2 + 3I2 + 8OH^-")
+
+    @args(
+        {
+            "reactants": [DICHROMATE, ChemicalIon(IRON, 2)],
+            "products": [ChemicalIon(CHROMIUM, 3), ChemicalIon(IRON, 3)],
+            "medium": ACIDIC,
+        }
+    )
+    def test_acidic_medium(self):
+        self.assert_result("Cr2O7^2- + 6Fe^2+ + 14H^+ -> 2Cr^3+ + 6Fe^3+ + 7H2O")
+
+    @args(
+        {
+            "reactants": [PERMANGANATE, ELECTRON],
+            "products": [ChemicalIon(MANGANESE, 2)],
+            "medium": ACIDIC,
+        }
+    )
+    def test_half_reaction(self):
+        self.assert_result("MnO4^- + 5e^- + 8H^+ -> Mn^2+ + 4H2O")
+
+    @args(
+        {
+            "reactants": [ChemicalIon(IRON, 3)],
+            "products": [ChemicalIon(IRON, 2)],
+            "medium": ACIDIC,
+        }
+    )
+    def test_missing_electron(self):
+        self.assert_value_error()
+
+    @args({"reactants": [CARBON_DIOXIDE], "products": [METHANE]})
+    def test_impossible(self):
+        self.assert_value_error()
+
+    @args(
+        {
+            "reactants": [CARBON_MONOXIDE, HYDROGEN2, OXYGEN2],
+            "products": [CARBON_DIOXIDE, WATER],
+        }
+    )
+    def test_many_independent_solutions(self):
+        self.assert_value_error()
+
+    @args({"reactants": [HYDROGEN2, WATER], "products": [OXYGEN2]})
+    def test_negative_coefficient(self):
+        self.assert_value_error()
+
+    @args({"reactants": [HYDROGEN2], "products": [HYDROGEN2]})
+    def test_repeated_substance(self):
+        self.assert_value_error()
+
+    @args({"reactants": [HYDROGEN2, OXYGEN2], "products": [WATER], "medium": "neutral"})
+    def test_unknown_medium(self):
+        self.assert_value_error()
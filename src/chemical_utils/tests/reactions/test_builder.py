@@ -0,0 +1,117 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.builder import ChemicalReactionBuilder
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.substances.substance import ChemicalIon, Electron
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    TS_PY,
+    TS2_PY3,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.reactions.reaction_utils import TestReaction
+
+load_tests = def_load_tests("chemical_utils.reactions.builder")
+
+builder_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(builder_test_suite)
+
+
+@add_to(builder_test_suite)
+class TestChemicalReactionBuilderBuild(TestReaction):
+    produced_type = ChemicalReaction
+
+    def subject(self, reactants, products):
+        builder = ChemicalReactionBuilder()
+        for reactant in reactants:
+            builder.add_reactant(*reactant)
+        for product in products:
+            builder.add_product(*product)
+        return builder.build()
+
+    @args({"reactants": [(TESTIUM,), (PYTHONIUM,)], "products": [(TS_PY,)]})
+    def test_elements_to_compound(self):
+        self.assert_result("Ts + Py -> TsPy")
+
+    @args({"reactants": [(TESTIUM, 2), (PYTHONIUM, 3)], "products": [(TS2_PY3,)]})
+    def test_coefficients_to_compound(self):
+        self.assert_result("2Ts + 3Py -> Ts2Py3")
+
+    @args(
+        {
+            "reactants": [(2 * TS_PY,), (PYTHONIUM,)],
+            "products": [(TESTIUM2,), (PYTHONIUM3,)],
+        }
+    )
+    def test_with_factors(self):
+        self.assert_result("2TsPy + Py -> Ts2 + Py3")
+
+    @args({"reactants": [(PYTHONIUM,)], "products": [(TESTIUM,)]})
+    def test_unbalanced(self):
+        self.assert_unbalanced_reaction()
+
+    @args({"reactants": [], "products": [(TESTIUM,)]})
+    def test_without_reactants(self):
+        self.assert_value_error()
+
+    @args({"reactants": [(TESTIUM, 0)], "products": [(TESTIUM,)]})
+    def test_with_zero_coefficient(self):
+        self.assert_value_error()
+
+    @args({"reactants": [(2,)], "products": [(TESTIUM,)]})
+    def test_with_numeric(self):
+        self.assert_type_error()
+
+    def test_equals_validated_reaction(self):
+        builder = ChemicalReactionBuilder()
+        builder.add_reactant(TESTIUM2).add_reactant(PYTHONIUM3).add_product(TS2_PY3)
+        self.assertEqual(
+            builder.build(), ChemicalReaction(TESTIUM2 + PYTHONIUM3, TS2_PY3)
+        )
+
+    def test_builder_reuse_does_not_change_built_reaction(self):
+        builder = ChemicalReactionBuilder()
+        builder.add_reactant(TESTIUM).add_product(TESTIUM)
+        reaction = builder.build()
+        builder.add_reactant(PYTHONIUM).add_product(PYTHONIUM)
+        self.assertEqual(str(reaction), "Ts -> Ts")
+
+
+@add_to(builder_test_suite)
+class TestChemicalReactionBuilderIsBalanced(TestReaction):
+    def subject(self, reactants, products):
+        builder = ChemicalReactionBuilder()
+        for reactant in reactants:
+            builder.add_reactant(reactant)
+        for product in products:
+            builder.add_product(product)
+        return builder.is_balanced()
+
+    @args({"reactants": [TESTIUM, PYTHONIUM], "products": [TS_PY]})
+    def test_balanced(self):
+        self.assertResult(True)
+
+    @args({"reactants": [TESTIUM], "products": [TS_PY]})
+    def test_unbalanced(self):
+        self.assertResult(False)
+
+    @args({"reactants": [], "products": []})
+    def test_empty(self):
+        self.assertResult(True)
+
+    @args({"reactants": [ChemicalIon(TESTIUM, 1), Electron()], "products": [TESTIUM]})
+    def test_balanced_charge(self):
+        self.assertResult(True)
+
+    @args({"reactants": [ChemicalIon(TESTIUM, 1)], "products": [TESTIUM]})
+    def test_unbalanced_charge(self):
+        self.assertResult(False)
@@ -0,0 +1,151 @@
+from unittest import TestSuite, TextTestRunner
+from fractions import Fraction
+from math import isnan
+from tempfile import TemporaryDirectory
+import json
+import os
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.columnar import (
+    ColumnarStore,
+    write_columnar_store,
+)
+from chemical_utils.reactions.reaction import r
+from chemical_utils.substances import IRON, ELECTRON
+from chemical_utils.substances.substance import ChemicalIon
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    TS_PY,
+    TS2_PY3,
+    reaction_1,
+    reaction_2,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.base import TestBase
+
+load_tests = def_load_tests("chemical_utils.reactions.columnar")
+
+columnar_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(columnar_test_suite)
+
+
+IRON_REDUCTION = r(ChemicalIon(IRON, 3) + ELECTRON, ChemicalIon(IRON, 2))
+
+
+class TestColumnarStoreBase(TestBase):
+    def setUp(self):
+        self._directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self._directory.cleanup)
+
+    def subject(self, reactions):
+        write_columnar_store(self._directory.name, reactions)
+        store = ColumnarStore(self._directory.name)
+        self.addCleanup(store.close)
+        return store
+
+
+@add_to(columnar_test_suite)
+class TestColumnarStore(TestColumnarStoreBase):
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_round_trip(self):
+        self.assertEqual(list(self.result().reactions), [reaction_1, reaction_2])
+
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_species_in_order_of_appearance(self):
+        self.assertEqual(
+            list(self.result().species),
+            [TESTIUM2, PYTHONIUM3, TS2_PY3, TESTIUM, PYTHONIUM, TS_PY],
+        )
+
+    @args({"reactions": [reaction_1 * Fraction(1, 2)]})
+    def test_fractional_coefficients(self):
+        reaction = self.result().reactions[0]
+        self.assertEqual(reaction, reaction_1 * Fraction(1, 2))
+        self.assertEqual(
+            [f.stoichiometric_coefficient for f in reaction.reactants],
+            [Fraction(1, 2), Fraction(1, 2)],
+        )
+
+    @args({"reactions": [IRON_REDUCTION]})
+    def test_ions_and_electrons(self):
+        store = self.result()
+        self.assertEqual(store.reactions[0], IRON_REDUCTION)
+        self.assertEqual(list(store.column("species_charge")), [3, 0, 2])
+
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_negative_index(self):
+        self.assertEqual(self.result().reactions[-1], reaction_2)
+
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_slice(self):
+        self.assertEqual(self.result().reactions[1:], [reaction_2])
+
+    @args({"reactions": [reaction_1]})
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            _ = self.result().reactions[1]
+
+    @args({"reactions": []})
+    def test_empty(self):
+        store = self.result()
+        self.assertEqual(len(store.reactions), 0)
+        self.assertEqual(len(store.column("factor_species")), 0)
+
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_unknown_column(self):
+        with self.assertRaises(ChemicalUtilsValueError):
+            self.result().column("reaction_rate")
+
+
+@add_to(columnar_test_suite)
+class TestColumnarStoreProperties(TestColumnarStoreBase):
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_property_columns(self):
+        enthalpy = self.result().column("reaction_standard_enthalpy_change")
+        self.assertEqual(enthalpy[0], 100.0)
+        self.assertTrue(isnan(enthalpy[1]))
+
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_known_changes_are_kept(self):
+        reaction = self.result().reactions[0]
+        # pylint: disable=protected-access
+        self.assertEqual(reaction._standard_enthalpy_change_value, 100.0)
+        self.assertEqual(reaction._standard_gibbs_energy_change_value, 200.0)
+
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_unknown_changes(self):
+        reaction = self.result().reactions[1]
+        self.assertIsNone(reaction.standard_enthalpy_change)
+
+    @args({"reactions": [reaction_1]})
+    def test_molecular_weights(self):
+        self.assertEqual(
+            list(self.result().column("species_molecular_weight")),
+            [s.molecular_weight for s in (TESTIUM2, PYTHONIUM3, TS2_PY3)],
+        )
+
+
+@add_to(columnar_test_suite)
+class TestColumnarStoreFormat(TestColumnarStoreBase):
+    def subject(self, byteorder):
+        write_columnar_store(self._directory.name, [reaction_1])
+        meta_path = os.path.join(self._directory.name, "meta.json")
+        with open(meta_path, encoding="utf-8") as file:
+            meta = json.load(file)
+        meta["byteorder"] = byteorder
+        with open(meta_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        return ColumnarStore(self._directory.name)
+
+    @args({"byteorder": "middle"})
+    def test_foreign_byte_order(self):
+        self.assert_value_error()
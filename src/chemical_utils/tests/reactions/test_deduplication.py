@@ -0,0 +1,124 @@
+from unittest import TestSuite, TextTestRunner
+from tempfile import TemporaryDirectory
+from os import listdir
+
+from chemical_utils.reactions.deduplication import (
+    ReactionDeduplicator,
+    deduplicate_reactions,
+)
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.exceptions.base import ChemicalUtilsValueError
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    TS_PY,
+    TS2_PY3,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.reactions.reaction_utils import TestReaction
+
+load_tests = def_load_tests("chemical_utils.reactions.deduplication")
+
+deduplication_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(deduplication_test_suite)
+
+
+REACTION_A = ChemicalReaction(TESTIUM2 + PYTHONIUM3, TS2_PY3)
+REACTION_A_REORDERED = ChemicalReaction(PYTHONIUM3 + TESTIUM2, TS2_PY3)
+REACTION_B = ChemicalReaction(TESTIUM + PYTHONIUM, TS_PY)
+REACTION_B_REORDERED = ChemicalReaction(PYTHONIUM + TESTIUM, TS_PY)
+REACTION_B_DOUBLED = ChemicalReaction(2 * TESTIUM + 2 * PYTHONIUM, 2 * TS_PY)
+REACTION_C = ChemicalReaction(2 * TS_PY + PYTHONIUM, TS2_PY3)
+# REACTION_A with TsPy on both sides; same net stoichiometry.
+REACTION_A_CATALYZED = ChemicalReaction(TS_PY + TESTIUM2 + PYTHONIUM3, TS_PY + TS2_PY3)
+
+REACTIONS = [
+    REACTION_A,
+    REACTION_B,
+    REACTION_A_REORDERED,
+    REACTION_B_DOUBLED,
+    REACTION_B_REORDERED,
+    REACTION_C,
+    REACTION_A,
+    REACTION_A_CATALYZED,
+    REACTION_A_CATALYZED,
+]
+
+UNIQUE_REACTIONS = [
+    REACTION_A,
+    REACTION_B,
+    REACTION_B_DOUBLED,
+    REACTION_C,
+    REACTION_A_CATALYZED,
+]
+
+
+@add_to(deduplication_test_suite)
+class TestCanonicalKey(TestReaction):
+    def test_reordered_reactions_have_equal_keys(self):
+        self.assertEqual(REACTION_A.canonical_key, REACTION_A_REORDERED.canonical_key)
+        self.assertEqual(
+            hash(REACTION_A.canonical_key), hash(REACTION_A_REORDERED.canonical_key)
+        )
+
+    def test_key_is_cached(self):
+        self.assertIs(REACTION_A.canonical_key, REACTION_A.canonical_key)
+
+    def test_scaled_reactions_have_different_keys(self):
+        self.assertNotEqual(REACTION_B.canonical_key, REACTION_B_DOUBLED.canonical_key)
+
+    def test_substances_on_both_sides_are_kept(self):
+        self.assertEqual(REACTION_A.stoichiometry, REACTION_A_CATALYZED.stoichiometry)
+        self.assertNotEqual(
+            REACTION_A.canonical_key, REACTION_A_CATALYZED.canonical_key
+        )
+
+
+@add_to(deduplication_test_suite)
+class TestDeduplicateReactions(TestReaction):
+    def test_in_memory(self):
+        self.assertEqual(list(deduplicate_reactions(REACTIONS)), UNIQUE_REACTIONS)
+
+    def test_with_spill(self):
+        with TemporaryDirectory() as directory:
+            self.assertEqual(
+                list(deduplicate_reactions(REACTIONS, 1, directory)),
+                UNIQUE_REACTIONS,
+            )
+            self.assertEqual(listdir(directory), [])
+
+    def test_empty(self):
+        self.assertEqual(list(deduplicate_reactions([])), [])
+
+
+@add_to(deduplication_test_suite)
+class TestReactionDeduplicator(TestReaction):
+    def test_length_counts_spilled_keys(self):
+        with ReactionDeduplicator(memory_limit=2) as deduplicator:
+            for reaction in REACTIONS:
+                deduplicator.add(reaction)
+            self.assertEqual(len(deduplicator), len(UNIQUE_REACTIONS))
+
+    def test_spilled_key_is_found(self):
+        with ReactionDeduplicator(memory_limit=1) as deduplicator:
+            deduplicator.add(REACTION_A)
+            deduplicator.add(REACTION_B)
+            self.assertFalse(deduplicator.add(REACTION_A_REORDERED))
+
+    def test_close_forgets_keys(self):
+        deduplicator = ReactionDeduplicator(memory_limit=1)
+        deduplicator.add(REACTION_A)
+        deduplicator.add(REACTION_B)
+        deduplicator.close()
+        self.assertEqual(len(deduplicator), 0)
+        self.assertTrue(deduplicator.add(REACTION_A))
+
+    def test_invalid_memory_limit(self):
+        with self.assertRaises(ChemicalUtilsValueError):
+            ReactionDeduplicator(memory_limit=0)
@@ -0,0 +1,125 @@
+from unittest import TestSuite, TextTestRunner
+from concurrent.futures import ThreadPoolExecutor
+from math import log
+
+from unittest_extensions import args
+from property_utils.units import CELCIUS
+
+from chemical_utils.reactions.equilibrium import (
+    EquilibriumConstantSweep,
+    ln_equilibrium_constants,
+    GAS_CONSTANT,
+    STANDARD_TEMPERATURE,
+)
+from chemical_utils.properties.properties import Entropy
+from chemical_utils.tests.data import (
+    TESTIUM2,
+    PYTHONIUM3,
+    TS2_PY3,
+    reaction_1,
+    reaction_2,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.base import TestBase
+
+load_tests = def_load_tests("chemical_utils.reactions.equilibrium")
+
+equilibrium_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(equilibrium_test_suite)
+
+
+def _ln_k(temperature, heat_capacity_change=0.0):
+    # reaction_1: dH = 100, dG = 200 at the standard temperature.
+    enthalpy = 100 + heat_capacity_change * (temperature - STANDARD_TEMPERATURE)
+    entropy = -100 / STANDARD_TEMPERATURE + heat_capacity_change * log(
+        temperature / STANDARD_TEMPERATURE
+    )
+    return -(enthalpy - temperature * entropy) / (GAS_CONSTANT * temperature)
+
+
+@add_to(equilibrium_test_suite)
+class TestLnEquilibriumConstants(TestBase):
+    def subject(self, reactions, temperatures, **kwargs):
+        return ln_equilibrium_constants(reactions, temperatures, **kwargs)
+
+    def assert_rows(self, rows):
+        result = self.result()
+        self.assertEqual(len(result), len(rows))
+        for result_row, row in zip(result, rows):
+            if row is None:
+                self.assertIsNone(result_row)
+                continue
+            for value, expected in zip(result_row, row):
+                self.assertAlmostEqual(value, expected, places=12)
+
+    @args({"reactions": [reaction_1], "temperatures": [STANDARD_TEMPERATURE]})
+    def test_standard_temperature(self):
+        self.assert_rows([[-200 / (GAS_CONSTANT * STANDARD_TEMPERATURE)]])
+
+    @args({"reactions": [reaction_1], "temperatures": [300, 600, 1200]})
+    def test_temperature_grid(self):
+        self.assert_rows([[_ln_k(300), _ln_k(600), _ln_k(1200)]])
+
+    @args({"reactions": [reaction_1], "temperatures": [25], "unit": CELCIUS})
+    def test_temperature_units(self):
+        self.assert_rows([[_ln_k(298.15)]])
+
+    @args({"reactions": [reaction_2, reaction_1], "temperatures": [500]})
+    def test_unknown_thermochemistry(self):
+        self.assert_rows([None, [_ln_k(500)]])
+
+    @args(
+        {
+            "reactions": [reaction_1],
+            "temperatures": [STANDARD_TEMPERATURE, 800],
+            "heat_capacities": {
+                TESTIUM2: Entropy(30),
+                PYTHONIUM3: Entropy(20),
+                TS2_PY3: Entropy(60),
+            },
+        }
+    )
+    def test_heat_capacity_correction(self):
+        self.assert_rows([[_ln_k(STANDARD_TEMPERATURE, 10), _ln_k(800, 10)]])
+
+    @args(
+        {
+            "reactions": [reaction_1],
+            "temperatures": [800],
+            "heat_capacities": {TESTIUM2: Entropy(30), PYTHONIUM3: Entropy(20)},
+        }
+    )
+    def test_missing_heat_capacity(self):
+        self.assert_rows([None])
+
+    @args({"reactions": [reaction_1], "temperatures": [300, 0]})
+    def test_zero_temperature(self):
+        self.assert_value_error()
+
+
+@add_to(equilibrium_test_suite)
+class TestEquilibriumConstantSweep(TestBase):
+    def subject(self, reactions, temperatures, **kwargs):
+        return EquilibriumConstantSweep(reactions).ln_equilibrium_constants(
+            temperatures, **kwargs
+        )
+
+    @args({"reactions": [reaction_1, reaction_2] * 3, "temperatures": [400, 900]})
+    def test_executor_chunks_keep_reaction_order(self):
+        with ThreadPoolExecutor(2) as executor:
+            rows = EquilibriumConstantSweep(
+                self._subjectKwargs["reactions"]
+            ).ln_equilibrium_constants([400, 900], executor=executor, chunk_size=4)
+        self.assertResult(rows)
+
+    @args({"reactions": [reaction_1], "temperatures": [400], "chunk_size": 0})
+    def test_invalid_chunk_size(self):
+        self.assert_value_error()
+
+    @args({"reactions": [], "temperatures": [400]})
+    def test_no_reactions(self):
+        self.assertResult([])
@@ -0,0 +1,123 @@
+from unittest import TestSuite, TextTestRunner
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.evaluation import (
+    evaluate_reactions,
+    iter_evaluate_reactions,
+)
+from chemical_utils.properties.properties import MolarEnergy, Entropy, EntropyChange
+from chemical_utils.properties.registry import registry_overlay, create_standard_entropy
+from chemical_utils.tests.data import TESTIUM2, reaction_1, reaction_2
+from chemical_utils.reactions.constants import WATER_GAS_SHIFT
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.reactions.reaction_utils import TestReaction
+
+load_tests = def_load_tests("chemical_utils.reactions.evaluation")
+
+evaluation_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(evaluation_test_suite)
+
+
+async def _collect_chunks(reactions, chunk_size):
+    return [
+        chunk
+        async for chunk in iter_evaluate_reactions(
+            reactions, ["standard_enthalpy_change"], chunk_size=chunk_size
+        )
+    ]
+
+
+@add_to(evaluation_test_suite)
+class TestEvaluateReactions(TestReaction):
+    def subject(self, reactions, properties, **kwargs):
+        return run(evaluate_reactions(reactions, properties, **kwargs))
+
+    @args(
+        {
+            "reactions": [reaction_1, reaction_2],
+            "properties": ["standard_enthalpy_change"],
+        }
+    )
+    def test_results_follow_reaction_order(self):
+        self.assertResultList(
+            [
+                {"standard_enthalpy_change": MolarEnergy(100)},
+                {"standard_enthalpy_change": None},
+            ]
+        )
+
+    @args(
+        {
+            "reactions": [reaction_1] * 5,
+            "properties": ["standard_gibbs_energy_change"],
+            "chunk_size": 2,
+        }
+    )
+    def test_with_multiple_chunks(self):
+        self.assertResultList([{"standard_gibbs_energy_change": MolarEnergy(200)}] * 5)
+
+    def test_with_default_properties(self):
+        results = run(evaluate_reactions([reaction_1, WATER_GAS_SHIFT]))
+        self.assertEqual(results[0]["standard_entropy_change"], EntropyChange(105))
+        self.assertAlmostEqual(results[1]["standard_entropy_change"].value, -42032)
+        self.assertLess(results[1]["standard_enthalpy_change"].value, 0)
+
+    @args({"reactions": [], "properties": ["standard_entropy_change"]})
+    def test_without_reactions(self):
+        self.assertResultList([])
+
+    @args({"reactions": [reaction_1], "properties": ["reactants"]})
+    def test_with_invalid_property(self):
+        self.assert_value_error()
+
+    @args(
+        {
+            "reactions": [reaction_1],
+            "properties": ["standard_entropy_change"],
+            "chunk_size": 0,
+        }
+    )
+    def test_with_invalid_chunk_size(self):
+        self.assert_value_error()
+
+    @args(
+        {
+            "reactions": [reaction_1] * 3,
+            "properties": ["standard_entropy_change"],
+            "time_slice": 0,
+        }
+    )
+    def test_with_zero_time_slice(self):
+        self.assertResultList([{"standard_entropy_change": EntropyChange(105)}] * 3)
+
+    def test_thread_executor_sees_registry_overlay(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with registry_overlay():
+                create_standard_entropy(TESTIUM2, Entropy(40))
+                results = run(
+                    evaluate_reactions(
+                        [reaction_1], ["standard_entropy_change"], executor=executor
+                    )
+                )
+        self.assertEqual(results, [{"standard_entropy_change": EntropyChange(115)}])
+
+
+@add_to(evaluation_test_suite)
+class TestIterEvaluateReactions(TestReaction):
+    def subject(self, reactions, chunk_size):
+        return run(_collect_chunks(reactions, chunk_size))
+
+    @args({"reactions": [reaction_1] * 5, "chunk_size": 2})
+    def test_chunk_sizes(self):
+        self.assertEqual([len(chunk) for chunk in self.result()], [2, 2, 1])
+
+    @args({"reactions": iter([reaction_1] * 3), "chunk_size": 3})
+    def test_with_iterator(self):
+        self.assertEqual([len(chunk) for chunk in self.result()], [3])
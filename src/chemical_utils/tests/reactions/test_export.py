@@ -0,0 +1,152 @@
+from unittest import TestSuite, TextTestRunner
+from tempfile import TemporaryDirectory
+import csv
+import gzip
+import json
+import os
+
+from unittest_extensions import args
+from property_utils.units import KILO_JOULE, MOL, KELVIN
+
+from chemical_utils.reactions.export import (
+    export_reactions,
+    standard_change_rows,
+    EXPORT_COLUMNS,
+)
+from chemical_utils.tests.data import reaction_1, reaction_2
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.base import TestBase
+
+load_tests = def_load_tests("chemical_utils.reactions.export")
+
+export_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(export_test_suite)
+
+
+@add_to(export_test_suite)
+class TestStandardChangeRows(TestBase):
+    def subject(self, reactions, **kwargs):
+        return standard_change_rows(reactions, **kwargs)
+
+    @args({"reactions": [reaction_1, reaction_2]})
+    def test_rows(self):
+        self.assertResult(
+            [
+                ("Ts2 + Py3 -> Ts2Py3", 100.0, 200.0, 105.0),
+                ("Ts + Py -> TsPy", None, None, None),
+            ]
+        )
+
+    @args({"reactions": [reaction_1, reaction_1.reverse(), 2 * reaction_1]})
+    def test_matches_reaction_values(self):
+        for row, reaction in zip(self.result(), self._subjectKwargs["reactions"]):
+            # pylint: disable=protected-access
+            self.assertEqual(
+                row[1:],
+                (
+                    reaction._standard_enthalpy_change_value,
+                    reaction._standard_gibbs_energy_change_value,
+                    reaction._standard_entropy_change_value,
+                ),
+            )
+
+    @args(
+        {
+            "reactions": [reaction_1],
+            "energy_unit": KILO_JOULE / MOL,
+            "entropy_unit": KILO_JOULE / MOL / KELVIN,
+        }
+    )
+    def test_units(self):
+        _, enthalpy, gibbs_energy, entropy = self.result()[0]
+        self.assertAlmostEqual(enthalpy, 1e-4)
+        self.assertAlmostEqual(gibbs_energy, 2e-4)
+        self.assertAlmostEqual(entropy, 1.05e-4)
+
+    @args({"reactions": []})
+    def test_no_reactions(self):
+        self.assertResult([])
+
+
+class TestExportReactionsBase(TestBase):
+    def setUp(self):
+        self._directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self._directory.cleanup)
+
+    def subject(self, name, reactions, **kwargs):
+        file = os.path.join(self._directory.name, name)
+        n_reactions = export_reactions(reactions, file, **kwargs)
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(file, "rt", encoding="utf-8", newline="") as stream:
+            return n_reactions, stream.read()
+
+
+@add_to(export_test_suite)
+class TestExportReactions(TestExportReactionsBase):
+    @args({"name": "reactions.csv", "reactions": [reaction_1, reaction_2]})
+    def test_csv(self):
+        n_reactions, content = self.result()
+        self.assertEqual(n_reactions, 2)
+        self.assertEqual(
+            list(csv.reader(content.splitlines())),
+            [
+                list(EXPORT_COLUMNS),
+                ["Ts2 + Py3 -> Ts2Py3", "100.0", "200.0", "105.0"],
+                ["Ts + Py -> TsPy", "", "", ""],
+            ],
+        )
+
+    @args({"name": "reactions.jsonl", "reactions": iter([reaction_1, reaction_2])})
+    def test_jsonl(self):
+        _, content = self.result()
+        self.assertEqual(
+            [json.loads(line) for line in content.splitlines()],
+            [
+                {
+                    "reaction": "Ts2 + Py3 -> Ts2Py3",
+                    "standard_enthalpy_change": 100.0,
+                    "standard_gibbs_energy_change": 200.0,
+                    "standard_entropy_change": 105.0,
+                },
+                {
+                    "reaction": "Ts + Py -> TsPy",
+                    "standard_enthalpy_change": None,
+                    "standard_gibbs_energy_change": None,
+                    "standard_entropy_change": None,
+                },
+            ],
+        )
+
+    @args({"name": "reactions.jsonl.gz", "reactions": [reaction_1, reaction_2]})
+    def test_gzip(self):
+        _, content = self.result()
+        self.assertEqual(len(content.splitlines()), 2)
+
+    @args(
+        {
+            "name": "reactions.txt",
+            "reactions": [reaction_1] * 5,
+            "file_format": "csv",
+            "chunk_size": 2,
+        }
+    )
+    def test_chunks(self):
+        n_reactions, content = self.result()
+        self.assertEqual(n_reactions, 5)
+        self.assertEqual(len(content.splitlines()), 6)
+
+    @args({"name": "reactions.xml", "reactions": [reaction_1]})
+    def test_unsupported_format(self):
+        self.assert_value_error()
+
+    @args({"name": "reactions", "reactions": [reaction_1]})
+    def test_no_extension(self):
+        self.assert_value_error()
+
+    @args({"name": "reactions.csv", "reactions": [reaction_1], "chunk_size": 0})
+    def test_invalid_chunk_size(self):
+        self.assert_value_error()
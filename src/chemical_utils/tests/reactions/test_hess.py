@@ -0,0 +1,206 @@
+from unittest import TestSuite, TextTestRunner
+from random import Random
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.hess import (
+    estimate_standard_formation_enthalpies,
+    estimate_standard_formation_gibbs_energies,
+    estimate_standard_entropies,
+)
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.substances.substance import (
+    ChemicalCompound,
+    ChemicalElementTuple,
+    ChemicalReactionOperand,
+)
+from chemical_utils.properties.properties import MolarEnergy, Entropy
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    TS_PY,
+    TS2_PY3,
+    reaction_1,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.reactions.reaction_utils import TestReaction
+
+load_tests = def_load_tests("chemical_utils.reactions.hess")
+
+hess_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(hess_test_suite)
+
+TS_PY3 = ChemicalCompound(TESTIUM, PYTHONIUM3)
+
+# TS_PY and TS_PY3 have no registered properties.
+ts_py_decomposition = ChemicalReaction(6 * TS_PY, 3 * TESTIUM2 + 2 * PYTHONIUM3)
+ts_py3_formation = ChemicalReaction(2 * TS_PY3, TS2_PY3 + PYTHONIUM3)
+# TS_PY and TS_PY3 only appear together.
+ts_py_ts_py3_combination = ChemicalReaction(3 * TS_PY + TS_PY3, 2 * TS2_PY3)
+# TESTIUM has no registered properties either.
+testium_dimerization = ChemicalReaction(2 * TESTIUM, TESTIUM2)
+
+
+@add_to(hess_test_suite)
+class TestEstimateStandardFormationEnthalpies(TestReaction):
+    def subject(self, measurements):
+        return estimate_standard_formation_enthalpies(measurements)
+
+    def assert_estimate(self, substance, value):
+        self.assertAlmostEqual(self.result()[substance].value, value)
+
+    @args({"measurements": [(ts_py_decomposition, MolarEnergy(-60))]})
+    def test_single_unknown(self):
+        self.assert_estimate(TS_PY, 10)
+
+    @args(
+        {
+            "measurements": [
+                (ts_py_decomposition, MolarEnergy(-60)),
+                (ts_py_decomposition, MolarEnergy(-120)),
+            ]
+        }
+    )
+    def test_inconsistent_measurements_are_averaged(self):
+        self.assert_estimate(TS_PY, 15)
+
+    @args(
+        {
+            "measurements": [
+                (ts_py_decomposition, MolarEnergy(-60)),
+                (ts_py3_formation, MolarEnergy(10)),
+            ]
+        }
+    )
+    def test_multiple_unknowns(self):
+        self.assert_estimate(TS_PY, 10)
+        self.assert_estimate(TS_PY3, 45)
+
+    @args({"measurements": [(ts_py_ts_py3_combination, MolarEnergy(125))]})
+    def test_unknowns_that_only_appear_together(self):
+        self.assertResult({})
+
+    @args(
+        {
+            "measurements": [
+                (ts_py_ts_py3_combination, MolarEnergy(125)),
+                (testium_dimerization, MolarEnergy(-30)),
+            ]
+        }
+    )
+    def test_undetermined_unknowns_are_left_out(self):
+        self.assertEqual(set(self.result()), {TESTIUM})
+        self.assert_estimate(TESTIUM, 15)
+
+    @args(
+        {
+            "measurements": [
+                (ts_py_ts_py3_combination, MolarEnergy(125)),
+                (ts_py_decomposition, MolarEnergy(-60)),
+            ]
+        }
+    )
+    def test_combination_is_determined_by_other_measurement(self):
+        self.assert_estimate(TS_PY, 10)
+        self.assert_estimate(TS_PY3, 45)
+
+    @args({"measurements": [(reaction_1, MolarEnergy(100))]})
+    def test_without_unknowns(self):
+        self.assertResult({})
+
+    @args({"measurements": []})
+    def test_without_measurements(self):
+        self.assertResult({})
+
+
+def _pythonium(size):
+    return ChemicalElementTuple(PYTHONIUM, size)
+
+
+def _operand(parts):
+    return ChemicalReactionOperand([n * _pythonium(k) for k, n in parts])
+
+
+def _scale_measurements(enthalpies):
+    """
+    A few thousand measurements of the formation enthalpies of Py4 ... Py1003:
+    a chain Py(k) + Py3 -> Py(k + 3) anchored to Py3 and random associations
+    Py(a) + Py(b) -> Py(a + b). Py2000 and Py2002 only appear together.
+    """
+    random = Random(0)
+    sizes = range(4, 1004)
+    for size in sizes:
+        enthalpies[size] = random.uniform(-100, 100)
+
+    def measurement(reactants, products):
+        change = sum(n * enthalpies.get(k, 0.0) for k, n in products) - sum(
+            n * enthalpies.get(k, 0.0) for k, n in reactants
+        )
+        return (
+            ChemicalReaction(_operand(reactants), _operand(products)),
+            MolarEnergy(change),
+        )
+
+    measurements = [
+        measurement([(4, 3)], [(3, 4)]),
+        measurement([(5, 3)], [(3, 5)]),
+        measurement([(6, 1)], [(3, 2)]),
+        measurement([(2000, 1), (2002, 1)], [(3, 1334)]),
+    ]
+    measurements += [measurement([(k, 1), (3, 1)], [(k + 3, 1)]) for k in sizes[:-3]]
+    for _ in range(2000):
+        a, b = random.randint(4, 500), random.randint(4, 500)
+        measurements.append(measurement([(a, 1), (b, 1)], [(a + b, 1)]))
+    return measurements
+
+
+@add_to(hess_test_suite)
+class TestEstimateAtScale(TestReaction):
+    def test_thousands_of_measurements(self):
+        enthalpies = {}
+        measurements = _scale_measurements(enthalpies)
+        estimates = estimate_standard_formation_enthalpies(measurements)
+
+        self.assertNotIn(_pythonium(2000), estimates)
+        self.assertNotIn(_pythonium(2002), estimates)
+        self.assertEqual(len(estimates), 1000)
+        for size in (4, 5, 6, 500, 1003):
+            self.assertAlmostEqual(
+                estimates[_pythonium(size)].value, enthalpies[size], places=4
+            )
+
+
+@add_to(hess_test_suite)
+class TestEstimateStandardFormationGibbsEnergies(TestReaction):
+    def subject(self, measurements):
+        return estimate_standard_formation_gibbs_energies(measurements)
+
+    @args({"measurements": [(ts_py_decomposition, MolarEnergy(-60))]})
+    def test_single_unknown(self):
+        self.assertAlmostEqual(self.result()[TS_PY].value, 10)
+
+
+@add_to(hess_test_suite)
+class TestEstimateStandardEntropies(TestReaction):
+    def subject(self, measurements):
+        return estimate_standard_entropies(measurements)
+
+    @args({"measurements": [(ts_py_decomposition, Entropy(0))]})
+    def test_single_unknown(self):
+        self.assertAlmostEqual(self.result()[TS_PY].value, 40)
+
+    @args(
+        {
+            "measurements": [
+                (ChemicalReaction(TS2_PY3, TESTIUM2 + PYTHONIUM3), Entropy(0))
+            ]
+        }
+    )
+    def test_without_unknowns(self):
+        self.assertResult({})
@@ -0,0 +1,198 @@
+from unittest import TestSuite, TextTestRunner
+from math import exp, log
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.kinetics import (
+    ArrheniusRate,
+    ElementaryReaction,
+    KineticMechanism,
+    STANDARD_PRESSURE,
+)
+from chemical_utils.reactions.equilibrium import GAS_CONSTANT, ln_equilibrium_constants
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    TS_PY,
+    TS2_PY3,
+    reaction_1,
+    reaction_2,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.base import TestBase
+
+load_tests = def_load_tests("chemical_utils.reactions.kinetics")
+
+kinetics_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(kinetics_test_suite)
+
+
+RATE = ArrheniusRate(2e3, 0.5, 1e6)
+MECHANISM = KineticMechanism(
+    [
+        ElementaryReaction(reaction_1, RATE),
+        ElementaryReaction(reaction_2, RATE, reversible=False),
+    ]
+)
+
+
+def _kc(temperature):
+    # reaction_1 has one mole less of products than of reactants.
+    ln_k = ln_equilibrium_constants([reaction_1], [temperature])[0][0]
+    return exp(ln_k - log(STANDARD_PRESSURE / (GAS_CONSTANT * temperature)))
+
+
+@add_to(kinetics_test_suite)
+class TestArrheniusRate(TestBase):
+    def subject(self, pre_exponential_factor, **kwargs):
+        return ArrheniusRate(pre_exponential_factor, **kwargs).rate_constant(500)
+
+    @args({"pre_exponential_factor": 2e3})
+    def test_constant(self):
+        self.assertAlmostEqual(self.result(), 2e3)
+
+    @args(
+        {
+            "pre_exponential_factor": 2e3,
+            "temperature_exponent": 0.5,
+            "activation_energy": 1e6,
+        }
+    )
+    def test_modified_arrhenius(self):
+        self.assertAlmostEqual(
+            self.result(), 2e3 * 500**0.5 * exp(-1e6 / (GAS_CONSTANT * 500))
+        )
+
+    @args({"pre_exponential_factor": 0})
+    def test_non_positive_pre_exponential_factor(self):
+        self.assert_value_error()
+
+
+@add_to(kinetics_test_suite)
+class TestKineticMechanism(TestBase):
+    def subject(self, reactions):
+        return KineticMechanism(reactions)
+
+    @args(
+        {
+            "reactions": [
+                ElementaryReaction(reaction_1, RATE),
+                ElementaryReaction(reaction_2, RATE, reversible=False),
+            ]
+        }
+    )
+    def test_species_follow_order_of_appearance(self):
+        self.assertEqual(
+            self.result().species,
+            (TESTIUM2, PYTHONIUM3, TS2_PY3, TESTIUM, PYTHONIUM, TS_PY),
+        )
+
+    @args(
+        {
+            "reactions": [
+                ElementaryReaction(reaction_1, RATE),
+                ElementaryReaction(reaction_2, RATE, reversible=False),
+            ]
+        }
+    )
+    def test_stoichiometric_matrix(self):
+        self.assertEqual(
+            self.result().stoichiometric_matrix.to_dense(),
+            [
+                [-1.0, 0.0],
+                [-1.0, 0.0],
+                [1.0, 0.0],
+                [0.0, -1.0],
+                [0.0, -1.0],
+                [0.0, 1.0],
+            ],
+        )
+
+    @args({"reactions": [ElementaryReaction(reaction_2, RATE)]})
+    def test_reversible_reaction_without_thermochemistry(self):
+        self.assert_value_error()
+
+
+@add_to(kinetics_test_suite)
+class TestKineticMechanismRates(TestBase):
+    def subject(self, reversible, concentrations, temperature=500):
+        return KineticMechanism(
+            [ElementaryReaction(reaction_1, RATE, reversible)]
+        ).rates_of_progress(concentrations, temperature)
+
+    @args({"reversible": False, "concentrations": [0.2, 0.3, 0.4]})
+    def test_irreversible(self):
+        forward, reverse = self.result()
+        self.assertAlmostEqual(forward[0], RATE.rate_constant(500) * 0.2 * 0.3)
+        self.assertEqual(reverse, [0.0])
+
+    @args({"reversible": True, "concentrations": [0.2, 0.3, 0.4]})
+    def test_detailed_balance(self):
+        forward, reverse = self.result()
+        self.assertAlmostEqual(
+            reverse[0], RATE.rate_constant(500) / _kc(500) * 0.4, places=10
+        )
+        self.assertAlmostEqual(forward[0], RATE.rate_constant(500) * 0.2 * 0.3)
+
+    @args({"reversible": True, "concentrations": [0.5, 0.2, 0.1 * _kc(500)]})
+    def test_equilibrium(self):
+        self.assertAlmostEqual(self.result()[0][0], self.cachedResult()[1][0])
+
+    @args({"reversible": True, "concentrations": [0.2, 0.3]})
+    def test_missing_concentration(self):
+        self.assert_value_error()
+
+
+@add_to(kinetics_test_suite)
+class TestKineticMechanismProductionRates(TestBase):
+    def subject(self, concentrations):
+        return KineticMechanism(
+            [
+                ElementaryReaction(reaction_1, RATE),
+                ElementaryReaction(reaction_2, RATE, reversible=False),
+            ]
+        ).production_rates(concentrations, 500)
+
+    @args({"concentrations": [0.2, 0.3, 0.0, 0.1, 0.5, 0.0]})
+    def test_production_rates(self):
+        rate_1 = RATE.rate_constant(500) * 0.2 * 0.3
+        rate_2 = RATE.rate_constant(500) * 0.1 * 0.5
+        for value, expected in zip(
+            self.result(), [-rate_1, -rate_1, rate_1, -rate_2, -rate_2, rate_2]
+        ):
+            self.assertAlmostEqual(value, expected)
+
+
+@add_to(kinetics_test_suite)
+class TestKineticMechanismJacobian(TestBase):
+    def subject(self, concentrations):
+        return MECHANISM.production_rate_jacobian(concentrations, 500)
+
+    @args({"concentrations": [0.2, 0.3, 0.4, 0.1, 0.5, 0.6]})
+    def test_matches_finite_differences(self):
+        jacobian = self.result().to_dense()
+        concentrations = self._subjectKwargs["concentrations"]
+        rates = MECHANISM.production_rates(concentrations, 500)
+        for k in range(len(concentrations)):
+            perturbed = list(concentrations)
+            perturbed[k] += 1e-7
+            column = [
+                (a - b) / 1e-7
+                for a, b in zip(MECHANISM.production_rates(perturbed, 500), rates)
+            ]
+            for i, value in enumerate(column):
+                self.assertAlmostEqual(jacobian[i][k], value, places=4)
+
+    @args({"concentrations": [0.2, 0.3, 0.4, 0.1, 0.5, 0.6]})
+    def test_sparsity_pattern_is_shared(self):
+        other = MECHANISM.production_rate_jacobian([0.0] * 6, 500)
+        self.assertEqual(self.result().indices, other.indices)
+        self.assertEqual(self.cachedResult().indptr, other.indptr)
+        # species of different reactions are not coupled.
+        self.assertEqual(self.cachedResult().row(0).keys(), {0, 1, 2})
@@ -1,9 +1,32 @@
 from unittest import TestSuite, TextTestRunner
+from fractions import Fraction
+import os
+import pickle
+import subprocess
+import sys
 
 from unittest_extensions import args
-
-from chemical_utils.reactions.reaction import ChemicalReaction
-from chemical_utils.properties.properties import MolarEnergy, Entropy
+from property_utils.units import JOULE, MOL, KELVIN
+
+from chemical_utils.reactions.reaction import (
+    ChemicalReaction,
+    combine_reactions,
+    is_balanced,
+    balanced_mask,
+    element_imbalance,
+    CHARGE,
+)
+from chemical_utils.exceptions.base import (
+    ChemicalUtilsTypeError,
+    ChemicalUtilsValueError,
+)
+from chemical_utils.properties.properties import MolarEnergy, EntropyChange
+from chemical_utils.substances.substance import (
+    ChemicalElementTuple,
+    ChemicalCompound,
+    ChemicalIon,
+    Electron,
+)
 from chemical_utils.tests.data import (
     TESTIUM,
     TESTIUM2,
@@ -14,9 +37,14 @@ from chemical_utils.tests.data import (
     reaction_1,
     reaction_2,
 )
+from chemical_utils.reactions.constants import WATER_GAS_SHIFT
 from chemical_utils.tests.utils import def_load_tests, add_to
 from chemical_utils.tests.reactions.reaction_utils import TestReaction
 
+PYTHONIUM2 = ChemicalElementTuple(PYTHONIUM, 2)
+TS_PY3 = ChemicalCompound(TESTIUM, PYTHONIUM3)
+TS_PLUS = ChemicalIon(TESTIUM, 1)
+PY_MINUS = ChemicalIon(PYTHONIUM, -1)
 
 load_tests = def_load_tests("chemical_utils.reactions.reaction")
 
@@ -136,8 +164,390 @@ class ChemicalReactionStandardEntropy(TestReaction):
 
     @args({"reaction": reaction_1})
     def test_with_registered_compounds_reaction(self):
-        self.assertResult(Entropy(105))
+        self.assertResult(EntropyChange(105))
+
+    @args({"reaction": WATER_GAS_SHIFT})
+    def test_with_negative_change(self):
+        self.assertIsInstance(self.result(), EntropyChange)
+        self.assertAlmostEqual(self.result().value, -42032)
+
+    @args({"reaction": reaction_2})
+    def test_with_unregistered_compounds_reaction(self):
+        self.assertResultIs(None)
+
+
+@add_to(reaction_test_suite)
+class ChemicalReactionStandardEnthalpyChangeValue(TestReaction):
+    def subject(self, reaction, unit=None):
+        return reaction.standard_enthalpy_change_value(unit)
+
+    @args({"reaction": reaction_1})
+    def test_with_registered_compounds_reaction(self):
+        self.assertResult(100)
+
+    @args({"reaction": reaction_1, "unit": JOULE / MOL})
+    def test_with_unit(self):
+        self.assertAlmostEqual(self.result(), 0.1)
+
+    @args({"reaction": reaction_2})
+    def test_with_unregistered_compounds_reaction(self):
+        self.assertResultIs(None)
+
+
+@add_to(reaction_test_suite)
+class ChemicalReactionStandardGibbsEnergyChangeValue(TestReaction):
+    def subject(self, reaction, unit=None):
+        return reaction.standard_gibbs_energy_change_value(unit)
+
+    @args({"reaction": reaction_1})
+    def test_with_registered_compounds_reaction(self):
+        self.assertResult(200)
+
+    @args({"reaction": reaction_2})
+    def test_with_unregistered_compounds_reaction(self):
+        self.assertResultIs(None)
+
+
+@add_to(reaction_test_suite)
+class ChemicalReactionStandardEntropyChangeValue(TestReaction):
+    def subject(self, reaction, unit=None):
+        return reaction.standard_entropy_change_value(unit)
+
+    @args({"reaction": reaction_1})
+    def test_with_registered_compounds_reaction(self):
+        self.assertResult(105)
+
+    @args({"reaction": reaction_1, "unit": JOULE / MOL / KELVIN})
+    def test_with_unit(self):
+        self.assertAlmostEqual(self.result(), 0.105)
 
     @args({"reaction": reaction_2})
     def test_with_unregistered_compounds_reaction(self):
         self.assertResultIs(None)
+
+
+@add_to(reaction_test_suite)
+class TestChemicalReactionFractionalInit(TestReaction):
+    produced_type = ChemicalReaction
+
+    def subject(self, reactants, products):
+        return ChemicalReaction(reactants, products)
+
+    @args({"reactants": TESTIUM + Fraction(3, 2) * PYTHONIUM2, "products": TS_PY3})
+    def test_fractional_reactant(self):
+        self.assert_result("Ts + 3/2Py2 -> TsPy3")
+
+    @args({"reactants": Fraction(1, 2) * TESTIUM2, "products": Fraction(1, 3) * TS_PY3})
+    def test_fractional_unbalanced(self):
+        self.assert_unbalanced_reaction()
+
+    @args(
+        {
+            "reactants": Fraction(10**6, 3) * TESTIUM2,
+            "products": Fraction(2 * 10**6, 3) * TESTIUM,
+        }
+    )
+    def test_large_fractional_coefficients(self):
+        self.assert_result("1000000/3Ts2 -> 2000000/3Ts")
+
+
+@add_to(reaction_test_suite)
+class TestChemicalReactionChargeBalance(TestReaction):
+    produced_type = ChemicalReaction
+
+    def subject(self, reactants, products):
+        return ChemicalReaction(reactants, products)
+
+    @args({"reactants": TS_PLUS + Electron(), "products": TESTIUM})
+    def test_half_reaction(self):
+        self.assert_result("Ts^+ + e^- -> Ts")
+
+    @args({"reactants": TS_PLUS, "products": TESTIUM})
+    def test_unbalanced_charge(self):
+        self.assert_unbalanced_reaction()
+
+    @args({"reactants": TS_PLUS + PY_MINUS, "products": TS_PY})
+    def test_ions_to_neutral_compound(self):
+        self.assert_result("Ts^+ + Py^- -> TsPy")
+
+    @args(
+        {
+            "reactants": 2 * TS_PLUS + PY_MINUS,
+            "products": ChemicalIon(TS_PY, 1) + TESTIUM,
+        }
+    )
+    def test_charged_products(self):
+        self.assert_result("2Ts^+ + Py^- -> TsPy^+ + Ts")
+
+    @args({"reactants": TS_PLUS + Electron(), "products": TS_PLUS + Electron()})
+    def test_charge_balance_of_stoichiometry(self):
+        self.assertEqual(self.result().stoichiometry.charge_balance(), 0)
+
+
+@add_to(reaction_test_suite)
+class TestChemicalReactionTryCreate(TestReaction):
+    produced_type = ChemicalReaction
+
+    def subject(self, reactants, products):
+        return ChemicalReaction.try_create(reactants, products)
+
+    @args({"reactants": TESTIUM2 + PYTHONIUM3, "products": TS2_PY3})
+    def test_balanced(self):
+        self.assert_result("Ts2 + Py3 -> Ts2Py3")
+        self.assertEqual(self.cachedResult(), reaction_1)
+
+    @args({"reactants": TESTIUM, "products": TESTIUM2})
+    def test_unbalanced(self):
+        self.assertResult(None)
+
+    @args({"reactants": TS_PLUS, "products": TESTIUM})
+    def test_unbalanced_charge(self):
+        self.assertResult(None)
+
+    @args({"reactants": 1, "products": TESTIUM})
+    def test_invalid_reactants(self):
+        self.assert_type_error()
+
+
+@add_to(reaction_test_suite)
+class TestIsBalanced(TestReaction):
+    def subject(self, reactants, products):
+        return is_balanced(reactants, products)
+
+    @args({"reactants": TS_PLUS + PY_MINUS, "products": TS_PY})
+    def test_balanced(self):
+        self.assertResult(True)
+
+    @args({"reactants": TESTIUM + PYTHONIUM, "products": TS2_PY3})
+    def test_unbalanced(self):
+        self.assertResult(False)
+
+    @args({"reactants": TESTIUM, "products": "Ts"})
+    def test_invalid_products(self):
+        self.assert_type_error()
+
+
+@add_to(reaction_test_suite)
+class TestElementImbalance(TestReaction):
+    def subject(self, reactants, products):
+        return element_imbalance(reactants, products)
+
+    @args({"reactants": TESTIUM2 + PYTHONIUM3, "products": TS2_PY3})
+    def test_balanced(self):
+        self.assertResult({})
+
+    @args({"reactants": TESTIUM + PYTHONIUM, "products": TS2_PY3})
+    def test_elements(self):
+        self.assertResult({TESTIUM: 1, PYTHONIUM: 2})
+
+    @args({"reactants": TS_PLUS, "products": TESTIUM})
+    def test_charge(self):
+        self.assertResult({CHARGE: -1})
+
+    @args({"reactants": Fraction(1, 2) * TESTIUM2, "products": TESTIUM})
+    def test_fractional_coefficients(self):
+        self.assertResult({})
+
+
+@add_to(reaction_test_suite)
+class TestBalancedMask(TestReaction):
+    def subject(self, candidates):
+        return balanced_mask(candidates)
+
+    @args(
+        {
+            "candidates": iter(
+                [
+                    (TESTIUM2 + PYTHONIUM3, TS2_PY3),
+                    (TESTIUM + PYTHONIUM, TS2_PY3),
+                    (TS_PLUS + Electron(), TESTIUM),
+                ]
+            )
+        }
+    )
+    def test_mask(self):
+        self.assertResult([True, False, True])
+
+    @args({"candidates": []})
+    def test_no_candidates(self):
+        self.assertResult([])
+
+
+@add_to(reaction_test_suite)
+class TestChemicalReactionPerMoleOf(TestReaction):
+    produced_type = ChemicalReaction
+
+    def subject(self, reaction, substance):
+        return reaction.per_mole_of(substance)
+
+    @args({"reaction": reaction_1, "substance": TESTIUM2})
+    def test_with_unit_coefficient(self):
+        self.assert_result("Ts2 + Py3 -> Ts2Py3")
+
+    @args(
+        {
+            "reaction": ChemicalReaction(2 * TESTIUM + 3 * PYTHONIUM, TS2_PY3),
+            "substance": TESTIUM,
+        }
+    )
+    def test_with_reactant(self):
+        self.assert_result("Ts + 3/2Py -> 1/2Ts2Py3")
+
+    @args(
+        {
+            "reaction": ChemicalReaction(TS2_PY3, 2 * TESTIUM + 3 * PYTHONIUM),
+            "substance": PYTHONIUM,
+        }
+    )
+    def test_with_product(self):
+        self.assert_result("1/3Ts2Py3 -> 2/3Ts + Py")
+
+    @args({"reaction": reaction_1, "substance": TS_PY})
+    def test_with_absent_substance(self):
+        self.assert_value_error()
+
+    def test_thermochemistry_is_scaled(self):
+        self.assertEqual(
+            ChemicalReaction(2 * TESTIUM2 + 2 * PYTHONIUM3, 2 * TS2_PY3)
+            .per_mole_of(TS2_PY3)
+            .standard_enthalpy_change_value(),
+            100,
+        )
+
+
+@add_to(reaction_test_suite)
+class TestChemicalReactionAlgebra(TestReaction):
+    def test_reverse(self):
+        self.assertEqual(str(reaction_1.reverse()), "Ts2Py3 -> Ts2 + Py3")
+
+    def test_reverse_thermochemistry(self):
+        self.assertEqual(reaction_1.reverse().standard_enthalpy_change_value(), -100)
+
+    def test_neg(self):
+        self.assertEqual(-reaction_1, reaction_1.reverse())
+
+    def test_scalar_multiplication(self):
+        reaction = 2 * reaction_1
+        self.assertEqual(reaction.stoichiometry.as_dict()[TS2_PY3], 2)
+        self.assertEqual(reaction.standard_gibbs_energy_change_value(), 400)
+
+    def test_fractional_multiplication(self):
+        reaction = reaction_1 * Fraction(1, 2)
+        self.assertEqual(reaction.stoichiometry.as_dict()[TS2_PY3], Fraction(1, 2))
+        self.assertEqual(reaction.standard_entropy_change_value(), 52.5)
+
+    def test_negative_multiplication(self):
+        reaction = -1 * reaction_1
+        self.assertEqual(reaction.stoichiometry.as_dict()[TS2_PY3], -1)
+
+    def test_multiplication_with_zero(self):
+        with self.assertRaises(ChemicalUtilsValueError):
+            reaction_1 * 0  # pylint: disable=pointless-statement
+
+    def test_addition_cancels_common_species(self):
+        reaction = reaction_1 + ChemicalReaction(TS2_PY3, 2 * TESTIUM + PYTHONIUM3)
+        self.assertEqual(reaction.stoichiometry.as_dict(), {TESTIUM2: -1, TESTIUM: 2})
+        self.assertEqual(str(reaction).count("Py3"), 0)
+
+    def test_subtraction_of_same_reaction(self):
+        with self.assertRaises(ChemicalUtilsValueError):
+            reaction_1 - reaction_1  # pylint: disable=pointless-statement
+
+    def test_addition_with_non_reaction(self):
+        with self.assertRaises(ChemicalUtilsTypeError):
+            reaction_1 + TESTIUM  # pylint: disable=pointless-statement
+
+    def test_sum(self):
+        reaction = sum([reaction_1, reaction_1, reaction_1])
+        self.assertEqual(reaction.standard_enthalpy_change_value(), 300)
+
+    def test_combined_thermochemistry_without_properties(self):
+        reaction = reaction_1 + reaction_2
+        self.assertIsNone(reaction.standard_enthalpy_change)
+
+    def test_combined_result_is_balanced(self):
+        reaction = 3 * reaction_1 - ChemicalReaction(TS2_PY3, 2 * TESTIUM + PYTHONIUM3)
+        self.assertTrue(
+            ChemicalReaction._is_balanced(  # pylint: disable=protected-access
+                reaction.reactants, reaction.products
+            )
+        )
+
+
+# unpickles a reaction and its' stoichiometry from stdin after indexing species in
+# another order than the parent process.
+_UNPICKLE_SCRIPT = """
+import pickle, sys
+from chemical_utils.substances import *
+from chemical_utils.substances.species import species_index
+for substance in (HYDROGEN2, CARBON_DIOXIDE, WATER, METHANE):
+    species_index(substance)
+reaction, stoichiometry = pickle.loads(sys.stdin.buffer.read())
+print(reaction.stoichiometry.as_dict()[CARBON_DIOXIDE])
+print(stoichiometry.as_dict()[WATER])
+print(reaction.standard_enthalpy_change_value())
+"""
+
+
+@add_to(reaction_test_suite)
+class TestChemicalReactionPickle(TestReaction):
+    def test_unpickle_in_other_process(self):
+        _ = WATER_GAS_SHIFT.standard_enthalpy_change_value()
+        data = pickle.dumps((WATER_GAS_SHIFT, WATER_GAS_SHIFT.stoichiometry))
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(os.path.dirname(__file__)))]
+            + [p for p in [environment.get("PYTHONPATH")] if p]
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", _UNPICKLE_SCRIPT],
+            input=data,
+            capture_output=True,
+            check=True,
+            env=environment,
+        ).stdout.split()
+        self.assertEqual(output, [b"1", b"-1", b"-41166000.0"])
+
+    def test_cached_values_are_not_pickled(self):
+        _ = WATER_GAS_SHIFT.stoichiometry, str(WATER_GAS_SHIFT)
+        _ = WATER_GAS_SHIFT.canonical_key
+        reaction = pickle.loads(pickle.dumps(WATER_GAS_SHIFT))
+        self.assertNotIn("stoichiometry", vars(reaction))
+        self.assertNotIn("canonical_key", vars(reaction))
+        self.assertNotIn("_string", vars(reaction))
+        self.assertEqual(reaction.stoichiometry, WATER_GAS_SHIFT.stoichiometry)
+        self.assertEqual(reaction.canonical_key, WATER_GAS_SHIFT.canonical_key)
+
+
+@add_to(reaction_test_suite)
+class TestChemicalReactionString(TestReaction):
+    def test_string_is_reused(self):
+        reaction = ChemicalReaction(TESTIUM2 + PYTHONIUM3, TS2_PY3)
+        self.assertIs(str(reaction), str(reaction))
+        self.assertEqual(repr(reaction), "<ChemicalReaction: Ts2 + Py3 -> Ts2Py3>")
+
+    def test_string_does_not_affect_equality(self):
+        reaction = ChemicalReaction(TESTIUM2 + PYTHONIUM3, TS2_PY3)
+        _ = str(reaction)
+        self.assertEqual(reaction, reaction_1)
+        self.assertEqual(str(reaction.reverse()), "Ts2Py3 -> Ts2 + Py3")
+
+
+@add_to(reaction_test_suite)
+class TestCombineReactions(TestReaction):
+    produced_type = ChemicalReaction
+
+    def subject(self, reactions, coefficients):
+        return combine_reactions(reactions, coefficients)
+
+    @args({"reactions": [reaction_1, reaction_1], "coefficients": [1]})
+    def test_with_mismatched_coefficients(self):
+        self.assert_value_error()
+
+    @args({"reactions": [reaction_1], "coefficients": [None]})
+    def test_with_invalid_coefficient(self):
+        self.assert_type_error()
+
+    @args({"reactions": [reaction_1, reaction_1], "coefficients": [1, 0.5]})
+    def test_with_float_coefficients(self):
+        self.assertEqual(self.result().stoichiometry.as_dict()[TS2_PY3], Fraction(3, 2))
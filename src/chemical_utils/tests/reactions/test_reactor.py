@@ -0,0 +1,158 @@
+from unittest import TestSuite, TextTestRunner
+from concurrent.futures import ThreadPoolExecutor
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.reactor import (
+    BatchReactor,
+    ReactorConditions,
+    simulate_batch_reactors,
+)
+from chemical_utils.reactions.kinetics import (
+    ArrheniusRate,
+    ElementaryReaction,
+    KineticMechanism,
+)
+from chemical_utils.reactions.reaction import r
+from chemical_utils.tests.data import TESTIUM, TESTIUM2, reaction_1
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.base import TestBase
+
+load_tests = def_load_tests("chemical_utils.reactions.reactor")
+
+reactor_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(reactor_test_suite)
+
+
+# 2Ts -> Ts2, irreversible and second order.
+DIMERIZATION = KineticMechanism(
+    [ElementaryReaction(r(2 * TESTIUM, TESTIUM2), ArrheniusRate(1.0), False)]
+)
+# Ts2 + Py3 <-> Ts2Py3
+ASSOCIATION = KineticMechanism([ElementaryReaction(reaction_1, ArrheniusRate(1e3))])
+
+
+@add_to(reactor_test_suite)
+class TestBatchReactor(TestBase):
+    def subject(self, mechanism, concentrations, times, total_concentration=None):
+        reactor = BatchReactor(
+            mechanism, 500, total_concentration or sum(concentrations)
+        )
+        return reactor.simulate(concentrations, times, rtol=1e-8)
+
+    @args({"mechanism": DIMERIZATION, "concentrations": [1.0, 0.0], "times": [0, 2]})
+    def test_constant_pressure(self):
+        # the volume shrinks as Ts dimerizes, keeping the total concentration.
+        testium, testium2 = self.result().y[-1]
+        self.assertAlmostEqual(testium + testium2, 1.0, places=8)
+        self.assertLess(testium, 0.5)
+
+    @args(
+        {
+            "mechanism": DIMERIZATION,
+            "concentrations": [1.0, 1.0],
+            "times": [0, 1, 3],
+        }
+    )
+    def test_total_concentration_is_conserved(self):
+        for concentrations in self.result().y:
+            self.assertAlmostEqual(sum(concentrations), 2.0, places=8)
+
+    @args(
+        {
+            "mechanism": ASSOCIATION,
+            "concentrations": [0.02, 0.02, 0.0],
+            "times": [0, 1e3],
+        }
+    )
+    def test_equilibrium(self):
+        forward, reverse = ASSOCIATION.rates_of_progress(self.result().y[-1], 500)
+        self.assertAlmostEqual(forward[0] / reverse[0], 1.0, places=5)
+
+    @args(
+        {
+            "mechanism": DIMERIZATION,
+            "concentrations": [0.0, 0.0],
+            "times": [0, 1],
+            "total_concentration": -1,
+        }
+    )
+    def test_invalid_total_concentration(self):
+        self.assert_value_error()
+
+
+@add_to(reactor_test_suite)
+class TestBatchReactorJacobian(TestBase):
+    def subject(self, concentrations):
+        return BatchReactor(DIMERIZATION, 500, 2.0).jacobian(0, concentrations)
+
+    @args({"concentrations": [1.5, 0.5]})
+    def test_finite_differences(self):
+        reactor = BatchReactor(DIMERIZATION, 500, 2.0)
+        concentrations = self._subjectKwargs["concentrations"]
+        rhs = reactor.rhs(0, concentrations)
+        jacobian = self.result().to_dense()
+        for k in range(2):
+            perturbed = list(concentrations)
+            perturbed[k] += 1e-7
+            for i, value in enumerate(reactor.rhs(0, perturbed)):
+                self.assertAlmostEqual(
+                    (value - rhs[i]) / 1e-7, jacobian[i][k], places=5
+                )
+
+    @args({"concentrations": [1.5, 0.5]})
+    def test_pattern_is_shared(self):
+        reactor = BatchReactor(DIMERIZATION, 500, 2.0)
+        first = reactor.jacobian(0, self._subjectKwargs["concentrations"])
+        second = reactor.jacobian(0, [0.0, 0.0])
+        self.assertIs(first.indptr, second.indptr)
+        self.assertIs(first.indices, second.indices)
+
+
+@add_to(reactor_test_suite)
+class TestSimulateBatchReactors(TestBase):
+    def subject(self, conditions, **kwargs):
+        return simulate_batch_reactors(DIMERIZATION, conditions, [0, 1], **kwargs)
+
+    @args({"conditions": [ReactorConditions(500, [1.0, 0.0])]})
+    def test_single_reactor(self):
+        expected = BatchReactor(DIMERIZATION, 500, 1.0).simulate([1.0, 0.0], [0, 1])
+        self.assertEqual(self.result()[0].y, expected.y)
+
+    @args(
+        {
+            "conditions": [
+                ReactorConditions(500, [1.0, 0.0]),
+                ReactorConditions(500, [2.0, 0.0]),
+                ReactorConditions(500, [0.5, 0.5]),
+            ]
+        }
+    )
+    def test_results_follow_conditions_order(self):
+        with ThreadPoolExecutor(2) as executor:
+            solutions = self.subject(
+                self._subjectKwargs["conditions"], executor=executor
+            )
+        for solution, condition in zip(solutions, self._subjectKwargs["conditions"]):
+            self.assertEqual(solution.y[0], list(condition.concentrations))
+
+    @args(
+        {
+            "conditions": [
+                ReactorConditions(500, [1.0, 0.0]),
+                ReactorConditions(500, [2.0, 0.0]),
+            ]
+        }
+    )
+    def test_without_executor(self):
+        expected = [
+            BatchReactor(DIMERIZATION, 500, sum(c.concentrations)).simulate(
+                c.concentrations, [0, 1]
+            )
+            for c in self._subjectKwargs["conditions"]
+        ]
+        self.assertEqual([s.y for s in self.result()], [s.y for s in expected])
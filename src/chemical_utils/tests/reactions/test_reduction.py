@@ -0,0 +1,174 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.reduction import (
+    ElementConservation,
+    reachable_species,
+    prune_unreachable,
+    CHARGE,
+)
+from chemical_utils.reactions.kinetics import ArrheniusRate, ElementaryReaction
+from chemical_utils.reactions.reaction import r
+from chemical_utils.substances.substance import ChemicalIon
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    ANACONDIUM,
+    TS_PY,
+    TS2_PY3,
+    TS_PY_AN,
+    reaction_1,
+    reaction_2,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.base import TestBase
+
+load_tests = def_load_tests("chemical_utils.reactions.reduction")
+
+reduction_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(reduction_test_suite)
+
+
+RATE = ArrheniusRate(1.0)
+
+SPECIES = [TESTIUM2, PYTHONIUM3, TS2_PY3, TESTIUM]
+
+
+@add_to(reduction_test_suite)
+class TestElementConservation(TestBase):
+    def subject(self, species):
+        return ElementConservation(species)
+
+    @args({"species": SPECIES})
+    def test_matrix(self):
+        self.assertEqual(self.result().conserved, (TESTIUM, PYTHONIUM))
+        self.assertEqual(
+            self.result().matrix.to_dense(),
+            [[2.0, 0.0, 2.0, 1.0], [0.0, 3.0, 3.0, 0.0]],
+        )
+
+    @args({"species": SPECIES})
+    def test_rank(self):
+        self.assertEqual(self.result().rank, 2)
+        self.assertEqual(self.result().dependent_species, (TESTIUM2, PYTHONIUM3))
+        self.assertEqual(self.result().independent_species, (TS2_PY3, TESTIUM))
+
+    @args({"species": [TESTIUM2, ChemicalIon(TESTIUM, 1), ChemicalIon(TESTIUM, -1)]})
+    def test_charge_is_conserved(self):
+        self.assertEqual(self.result().conserved, (TESTIUM, CHARGE))
+        self.assertEqual(self.result().rank, 2)
+
+    @args({"species": SPECIES})
+    def test_element_totals(self):
+        self.assertEqual(self.result().element_totals([1.0, 1.0, 1.0, 2.0]), [6.0, 6.0])
+
+    @args({"species": SPECIES})
+    def test_reduce_and_expand(self):
+        reference = [1.0, 2.0, 0.5, 1.0]
+        state = [0.5, 1.5, 1.0, 1.0]
+        conservation = self.result()
+        self.assertEqual(conservation.reduce(state), [1.0, 1.0])
+        self.assertEqual(conservation.expand([1.0, 1.0], reference), state)
+
+    @args({"species": SPECIES})
+    def test_project(self):
+        reference = [1.0, 2.0, 0.5, 1.0]
+        conservation = self.result()
+        projected = conservation.project([0.6, 1.4, 1.0, 1.1], reference)
+        for total, expected in zip(
+            conservation.element_totals(projected),
+            conservation.element_totals(reference),
+        ):
+            self.assertAlmostEqual(total, expected)
+
+    @args({"species": SPECIES})
+    def test_project_consistent_state(self):
+        state = [0.5, 1.5, 1.0, 1.0]
+        for value, expected in zip(
+            self.result().project(state, [1.0, 2.0, 0.5, 1.0]), state
+        ):
+            self.assertAlmostEqual(value, expected)
+
+    @args({"species": SPECIES})
+    def test_invalid_state(self):
+        with self.assertRaises(Exception):
+            self.result().reduce([1.0, 2.0])
+
+    @args({"species": SPECIES})
+    def test_invalid_reduced_state(self):
+        with self.assertRaises(Exception):
+            self.result().expand([1.0], [1.0, 2.0, 0.5, 1.0])
+
+
+@add_to(reduction_test_suite)
+class TestReachableSpecies(TestBase):
+    def subject(self, reactions, feed):
+        return reachable_species(reactions, feed)
+
+    @args(
+        {
+            "reactions": [
+                ElementaryReaction(reaction_1, RATE, False),
+                ElementaryReaction(reaction_2, RATE, False),
+            ],
+            "feed": [TESTIUM2, PYTHONIUM3],
+        }
+    )
+    def test_products_of_reachable_reactants(self):
+        self.assertResult({TESTIUM2, PYTHONIUM3, TS2_PY3})
+
+    @args(
+        {
+            "reactions": [ElementaryReaction(reaction_1, RATE, False)],
+            "feed": [TS2_PY3],
+        }
+    )
+    def test_irreversible_reactions_do_not_run_backwards(self):
+        self.assertResult({TS2_PY3})
+
+    @args(
+        {
+            "reactions": [ElementaryReaction(reaction_1, RATE)],
+            "feed": [TS2_PY3],
+        }
+    )
+    def test_reversible_reactions_run_backwards(self):
+        self.assertResult({TESTIUM2, PYTHONIUM3, TS2_PY3})
+
+    @args(
+        {
+            "reactions": [
+                ElementaryReaction(r(TS_PY + ANACONDIUM, TS_PY_AN), RATE, False),
+                ElementaryReaction(reaction_2, RATE, False),
+            ],
+            "feed": [ANACONDIUM, TESTIUM, PYTHONIUM],
+        }
+    )
+    def test_chains(self):
+        self.assertResult({ANACONDIUM, TESTIUM, PYTHONIUM, TS_PY, TS_PY_AN})
+
+
+@add_to(reduction_test_suite)
+class TestPruneUnreachable(TestBase):
+    def subject(self, reactions, feed):
+        return prune_unreachable(reactions, feed)
+
+    @args(
+        {
+            "reactions": [
+                ElementaryReaction(reaction_1, RATE, False),
+                ElementaryReaction(reaction_2, RATE, False),
+                ElementaryReaction(r(TS_PY + ANACONDIUM, TS_PY_AN), RATE, False),
+            ],
+            "feed": [TESTIUM, PYTHONIUM],
+        }
+    )
+    def test_prune(self):
+        self.assertResult([ElementaryReaction(reaction_2, RATE, False)])
@@ -0,0 +1,66 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+
+from chemical_utils.reactions.reaction import ChemicalReaction
+from chemical_utils.substances.species import species_index
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    TS_PY,
+    TS2_PY3,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.reactions.reaction_utils import TestReaction
+
+load_tests = def_load_tests("chemical_utils.reactions.stoichiometry")
+
+stoichiometry_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(stoichiometry_test_suite)
+
+
+@add_to(stoichiometry_test_suite)
+class TestChemicalReactionStoichiometry(TestReaction):
+    def subject(self, reactants, products):
+        return ChemicalReaction(reactants, products).stoichiometry
+
+    @args({"reactants": 2 * TESTIUM + 3 * PYTHONIUM, "products": TS2_PY3})
+    def test_as_dict(self):
+        self.assertEqual(
+            self.result().as_dict(), {TESTIUM: -2, PYTHONIUM: -3, TS2_PY3: 1}
+        )
+
+    @args({"reactants": 2 * TESTIUM + 3 * PYTHONIUM, "products": TS2_PY3})
+    def test_indices_are_sorted(self):
+        self.assertEqual(
+            self.result().indices,
+            tuple(sorted(species_index(s) for s in (TESTIUM, PYTHONIUM, TS2_PY3))),
+        )
+
+    @args({"reactants": 3 * TESTIUM + PYTHONIUM, "products": TS_PY + 2 * TESTIUM})
+    def test_species_on_both_sides_are_netted(self):
+        self.assertEqual(
+            self.result().as_dict(), {TESTIUM: -1, PYTHONIUM: -1, TS_PY: 1}
+        )
+
+    @args({"reactants": TESTIUM, "products": TESTIUM})
+    def test_identity_reaction(self):
+        self.assertEqual(self.result().indices, ())
+
+    @args({"reactants": TESTIUM2 + PYTHONIUM3, "products": TS2_PY3})
+    def test_element_balance(self):
+        self.assertEqual(self.result().element_balance(), {TESTIUM: 0, PYTHONIUM: 0})
+
+    @args({"reactants": TESTIUM2 + PYTHONIUM3, "products": TS2_PY3})
+    def test_species(self):
+        self.assertEqual(set(self.result().species), {TESTIUM2, PYTHONIUM3, TS2_PY3})
+
+    def test_is_cached(self):
+        reaction = ChemicalReaction(TESTIUM, TESTIUM)
+        self.assertIs(reaction.stoichiometry, reaction.stoichiometry)
@@ -0,0 +1,103 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+
+from chemical_utils.substances.library import CompoundLibrary
+from chemical_utils.tests.data import (
+    TESTIUM,
+    PYTHONIUM,
+    PYTHONIUM3,
+    ANACONDIUM,
+    TS_PY,
+    TS2_PY3,
+    TS_PY_AN,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.substances.substance_utils import TestSubstances
+
+load_tests = def_load_tests("chemical_utils.substances.library")
+
+library_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(library_test_suite)
+
+
+def library():
+    return CompoundLibrary([TESTIUM, TS_PY, TS2_PY3, TS_PY_AN, PYTHONIUM3])
+
+
+@add_to(library_test_suite)
+class TestCompoundLibraryQuery(TestSubstances):
+    def subject(self, **kwargs):
+        return library().query(**kwargs)
+
+    @args({})
+    def test_without_conditions(self):
+        self.assertResult([TESTIUM, TS_PY, TS2_PY3, TS_PY_AN, PYTHONIUM3])
+
+    @args({"counts": {TESTIUM: (1, None)}})
+    def test_contains_element(self):
+        self.assertResult([TESTIUM, TS_PY, TS2_PY3, TS_PY_AN])
+
+    @args({"counts": {TESTIUM: (None, 1)}})
+    def test_maximum_includes_substances_without_element(self):
+        self.assertResult([TESTIUM, TS_PY, TS_PY_AN, PYTHONIUM3])
+
+    @args({"counts": {TESTIUM: (0, 0)}})
+    def test_without_element(self):
+        self.assertResult([PYTHONIUM3])
+
+    @args({"counts": {PYTHONIUM: (2, 3)}})
+    def test_count_range(self):
+        self.assertResult([TS2_PY3, PYTHONIUM3])
+
+    @args({"molecular_weight": (40, 70)})
+    def test_molecular_weight_range(self):
+        self.assertResult([TS_PY, TS_PY_AN, PYTHONIUM3])
+
+    @args(
+        {
+            "counts": {TESTIUM: (None, 1), PYTHONIUM: (1, None)},
+            "molecular_weight": (50, None),
+        }
+    )
+    def test_conjunction(self):
+        self.assertResult([TS_PY_AN, PYTHONIUM3])
+
+    @args({"counts": {ANACONDIUM: (2, None)}})
+    def test_no_matches(self):
+        self.assertResult([])
+
+    @args({"counts": {TESTIUM: (None, -1)}})
+    def test_negative_maximum(self):
+        self.assert_value_error()
+
+    @args({"counts": {TESTIUM: (-1, 2)}})
+    def test_negative_minimum(self):
+        self.assert_value_error()
+
+    @args({"molecular_weight": (70, 40)})
+    def test_empty_range(self):
+        self.assert_value_error()
+
+
+@add_to(library_test_suite)
+class TestCompoundLibraryAdd(TestSubstances):
+    def test_add_returns_false_for_existing(self):
+        _library = library()
+        self.assertFalse(_library.add(TS_PY))
+        self.assertEqual(len(_library), 5)
+
+    def test_added_substance_is_indexed(self):
+        _library = CompoundLibrary()
+        _library.add(TS_PY)
+        self.assertEqual(_library.query({PYTHONIUM: (1, 1)}), [TS_PY])
+        _library.add(TS_PY_AN)
+        self.assertEqual(_library.query({PYTHONIUM: (1, 1)}), [TS_PY, TS_PY_AN])
+
+    def test_contains(self):
+        self.assertIn(TS2_PY3, library())
+        self.assertNotIn(ANACONDIUM, library())
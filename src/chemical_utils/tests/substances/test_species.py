@@ -0,0 +1,103 @@
+from unittest import TestSuite, TextTestRunner
+
+from unittest_extensions import args
+
+from chemical_utils.substances.species import (
+    species_index,
+    species_at,
+    species_composition,
+    hill_formula,
+)
+from chemical_utils.substances import CARBON, HYDROGEN, OXYGEN
+from chemical_utils.substances.substance import ChemicalCompound, ChemicalIon, Electron
+from chemical_utils.tests.data import (
+    TESTIUM,
+    TESTIUM2,
+    PYTHONIUM,
+    PYTHONIUM3,
+    TS2_PY3,
+)
+from chemical_utils.tests.utils import def_load_tests, add_to
+from chemical_utils.tests.substances.substance_utils import TestSubstances
+
+load_tests = def_load_tests("chemical_utils.substances.species")
+
+species_test_suite = TestSuite()
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(species_test_suite)
+
+
+@add_to(species_test_suite)
+class TestSpeciesIndex(TestSubstances):
+    def test_equal_substances_share_index(self):
+        self.assertEqual(
+            species_index(ChemicalCompound(TESTIUM, PYTHONIUM)),
+            species_index(ChemicalCompound(TESTIUM, PYTHONIUM)),
+        )
+
+    def test_different_substances_have_different_indices(self):
+        self.assertNotEqual(species_index(TESTIUM), species_index(TESTIUM2))
+
+    def test_species_at_index(self):
+        self.assertEqual(species_at(species_index(TS2_PY3)), TS2_PY3)
+
+
+@add_to(species_test_suite)
+class TestSpeciesAt(TestSubstances):
+    def subject(self, index):
+        return species_at(index)
+
+    @args({"index": -1})
+    def test_with_negative_index(self):
+        self.assert_value_error()
+
+    @args({"index": 10**9})
+    def test_with_unknown_index(self):
+        self.assert_value_error()
+
+
+@add_to(species_test_suite)
+class TestSpeciesComposition(TestSubstances):
+    def subject(self, substance):
+        return species_composition(substance)
+
+    @args({"substance": TESTIUM})
+    def test_element(self):
+        self.assertResult({TESTIUM: 1})
+
+    @args({"substance": TS2_PY3})
+    def test_compound(self):
+        self.assertResult({TESTIUM: 2, PYTHONIUM: 3})
+
+
+@add_to(species_test_suite)
+class TestHillFormula(TestSubstances):
+    def subject(self, substance):
+        return hill_formula(substance)
+
+    @args({"substance": TESTIUM})
+    def test_element(self):
+        self.assertResult("Ts")
+
+    @args({"substance": TS2_PY3})
+    def test_alphabetical_without_carbon(self):
+        self.assertResult("Py3Ts2")
+
+    @args({"substance": ChemicalCompound(OXYGEN, HYDROGEN * 3, CARBON, HYDROGEN)})
+    def test_carbon_and_hydrogen_first(self):
+        self.assertResult("CH4O")
+
+    @args({"substance": ChemicalCompound(OXYGEN, HYDROGEN * 2)})
+    def test_hydrogen_is_alphabetical_without_carbon(self):
+        self.assertResult("H2O")
+
+    @args({"substance": ChemicalIon(ChemicalCompound(TESTIUM, PYTHONIUM3), -2)})
+    def test_ion(self):
+        self.assertResult("Py3Ts^2-")
+
+    @args({"substance": Electron()})
+    def test_electron(self):
+        self.assertResult("e^-")
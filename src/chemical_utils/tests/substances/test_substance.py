@@ -1,4 +1,6 @@
 from typing import Any
+from fractions import Fraction
+import pickle
 from unittest import TestSuite, TextTestRunner
 
 from unittest_extensions import args
@@ -6,6 +8,8 @@ from unittest_extensions import args
 from chemical_utils.substances.substance import (
     ChemicalElementTuple,
     ChemicalCompound,
+    ChemicalIon,
+    Electron,
     ChemicalReactionFactor,
     ChemicalReactionOperand,
 )
@@ -467,3 +471,138 @@ class TestChemicalReactionOperandIteration(TestSubstances):
     @args({"operand": op([f(TS_PY_AN)])})
     def test_with_compound(self):
         self.assertResultList([f(TS_PY_AN)])
+
+
+@add_to(substances_test_suite)
+class TestChemicalSubstanceFractionalRightMultiplication(TestSubstances):
+    produced_type = ChemicalReactionFactor
+
+    def subject(self, other):
+        return other * TESTIUM2
+
+    @args({"other": Fraction(1, 2)})
+    def test_with_fraction(self):
+        self.assert_result("1/2Ts2", type_check=True)
+
+    @args({"other": 0.5})
+    def test_with_float(self):
+        self.assert_result("1/2Ts2", type_check=True)
+        self.assertEqual(self.cachedResult().stoichiometric_coefficient, Fraction(1, 2))
+
+    @args({"other": Fraction(4, 2)})
+    def test_with_whole_fraction(self):
+        self.assert_result("2Ts2", type_check=True)
+        self.assertIsInstance(self.cachedResult().stoichiometric_coefficient, int)
+
+    @args({"other": Fraction(-1, 2)})
+    def test_with_negative_fraction(self):
+        self.assert_value_error()
+
+    @args({"other": float("inf")})
+    def test_with_infinity(self):
+        self.assert_value_error()
+
+    @args({"other": float("nan")})
+    def test_with_nan(self):
+        self.assert_value_error()
+
+    @args({"other": "1/2"})
+    def test_with_string(self):
+        self.assert_type_error()
+
+
+@add_to(substances_test_suite)
+class TestChemicalReactionFactorStoichiometricElements(TestSubstances):
+    def subject(self, factor):
+        return list(factor.stoichiometric_elements())
+
+    @args({"factor": f(TESTIUM2, 2)})
+    def test_with_integer_coefficient(self):
+        self.assertResultList([TESTIUM] * 4)
+
+    @args({"factor": f(TESTIUM2, Fraction(1, 2))})
+    def test_with_fractional_coefficient(self):
+        self.assert_value_error()
+
+
+@add_to(substances_test_suite)
+class TestChemicalIon(TestSubstances):
+    def subject(self, substance, charge):
+        return ChemicalIon(substance, charge)
+
+    @args({"substance": TESTIUM, "charge": 2})
+    def test_cation(self):
+        self.assert_result("Ts^2+")
+
+    @args({"substance": ChemicalCompound(TESTIUM, PYTHONIUM3), "charge": -1})
+    def test_anion(self):
+        self.assert_result("TsPy3^-")
+
+    @args({"substance": TESTIUM, "charge": -3})
+    def test_charge(self):
+        self.assertEqual(self.result().charge, -3)
+
+    @args({"substance": TS_PY_AN, "charge": 1})
+    def test_elements(self):
+        self.assertEqual(
+            list(self.result().elements()), [TESTIUM, PYTHONIUM, ANACONDIUM]
+        )
+
+    @args({"substance": TESTIUM2, "charge": 1})
+    def test_molecular_weight(self):
+        self.assertEqual(self.result().molecular_weight, TESTIUM2.molecular_weight)
+
+    @args({"substance": TESTIUM, "charge": 0})
+    def test_zero_charge(self):
+        self.assert_value_error()
+
+    @args({"substance": TESTIUM, "charge": 1.5})
+    def test_float_charge(self):
+        self.assert_type_error()
+
+    @args({"substance": ChemicalIon(TESTIUM, 1), "charge": 1})
+    def test_ion_of_ion(self):
+        self.assert_type_error()
+
+
+@add_to(substances_test_suite)
+class TestSubstanceCharge(TestSubstances):
+    def test_neutral_substances(self):
+        self.assertEqual([TESTIUM.charge, TESTIUM2.charge, TS_PY_AN.charge], [0, 0, 0])
+
+    def test_electron(self):
+        self.assertEqual(Electron().charge, -1)
+        self.assertEqual(list(Electron().elements()), [])
+        self.assertEqual(str(Electron()), "e^-")
+
+    def test_ion_in_operand(self):
+        self.assertEqual(str(ChemicalIon(TESTIUM, 1) + Electron()), "Ts^+ + e^-")
+
+
+@add_to(substances_test_suite)
+class TestCachedString(TestSubstances):
+    def test_compound_string_does_not_affect_equality(self):
+        compound = ChemicalCompound(TESTIUM, PYTHONIUM3)
+        self.assertEqual(repr(compound), "<ChemicalCompound: TsPy3>")
+        self.assertEqual(compound, ChemicalCompound(TESTIUM, PYTHONIUM3))
+        self.assertEqual(hash(compound), hash(ChemicalCompound(TESTIUM, PYTHONIUM3)))
+
+    def test_ion_string_is_reused(self):
+        ion = ChemicalIon(TESTIUM, 1)
+        self.assertIs(str(ion), str(ion))
+
+    def test_pickled_compound(self):
+        compound = ChemicalCompound(TESTIUM, PYTHONIUM3)
+        self.assertEqual(str(compound), "TsPy3")
+        unpickled = pickle.loads(pickle.dumps(compound))
+        self.assertEqual(unpickled, compound)
+        self.assertNotIn("_string", vars(unpickled))
+        self.assertEqual(str(unpickled), "TsPy3")
+
+    def test_pickled_ion(self):
+        ion = ChemicalIon(ChemicalCompound(TESTIUM, PYTHONIUM3), -1)
+        self.assertEqual(str(ion), "TsPy3^-")
+        unpickled = pickle.loads(pickle.dumps(ion))
+        self.assertNotIn("_string", vars(unpickled))
+        self.assertNotIn("_string", vars(unpickled.substance))
+        self.assertEqual(unpickled, ion)